@@ -0,0 +1,56 @@
+"""Evil-mode guess cost by family size.
+
+Builds word families of one length from a synthetic dictionary (random
+words with English letter frequencies) and times WordFamily.guess for the
+first guess of a word, the largest split, for common and rare letters.
+Compare the times with a 16.7 ms frame at 60 fps; family_for caps families
+at spellout_evil.FAMILY_LIMIT words.
+
+Run from the repository root:
+    python -m benchmarks.evil
+    python -m benchmarks.evil --sizes 1000 10000 50000 --length 8
+"""
+import argparse  # Import argparse for the command line
+import random  # Import random for the dictionary
+import statistics  # Import statistics for medians
+import time  # Import time for timing
+
+from benchmarks.solver import LETTER_WEIGHTS  # English letter frequencies
+from spellout_evil import FAMILY_LIMIT, WordFamily  # Adversarial word families
+from word_record import Word  # Word records
+
+FIRST_GUESSES = "ETAOSRQ"  # Common letters split the family most; Q barely does
+
+
+# Function to make a synthetic dictionary of one word length
+def make_words(count, length, rng):
+    letters = list(LETTER_WEIGHTS)
+    weights = list(LETTER_WEIGHTS.values())
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choices(letters, weights, k=length)))
+    return sorted(words)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark evil-mode guesses by family size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, FAMILY_LIMIT, 20000, 50000], help="family sizes")
+    parser.add_argument("--length", type=int, default=8, help="word length")
+    parser.add_argument("--repeats", type=int, default=5, help="timed guesses per letter and size")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = [Word(word, "") for word in make_words(max(args.sizes), args.length, rng)]
+
+    print(f"First guess on {args.length}-letter families (FAMILY_LIMIT = {FAMILY_LIMIT:,})")
+    print(f"{'words':>7} {'median ms':>10} {'max ms':>8}")
+    for size in args.sizes:
+        timings = []
+        for _ in range(args.repeats):
+            for letter in FIRST_GUESSES:
+                family = WordFamily(words[:size])
+                start = time.perf_counter()
+                family.guess(letter)
+                timings.append(time.perf_counter() - start)
+        print(f"{size:>7,} {statistics.median(timings) * 1000:>10.2f} {max(timings) * 1000:>8.2f}")
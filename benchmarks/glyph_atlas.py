@@ -0,0 +1,85 @@
+"""Letter drawing per frame: font rendering vs the glyph atlas.
+
+Draws what the game draws for its letters every frame (a word panel with
+every letter showing, plus the 26 keyboard labels) on an off-screen
+surface, once with font.render per letter as before and once blitting from
+GlyphAtlas, and prints the time per frame. Runs headless (SDL dummy video
+driver), so no window is opened.
+
+Run from the repository root:
+    python -m benchmarks.glyph_atlas
+    python -m benchmarks.glyph_atlas --frames 2000 --word "SPELLING BEE"
+"""
+import argparse  # Import argparse for the command line
+import os  # Import os to select the dummy video driver
+import time  # Import time for timing
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # Import pygame for fonts and surfaces
+
+from glyph_atlas import GlyphAtlas  # Pre-rendered letter glyphs
+from letter_masks import ALPHABET  # A-Z
+from word_record import Word  # Word records with precomputed features
+
+WIDTH, HEIGHT = 600, 450  # Game window size
+WHITE = (255, 255, 255)
+TIER_TEXT_COLORS = [(65, 120, 189), (12, 73, 116), (255, 145, 77)]  # TIER_COLORS[...]["tier_text"] in the game
+KEY_RECTS = [pygame.Rect(80 + 20 * row + 45 * i, 300 + 45 * row, 40, 40)
+             for row, keys in enumerate(("QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM")) for i in range(len(keys))]
+
+
+# Function to draw one frame's letters by rendering each one (the old way)
+def draw_rendered(screen, word, letter_font, key_font, color):
+    x_start = WIDTH // 2 - (word.display_length * 45) // 2
+    for column, letter in zip(word.columns, word.letters):
+        text_surface = letter_font.render(letter, True, color)
+        screen.blit(text_surface, text_surface.get_rect(center=(x_start + column * 45 + 20, 170)))
+    for letter, rect in zip(ALPHABET, KEY_RECTS):
+        text_surface = key_font.render(letter, True, WHITE)
+        screen.blit(text_surface, text_surface.get_rect(center=rect.center))
+
+# Function to draw one frame's letters from the glyph atlases
+def draw_atlas(screen, word, letter_glyphs, key_glyphs, color):
+    x_start = WIDTH // 2 - (word.display_length * 45) // 2
+    for column, letter in zip(word.columns, word.letters):
+        letter_glyphs.blit_centered(screen, letter, color, (x_start + column * 45 + 20, 170))
+    for letter, rect in zip(ALPHABET, KEY_RECTS):
+        key_glyphs.blit_centered(screen, letter, WHITE, rect.center)
+
+# Function to time a number of frames
+def time_frames(draw, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return (time.perf_counter() - start) / frames
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark letter drawing with and without the glyph atlas.")
+    parser.add_argument("--frames", type=int, default=1000, help="frames to draw per method")
+    parser.add_argument("--word", default="CROCODILE", help="word shown on the panel")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.Surface((WIDTH, HEIGHT))
+    letter_font = pygame.font.Font(None, 50)  # LETTER_FONT
+    key_font = pygame.font.Font(None, 30)  # BUTTON_FONT
+    word = Word(args.word.upper())
+    color = TIER_TEXT_COLORS[0]
+
+    start = time.perf_counter()
+    letter_glyphs = GlyphAtlas(letter_font, TIER_TEXT_COLORS)
+    key_glyphs = GlyphAtlas(key_font, [WHITE])
+    build_time = time.perf_counter() - start
+
+    rendered = time_frames(lambda: draw_rendered(screen, word, letter_font, key_font, color), args.frames)
+    atlas = time_frames(lambda: draw_atlas(screen, word, letter_glyphs, key_glyphs, color), args.frames)
+
+    letters = word.display_length + len(KEY_RECTS)
+    print(f"Atlas: {len(letter_glyphs) + len(key_glyphs)} glyphs built in {build_time * 1000:.2f} ms")
+    print(f"{letters} letters per frame, {args.frames:,} frames")
+    print(f"font.render per letter  {rendered * 1000:8.3f} ms/frame")
+    print(f"glyph atlas             {atlas * 1000:8.3f} ms/frame   ({rendered / atlas:.1f}x faster)")
+    pygame.quit()
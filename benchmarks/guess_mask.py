@@ -0,0 +1,46 @@
+"""Per-guess cost: set of guessed letters vs 26-bit letter mask.
+
+Run from the repository root:
+    python -m benchmarks.guess_mask
+"""
+import timeit  # Import timeit for timing
+
+from letter_masks import LETTER_BITS, letter_mask, is_covered  # 26-bit letter masks
+
+WORD = "ENLIGHTENMENT"
+GUESSES = "ETNLIGHMXZ"  # Mix of hits and misses
+ROUNDS = 20000
+
+
+# The old per-guess work in play_spellout: already-guessed test, add, win check, copy for animation
+def guess_with_set():
+    guessed_letters = set()
+    for letter in GUESSES:
+        if letter in guessed_letters:
+            continue
+        guessed_letters.add(letter)
+        if letter in WORD:
+            if all(l in guessed_letters for l in WORD):
+                break
+        current_guessed_letters = guessed_letters.copy()
+
+# The same work with letter masks
+def guess_with_mask():
+    word_mask = letter_mask(WORD)
+    guessed_letters = 0
+    for letter in GUESSES:
+        bit = LETTER_BITS[letter]
+        if guessed_letters & bit:
+            continue
+        guessed_letters |= bit
+        if word_mask & bit:
+            if is_covered(word_mask, guessed_letters):
+                break
+        current_guessed_letters = guessed_letters
+
+
+if __name__ == "__main__":
+    per_round = len(GUESSES)
+    for name, func in [("set", guess_with_set), ("mask", guess_with_mask)]:
+        best = min(timeit.repeat(func, number=ROUNDS, repeat=5))
+        print(f"{name:>5}: {best / (ROUNDS * per_round) * 1e9:7.1f} ns per guess")
@@ -0,0 +1,82 @@
+"""Solver suggestion cost per guess on a large dictionary.
+
+Builds a CandidateIndex over a synthetic dictionary (random words with
+English letter frequencies), then plays hidden words with the engine's
+"solver" strategy and times every call, grouped by guess number. The first
+guess of a word is a lookup; later guesses narrow the previous candidates.
+
+Run from the repository root:
+    python -m benchmarks.solver
+    python -m benchmarks.solver --words 500000 --games 200
+"""
+import argparse  # Import argparse for the command line
+import random  # Import random for the dictionary and targets
+import statistics  # Import statistics for medians
+import time  # Import time for timing
+
+import spellout_solver as solver  # Candidate-filtering solver
+from letter_masks import LETTER_BITS, letter_mask, is_covered  # 26-bit letter masks
+from spellout_engine import MAX_ATTEMPTS, reveal_pattern  # Game rules
+
+# Rough English letter frequencies (percent), for words that filter like real ones
+LETTER_WEIGHTS = {
+    "E": 12.7, "T": 9.1, "A": 8.2, "O": 7.5, "I": 7.0, "N": 6.7, "S": 6.3, "H": 6.1, "R": 6.0,
+    "D": 4.3, "L": 4.0, "C": 2.8, "U": 2.8, "M": 2.4, "W": 2.4, "F": 2.2, "G": 2.0, "Y": 2.0,
+    "P": 1.9, "B": 1.5, "V": 1.0, "K": 0.8, "J": 0.2, "X": 0.2, "Q": 0.1, "Z": 0.1,
+}
+
+
+# Function to make a synthetic dictionary
+def make_words(count, rng):
+    letters = list(LETTER_WEIGHTS)
+    weights = list(LETTER_WEIGHTS.values())
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choices(letters, weights, k=rng.randint(4, 12))))
+    return sorted(words)
+
+# Function to play one word with a strategy, timing each call
+def play_timed(word, strategy, rng, timings):
+    word_mask = letter_mask(word)
+    guessed_letters = 0
+    attempts = MAX_ATTEMPTS
+    guess = 0
+    while True:
+        pattern = reveal_pattern(word, guessed_letters)
+        start = time.perf_counter()
+        letter = strategy(pattern, guessed_letters, rng)
+        timings.setdefault(guess, []).append(time.perf_counter() - start)
+        guess += 1
+        guessed_letters |= LETTER_BITS[letter]
+        if not word_mask & LETTER_BITS[letter]:
+            attempts -= 1
+            if attempts == 0:
+                return
+        elif is_covered(word_mask, guessed_letters):
+            return
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark solver suggestions on a large dictionary.")
+    parser.add_argument("--words", type=int, default=500000, help="dictionary size")
+    parser.add_argument("--games", type=int, default=200, help="hidden words to play")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = make_words(args.words, rng)
+    start = time.perf_counter()
+    solver._default_index = solver.CandidateIndex(words)
+    print(f"Index over {len(words):,} words built in {time.perf_counter() - start:.2f} s")
+
+    timings = {}
+    strategy = solver.solver_strategy
+    for word in rng.sample(words, args.games):
+        play_timed(word, strategy, rng, timings)
+
+    all_calls = [t for calls in timings.values() for t in calls]
+    print(f"{args.games} words, {len(all_calls)} suggestions")
+    print(f"{'guess':>5} {'calls':>6} {'median ms':>10} {'max ms':>8}")
+    for guess, calls in sorted(timings.items()):
+        print(f"{guess + 1:>5} {len(calls):>6} {statistics.median(calls) * 1000:>10.3f} {max(calls) * 1000:>8.2f}")
+    print(f"  all {len(all_calls):>6} {statistics.median(all_calls) * 1000:>10.3f} {max(all_calls) * 1000:>8.2f}")
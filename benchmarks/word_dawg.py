@@ -0,0 +1,92 @@
+"""Word graph (DAWG) vs linear scan: size, load time and query time.
+
+The dictionary is the built-in words plus synthetic words made of common
+English syllables, so prefixes and suffixes are shared the way they are in
+real word lists.
+
+Run from the repository root:
+    python -m benchmarks.word_dawg
+    python -m benchmarks.word_dawg --words 1000000
+"""
+import argparse  # Import argparse for the command line
+import os  # Import os for file handling
+import random  # Import random for synthetic words
+import re  # Import re for the linear-scan baseline
+import sys  # Import sys for object sizes
+import tempfile  # Import tempfile for the saved graph
+import time  # Import time for timing
+
+from letter_masks import ALPHABET, letter_mask, has_letter  # 26-bit letter masks
+from spellout_solver import default_words  # Built-in words
+from word_dawg import WordDawg  # Compressed word graph
+
+SYLLABLES = ["RE", "IN", "CON", "DE", "PRO", "COM", "TER", "MENT", "TION", "ING", "ER", "AN", "AL", "OR",
+             "ST", "EN", "ED", "ES", "AT", "ON", "LY", "NESS", "ABLE", "PRE", "UN", "OVER", "TRANS", "SUB"]
+PATTERNS = ["_A__E", "C______", "___ING", "PRE_____", "_O_E_"]
+PREFIXES = ["PRE", "TRANSCON", "UNDER"]
+
+
+# Function to make syllable-based words
+def synthetic_words(count, rng):
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))))
+    return list(words)
+
+# Function to match a pattern by checking every word (baseline)
+def scan_match(words, pattern, excluded):
+    hidden = "[" + "".join(letter for letter in ALPHABET if not has_letter(excluded, letter)) + "]"
+    regex = re.compile("".join(hidden if char == "_" else re.escape(char) for char in pattern) + r"\Z")
+    return [word for word in words if len(word) == len(pattern) and regex.match(word)]
+
+# Function to time a callable
+def best_time(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the word graph against a linear scan.")
+    parser.add_argument("--words", type=int, default=200000, help="synthetic words to add")
+    args = parser.parse_args()
+
+    words = sorted({word.upper() for word in default_words()} | set(synthetic_words(args.words, random.Random(0))))
+    word_set = set(words)
+
+    start = time.perf_counter()
+    dawg = WordDawg.build(words)
+    build_time = time.perf_counter() - start
+
+    path = os.path.join(tempfile.mkdtemp(), "words.dawg")
+    dawg.save(path)
+    load_time = best_time(lambda: WordDawg.load(path))
+    set_size = sys.getsizeof(word_set) + sum(sys.getsizeof(word) for word in words)
+
+    print(f"{len(words):,} words, built in {build_time:.2f}s")
+    print(f"Size:  DAWG {dawg.nbytes / 1e6:8.2f} MB   Python set {set_size / 1e6:8.2f} MB")
+    print(f"Load:  DAWG file {load_time * 1000:8.2f} ms")
+
+    print("\nQuery                 matches    DAWG ms    scan ms")
+    for pattern in PATTERNS:
+        excluded = letter_mask(pattern)
+        found = list(dawg.match(pattern, excluded))
+        assert sorted(found) == scan_match(words, pattern, excluded)
+        dawg_time = best_time(lambda: list(dawg.match(pattern, excluded)))
+        scan_time = best_time(lambda: scan_match(words, pattern, excluded))
+        print(f"match {pattern:<15} {len(found):>7,}   {dawg_time * 1000:8.2f}   {scan_time * 1000:8.2f}")
+
+    for prefix in PREFIXES:
+        found = list(dawg.words(prefix))
+        dawg_time = best_time(lambda: list(dawg.words(prefix)))
+        scan_time = best_time(lambda: [word for word in words if word.startswith(prefix)])
+        print(f"prefix {prefix:<14} {len(found):>7,}   {dawg_time * 1000:8.2f}   {scan_time * 1000:8.2f}")
+
+    probes = words[::max(1, len(words) // 1000)]
+    dawg_time = best_time(lambda: [word in dawg for word in probes])
+    scan_time = best_time(lambda: [word in word_set for word in probes])
+    print(f"membership x{len(probes):<9,}          {dawg_time * 1000:8.2f}   {scan_time * 1000:8.2f} (set)")
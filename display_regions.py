@@ -0,0 +1,72 @@
+"""Dirty-rectangle display updates for the Spellout game.
+
+pygame.display.flip() pushes every pixel of the window, every frame, even
+when only a button's hover color or the timer bar changed. DirtyRegions
+collects the rectangles the draw functions report as changed and pushes
+only those with pygame.display.update(rects). Every screen loop names the
+view it is showing each frame (enter()); when the view changes (another
+screen, a new level or word) the next update is a full flip, so each
+screen transition is pushed whole once and then only its changes follow.
+"""
+import pygame  # Import pygame for rects and display updates
+
+
+class DirtyRegions:
+    """Screen rectangles changed since the last display update."""
+
+    def __init__(self, screen_rect, full_share=0.5):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.full_area = self.screen_rect.width * self.screen_rect.height * full_share  # Above this a flip is cheaper
+        self.view = None  # What the screen shows (see enter)
+        self.full = True  # Next update pushes the whole screen
+        self.rects = []
+        self.full_updates = 0
+        self.partial_updates = 0
+        self.pixels = 0  # Pixels pushed to the display
+
+    def enter(self, view):
+        """Call every frame with what the screen shows; a different view is pushed whole."""
+        if view != self.view:
+            self.view = view
+            self.full = True
+
+    def invalidate(self):
+        """Push the whole screen on the next update."""
+        self.full = True
+
+    def add(self, rect):
+        if rect is not None and not self.full:
+            self.rects.append(pygame.Rect(rect))
+
+    def extend(self, rects):
+        for rect in rects:
+            self.add(rect)
+
+    def _merged(self):
+        """The reported rects clipped to the screen, with overlapping ones joined."""
+        merged = []
+        for rect in self.rects:
+            rect = rect.clip(self.screen_rect)
+            if not rect.width or not rect.height:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def flush(self):
+        """Push what changed to the display: a flip after a view change, otherwise only the dirty rects."""
+        rects = [] if self.full else self._merged()
+        self.rects = []
+        area = sum(rect.width * rect.height for rect in rects)
+        if self.full or area > self.full_area:
+            self.full = False
+            self.full_updates += 1
+            self.pixels += self.screen_rect.width * self.screen_rect.height
+            pygame.display.flip()
+        elif rects:
+            self.partial_updates += 1
+            self.pixels += area
+            pygame.display.update(rects)
@@ -0,0 +1,38 @@
+"""Shared fonts for the Spellout game and its variants.
+
+Creating a pygame font opens and parses the font file. The game used to do
+that inside its screens, some of them every frame (the attempt X marks,
+the player-name labels) and the rest on every visit (pause menu, tier
+completion, leaderboard). The registry creates each (face, size) once and
+hands the same Font object to every caller, so no font is loaded in a
+frame loop.
+
+Fonts are shared: do not change their style (set_bold and the like) after
+getting one.
+"""
+import pygame  # Import pygame for fonts
+
+_fonts = {}  # ("file" or "sys", face, size) -> Font
+
+
+# Function to get the shared font for a font file (None for pygame's default font)
+def get_font(size, face=None):
+    """Like pygame.font.Font(face, size), created once per (face, size)."""
+    key = ("file", face, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(face, size)
+    return font
+
+# Function to get the shared font for a system font name
+def get_sys_font(size, name=None):
+    """Like pygame.font.SysFont(name, size), created once per (name, size)."""
+    key = ("sys", name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.SysFont(name, size)
+    return font
+
+# Function to count the fonts created so far
+def font_count():
+    return len(_fonts)
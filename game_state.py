@@ -0,0 +1,66 @@
+"""Session state of one Spellout game.
+
+Everything that changes while a game is played (level, attempts, guessed
+letters, the word on screen, the word samplers, the timed-mode clock...)
+lives in one GameState instead of module globals, so the draw functions
+and the guess handler work on whichever session they are given and one
+process can run any number of independent games (bots, simulations, a
+server front end). The slots keep each session small and fixed in size.
+"""
+import time  # Import time for the timed-mode clock
+
+from spellout_engine import MAX_ATTEMPTS  # Attempt limit
+
+
+class GameState:
+    """One player's game session."""
+
+    __slots__ = (
+        "player_uid", "seen_words", "game_mode", "selected_difficulty",
+        "game_started", "game_over", "level_completed", "difficulty_selected",
+        "level", "attempts", "guessed_letters", "selected_word", "word_samplers", "evil_family",
+        "start_time", "word_start_time", "is_paused", "pause_start_time", "total_pause_time",
+        "correct_words", "total_time_bonus",
+        "__weakref__",  # Sessions are tracked weakly per tier (spellout_engine.release_passed_tiers)
+    )
+
+    def __init__(self, player_uid=None, seen_words=None):
+        self.player_uid = player_uid  # Player of this game
+        self.seen_words = seen_words  # Recently seen words of the player
+        self.game_mode = None  # Game mode (classic, timed or evil); None until the player picks one
+        self.selected_difficulty = ""  # Tier of the level being played
+        self.game_started = False
+        self.game_over = False
+        self.level_completed = False  # All levels done
+        self.difficulty_selected = True  # No manual difficulty selection needed
+        self.word_samplers = {}  # No-repeat word sampler per tier, created on first use
+        self.new_game()
+
+    def new_game(self):
+        """Back to level 1; player, mode and word samplers stay, so a replay does not repeat words."""
+        self.level = 1
+        self.attempts = MAX_ATTEMPTS
+        self.guessed_letters = 0  # Bitmask of guessed letters (bit 0 = A)
+        self.selected_word = None  # Word record to guess
+        self.evil_family = None  # Words still possible in evil mode
+        self.start_time = time.time()  # Start of the game
+        self.word_start_time = self.start_time  # Start of the current word
+        self.is_paused = False
+        self.pause_start_time = 0
+        self.total_pause_time = 0  # Time spent paused
+        self.correct_words = 0  # Words guessed in timed mode
+        self.total_time_bonus = 0
+
+    def pause(self):
+        self.is_paused = True
+        self.pause_start_time = time.time()
+
+    def resume(self):
+        if self.is_paused:
+            self.is_paused = False
+            self.total_pause_time += time.time() - self.pause_start_time
+
+    def word_elapsed(self):
+        """Seconds spent on the current word, not counting pauses."""
+        now = self.pause_start_time if self.is_paused else time.time()
+        return now - self.word_start_time - self.total_pause_time
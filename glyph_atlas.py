@@ -0,0 +1,55 @@
+"""Pre-rendered letter glyphs for the Spellout game.
+
+Rendering text is the most expensive thing the game does per frame, and
+the word panel and the keyboard only ever show single letters in a handful
+of colors. A GlyphAtlas renders A-Z once per (font, color) and hands out the
+ready surfaces, so drawing a letter is a dict lookup and a blit. Other
+characters (from word packs) are rendered the first time they are asked for
+and kept as well.
+"""
+from letter_masks import ALPHABET  # A-Z
+
+
+class GlyphAtlas:
+    """The letters of one font, rendered once per color."""
+
+    def __init__(self, font, colors=(), letters=ALPHABET, antialias=True):
+        self.font = font
+        self.letters = letters
+        self.antialias = antialias
+        self._glyphs = {}  # Color -> {letter: (surface, half width, half height)}
+        for color in colors:
+            self.add_color(color)
+
+    def _render(self, letter, color):
+        surface = self.font.render(letter, self.antialias, color)
+        width, height = surface.get_size()
+        return surface, width // 2, height // 2
+
+    def add_color(self, color):
+        """Render every letter in `color` (if not done yet) and return the color's glyphs."""
+        color = tuple(color)
+        glyphs = self._glyphs.get(color)
+        if glyphs is None:
+            glyphs = self._glyphs[color] = {letter: self._render(letter, color) for letter in self.letters}
+        return glyphs
+
+    def _entry(self, letter, color):
+        glyphs = self._glyphs.get(color) or self.add_color(color)
+        entry = glyphs.get(letter)
+        if entry is None:
+            entry = glyphs[letter] = self._render(letter, color)
+        return entry
+
+    def glyph(self, letter, color):
+        """The rendered surface for a letter."""
+        return self._entry(letter, color)[0]
+
+    def blit_centered(self, target, letter, color, center):
+        """Blit a letter centered on `center` (like get_rect(center=...)) and return the rect drawn."""
+        surface, half_width, half_height = self._entry(letter, color)
+        return target.blit(surface, (center[0] - half_width, center[1] - half_height))
+
+    def __len__(self):
+        """Glyphs rendered so far."""
+        return sum(len(glyphs) for glyphs in self._glyphs.values())
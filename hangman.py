@@ -1,4 +1,5 @@
 import random
+from letter_masks import LETTER_BITS, letter_mask, is_covered  # 26-bit letter masks
 
 # List of words
 words = ["python", "developer", "hangman", "programming", "interactive", "challenge"]
@@ -9,13 +10,13 @@ def get_word():
 
 # Function to display the word with guessed letters
 def display_word(word, guessed_letters):
-    return " ".join([letter if letter in guessed_letters else "_" for letter in word])
+    return " ".join([letter if guessed_letters & LETTER_BITS[letter] else "_" for letter in word])
 
 # Main function
 def play_hangman():
     while True:  # Loop to allow replaying the game
         word = get_word()
-        guessed_letters = set()
+        guessed_letters = 0  # Bitmask of guessed letters
         attempts = 6  # Number of wrong guesses allowed
 
         print("\nWelcome to Hangman! Try to guess the word.")
@@ -25,19 +26,19 @@ def play_hangman():
             print(f"Attempts left: {attempts}")
             guess = input("Guess a letter: ").lower()
 
-            if len(guess) != 1 or not guess.isalpha():
+            if guess not in LETTER_BITS:  # Single A-Z letter only
                 print("Invalid input. Please enter a single letter.")
                 continue
 
-            if guess in guessed_letters:
+            if guessed_letters & LETTER_BITS[guess]:
                 print("You already guessed that letter.")
                 continue
 
-            guessed_letters.add(guess)
+            guessed_letters |= LETTER_BITS[guess]
 
             if guess in word:
                 print("Correct!")
-                if all(letter in guessed_letters for letter in word):
+                if is_covered(letter_mask(word), guessed_letters):
                     print(f"You won! The word was: {word}")
                     break
             else:
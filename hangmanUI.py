@@ -1,5 +1,6 @@
 import pygame  # Import pygame for UI
 import random  # Import random for word selection
+from font_registry import get_font  # Fonts created once per face and size
 
 # Initialize Pygame
 pygame.init()
@@ -15,9 +16,9 @@ ORANGE = (251, 179, 22)
 RECT_COLOR = (12, 192, 223)  # Rectangle color for letters (#0cc0df)
 
 # Fonts
-FONT = pygame.font.Font(None, 40)  # Font for word display
-BUTTON_FONT = pygame.font.Font(None, 30)  # Font for virtual keyboard
-LETTER_FONT = pygame.font.Font(None, 50)  # Font for letter display
+FONT = get_font(40)  # Font for word display
+BUTTON_FONT = get_font(30)  # Font for virtual keyboard
+LETTER_FONT = get_font(50)  # Font for letter display
 
 # 🖥️ Create screen
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -85,7 +86,7 @@ def draw_attempts(attempts):
     spacing = width + 15  # 📏 Adjusted spacing between rectangles
 
     # 🎨 Define X mark font
-    X_FONT = pygame.font.Font(None, 45)  # Slightly larger X
+    X_FONT = get_font(45)  # Slightly larger X
 
     # 🔄 Loop through 4 attempt slots
     for i in range(4):
@@ -1,5 +1,6 @@
 import pygame  # Import pygame for UI
 import random  # Import random for word selection
+from font_registry import get_font  # Fonts created once per face and size
 
 # Initialize Pygame
 pygame.init()
@@ -21,9 +22,9 @@ MEDIUM_COLOR = (251, 179, 22)  # Orange (#fbb316)
 HARD_COLOR = (222, 52, 52)  # Red (#de3434)
 
 # Fonts
-FONT = pygame.font.Font(None, 40)  # Font for word display
-BUTTON_FONT = pygame.font.Font(None, 30)  # Font for virtual keyboard
-LETTER_FONT = pygame.font.Font(None, 50)  # Font for letter display
+FONT = get_font(40)  # Font for word display
+BUTTON_FONT = get_font(30)  # Font for virtual keyboard
+LETTER_FONT = get_font(50)  # Font for letter display
 
 # 🖥️ Create screen
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -74,7 +75,7 @@ def draw_game_controls():
         return None  # No button needed mid-game
     
     # 📝 Draw text indicator above the button
-    font = pygame.font.Font(None, 30)
+    font = get_font(30)
     text_surface = font.render(text, True, text_color)
     text_rect = text_surface.get_rect(center=(WIDTH // 2, button_y - 30))  # Centered above button
     screen.blit(text_surface, text_rect)
@@ -107,7 +108,7 @@ def draw_difficulty_buttons():
     colors = [EASY_COLOR, NORMAL_COLOR, MEDIUM_COLOR, HARD_COLOR]
     button_rects = {}
 
-    title_font = pygame.font.Font(None, 35)
+    title_font = get_font(35)
     title_text = title_font.render("CHOOSE DIFFICULTY", True, BLACK)
     screen.blit(title_text, (WIDTH // 2 - 100, y_start - 50))
 
@@ -225,7 +226,7 @@ def draw_attempts(attempts):
     spacing = width + 5  # 📏 Adjusted spacing between rectangles
 
     # 🎨 Define X mark font
-    X_FONT = pygame.font.Font(None, 45)  # Slightly larger X
+    X_FONT = get_font(45)  # Slightly larger X
 
     # 🔄 Loop through 4 attempt slots
     for i in range(4):
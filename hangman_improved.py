@@ -1,6 +1,8 @@
 import pygame  # Import pygame for UI
 import random  # Import random for word selection
 import sys
+from letter_masks import LETTER_BITS, letter_mask, is_covered  # 26-bit letter masks
+from font_registry import get_font, get_sys_font  # Fonts created once per face and size
 
 # Initialize Pygame
 pygame.init()
@@ -22,10 +24,10 @@ MEDIUM_COLOR = (251, 179, 22)  # Orange (#fbb316)
 HARD_COLOR = (222, 52, 52)  # Red (#de3434)
 
 # Fonts
-FONT = pygame.font.Font(None, 40)  # Font for word display
-BUTTON_FONT = pygame.font.Font(None, 30)  # Font for virtual keyboard
-LETTER_FONT = pygame.font.Font(None, 50)  # Font for letter display
-CATEGORY_FONT = pygame.font.SysFont(None, 28)  # Smaller size than LETTER_FONT
+FONT = get_font(40)  # Font for word display
+BUTTON_FONT = get_font(30)  # Font for virtual keyboard
+LETTER_FONT = get_font(50)  # Font for letter display
+CATEGORY_FONT = get_sys_font(28)  # Smaller size than LETTER_FONT
 
 # 🖥️ Create screen
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -54,7 +56,7 @@ level_completed = False # Level completion state
 difficulty_selected = False # Difficulty state
 level = 0 # Current level
 attempts = 4 # Number of attempts
-guessed_letters = set() # Set to store guessed letters
+guessed_letters = 0 # Bitmask of guessed letters (bit 0 = A)
 selected_word = "" # Word to guess
 selected_difficulty = "" # Selected difficulty
 
@@ -93,7 +95,7 @@ def draw_game_controls():
         return None, None  # No button needed mid-game
     
     # 📝 Draw text indicator above the button
-    font = pygame.font.Font(None, 30)
+    font = get_font(30)
     text_surface = font.render(text, True, text_color)
     text_rect = text_surface.get_rect(center=(WIDTH // 2, button_y - 30))  # Centered above button
     screen.blit(text_surface, text_rect)
@@ -140,7 +142,7 @@ def draw_difficulty_buttons():
     colors = [EASY_COLOR, NORMAL_COLOR, MEDIUM_COLOR, HARD_COLOR]
     button_rects = {}
 
-    title_font = pygame.font.Font(None, 35)
+    title_font = get_font(35)
     title_text = title_font.render("CHOOSE DIFFICULTY", True, BLACK)
     screen.blit(title_text, (WIDTH // 2 - 100, y_start - 50))
 
@@ -177,7 +179,7 @@ def handle_button_click(pos):
         game_over = False
         attempts = 4
         level = 1 if level >= 10 else level + 1  # Reset after 10 levels
-        guessed_letters.clear()
+        guessed_letters = 0
         difficulty_selected = False  # Reset difficulty selection on a new game
         return  # Exit to avoid checking difficulty buttons immediately
 
@@ -211,7 +213,7 @@ def draw_word(selected_word, guessed_letters):
         rect_x = x_start + i * (cell_size + 5)
         pygame.draw.rect(screen, RECT_COLOR, (rect_x, y_start, cell_size, cell_size), border_radius=5)
 
-        if letter in guessed_letters:
+        if guessed_letters & LETTER_BITS[letter]:
             text_surface = LETTER_FONT.render(letter, True, WHITE)
             text_rect = text_surface.get_rect(center=(rect_x + cell_size // 2, y_start + cell_size // 2))
             screen.blit(text_surface, text_rect)
@@ -246,7 +248,7 @@ def draw_virtual_keyboard(keys, guessed_letters):
         return # Draw the keyboard only if the game is active
     
     for letter, rect in keys.items():
-        color = GRAY if letter in guessed_letters else BLUE  # Change color when guessed
+        color = GRAY if guessed_letters & LETTER_BITS[letter] else BLUE  # Change color when guessed
         pygame.draw.rect(screen, color, rect, border_radius=5)  # Draw key
         text_surface = BUTTON_FONT.render(letter, True, BLACK)  # Render letter (always white)
         screen.blit(text_surface, (rect.x + 10, rect.y + 5))  # Position text at center
@@ -265,7 +267,7 @@ def draw_attempts(attempts):
     spacing = width + 5  # 📏 Adjusted spacing between rectangles
 
     # 🎨 Define X mark font
-    X_FONT = pygame.font.Font(None, 45)  # Slightly larger X
+    X_FONT = get_font(45)  # Slightly larger X
 
     # 🔄 Loop through 4 attempt slots
     for i in range(4):
@@ -317,7 +319,7 @@ def play_hangman():
     global game_started, game_over, level_completed, difficulty_selected, selected_difficulty, selected_word
     
     level = 0  # Start at level 1
-    guessed_letters = set()  # Store guessed letters
+    guessed_letters = 0  # Bitmask of guessed letters
     attempts = 4  # Maximum incorrect guesses
     keys = create_virtual_keyboard()  # Generate virtual keyboard
     running = True  # Control game loop
@@ -361,7 +363,7 @@ def play_hangman():
                         game_over = False
                         level = 0  # Reset level when restarting the game
                         difficulty_selected = False  # Reset difficulty
-                        guessed_letters.clear()
+                        guessed_letters = 0
                         attempts = 4
                         selected_word = get_word(selected_difficulty)  # New word after Play Again
                     elif quit_button_rect.collidepoint(mouse_pos):  # Quit button clicked
@@ -375,7 +377,7 @@ def play_hangman():
                     if main_button_rect.collidepoint(mouse_pos):  # Play Again button clicked
                         level_completed = False  # Reset level completion
                         level = 0  # Reset level when restarting the game
-                        guessed_letters.clear()
+                        guessed_letters = 0
                         attempts = 4
                         selected_word = get_word(selected_difficulty)  # New word after Play Again
                     elif quit_button_rect.collidepoint(mouse_pos):  # Quit button clicked
@@ -387,16 +389,16 @@ def play_hangman():
                 elif not game_over:  # Handle in-game clicks
                     for letter, rect in keys.items():
                         if rect.collidepoint(mouse_pos):
-                            if letter not in guessed_letters:
-                                guessed_letters.add(letter)
+                            if not guessed_letters & LETTER_BITS[letter]:
+                                guessed_letters |= LETTER_BITS[letter]
                                 if letter in selected_word:
                                     correct_sound.play()
 
-                                    if all(l in guessed_letters for l in selected_word):
+                                    if is_covered(letter_mask(selected_word), guessed_letters):
                                         show_word_flash(screen, selected_word, (0, 255, 0), FONT)  # Show word flash in green
                                         pygame.time.delay(500)  # Small delay before switching
                                         level += 1  # Move to the next level only after winning
-                                        guessed_letters.clear()  # Reset guessed letters
+                                        guessed_letters = 0  # Reset guessed letters
                                         attempts = 4  # Reset attempts
                                         selected_word = get_word(selected_difficulty)
                                         
@@ -413,8 +415,8 @@ def play_hangman():
 
             elif event.type == pygame.KEYDOWN:
                 guess = event.unicode.upper()
-                if guess in keys and guess not in guessed_letters:
-                    guessed_letters.add(guess)
+                if guess in keys and not guessed_letters & LETTER_BITS[guess]:
+                    guessed_letters |= LETTER_BITS[guess]
                     if guess in selected_word:
                         correct_sound.play()
                     else:
@@ -422,13 +424,13 @@ def play_hangman():
                         wrong_sound.play()
 
             # 🏆 Check win condition
-            if difficulty_selected and not game_over and all(letter in guessed_letters for letter in selected_word):
+            if difficulty_selected and not game_over and is_covered(letter_mask(selected_word), guessed_letters):
                 show_word_flash(screen, selected_word, (0, 255, 0), FONT)
                 pygame.time.delay(500)
                 if level < 10:
                     level += 1  
                     selected_word = get_word(selected_difficulty)  # Get new word
-                    guessed_letters.clear()  
+                    guessed_letters = 0  
                     attempts = 4  
                 else:
                     level_completed = True
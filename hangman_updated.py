@@ -6,6 +6,8 @@ import os  # Import os for file handling
 import time  # Import time for delays
 from datetime import datetime  # Import datetime for timestamping
 from PIL import Image, ImageSequence  # Import Image for GIF handling
+from word_sampler import WordSampler  # No-repeat word order
+from font_registry import get_font, get_sys_font  # Fonts created once per face and size
 
 # Initialize Pygame
 pygame.init()
@@ -27,11 +29,11 @@ MEDIUM_COLOR = (251, 179, 22)  # Orange (#fbb316)
 HARD_COLOR = (222, 52, 52)  # Red (#de3434)
 
 # Fonts
-FONT = pygame.font.Font(None, 40)  # Font for word display
-BUTTON_FONT = pygame.font.Font(None, 30)  # Font for virtual keyboard
-LETTER_FONT = pygame.font.Font(None, 50)  # Font for letter display
-CATEGORY_FONT = pygame.font.SysFont(None, 28)  # Smaller size than LETTER_FONT
-CLUE_FONT = pygame.font.SysFont(None, 15)  # Smaller font size for the clue
+FONT = get_font(40)  # Font for word display
+BUTTON_FONT = get_font(30)  # Font for virtual keyboard
+LETTER_FONT = get_font(50)  # Font for letter display
+CATEGORY_FONT = get_sys_font(28)  # Smaller size than LETTER_FONT
+CLUE_FONT = get_sys_font(15)  # Smaller font size for the clue
 
 # Constants
 max_width, max_height = WIDTH, HEIGHT
@@ -114,7 +116,7 @@ attempts = 4 # Number of attempts
 guessed_letters = set() # Set to store guessed letters
 selected_word = "" # Word to guess
 selected_difficulty = "" # Selected difficulty
-shuffled_words = []  # List of non-repeating words per game
+word_sampler = None  # No-repeat word sampler for the selected difficulty
 
 # Load Sounds
 correct_sound = pygame.mixer.Sound("assets/sounds/correct.mp3")
@@ -229,14 +231,14 @@ def uid_screen():
 
     uid_input = ""
     input_active = False
-    font = pygame.font.Font(None, 40)
+    font = get_font(40)
     input_box = pygame.Rect(WIDTH // 2 - 150, HEIGHT // 2 + 10, 300, 50)
     color_inactive = pygame.Color('lightskyblue3')
     color_active = pygame.Color('dodgerblue2')
     color = color_inactive
 
     # Random name button
-    button_font = pygame.font.Font(None, 32)
+    button_font = get_font(32)
     random_button = pygame.Rect(WIDTH // 2 - 75, HEIGHT // 2 + 85, 150, 40)
 
     while running:
@@ -271,7 +273,7 @@ def uid_screen():
         frame_index = (frame_index + 1) % total_frames
 
         # 🖊️ Draw label above input box
-        label_font = pygame.font.Font(None, 25)
+        label_font = get_font(25)
         label_surface = label_font.render("Enter player name", True, GRAY)
         label_rect = label_surface.get_rect(center=(WIDTH // 2, input_box.y - 20))
         screen.blit(label_surface, label_rect)
@@ -337,7 +339,7 @@ def draw_game_controls():
         return None, None  # No button needed mid-game
     
     # 📝 Draw text indicator above the button
-    font = pygame.font.Font(None, 30)
+    font = get_font(30)
     text_surface = font.render(text, True, text_color)
     text_rect = text_surface.get_rect(center=(WIDTH // 2, button_y - 30))  # Centered above button
     screen.blit(text_surface, text_rect)
@@ -384,7 +386,7 @@ def draw_difficulty_buttons():
     colors = [EASY_COLOR, NORMAL_COLOR, MEDIUM_COLOR, HARD_COLOR]
     button_rects = {}
 
-    title_font = pygame.font.Font(None, 35)
+    title_font = get_font(35)
     title_text = title_font.render("CHOOSE DIFFICULTY", True, BLACK)
     screen.blit(title_text, (WIDTH // 2 - 100, y_start - 50))
 
@@ -403,18 +405,18 @@ def draw_difficulty_buttons():
 
 # Function to get a random word based on difficulty
 def get_word(difficulty):
-    global shuffled_words
+    global word_sampler
 
-    if not shuffled_words:
-        shuffled_words = words_by_difficulty[difficulty][:]
-        random.shuffle(shuffled_words)
+    words = words_by_difficulty[difficulty]
+    if word_sampler is None or word_sampler.size != len(words):
+        word_sampler = WordSampler(len(words), random.getrandbits(64))
 
-    return shuffled_words.pop() ## Get a word from the shuffled list
+    return words[word_sampler.next()] ## Get the next word in the sampler's order
 
 # Function to handle Play, Play Again, and Difficulty buttons
 def handle_button_click(pos):
     global game_started, game_over, attempts, level, selected_word, guessed_letters
-    global selected_difficulty, difficulty_selected, shuffled_words
+    global selected_difficulty, difficulty_selected, word_sampler
 
     button_x = WIDTH // 2 - 80  # Centered button
     button_y = HEIGHT // 2 + -100 # Centered button
@@ -429,7 +431,7 @@ def handle_button_click(pos):
         level = 1 if level >= 10 else level + 1  # Reset after 10 levels
         guessed_letters.clear()
         difficulty_selected = False  # Reset difficulty selection on a new game
-        shuffled_words = []  # Clear shuffled words when restarting the game
+        word_sampler = None  # Start a new word order when restarting the game
         return  # Exit to avoid checking difficulty buttons immediately
 
     # Check if a difficulty button is clicked after starting the game
@@ -440,13 +442,12 @@ def handle_button_click(pos):
                 selected_difficulty = difficulty
                 difficulty_selected = True
 
-                # Shuffle words once and store them
-                shuffled_words = words_by_difficulty[selected_difficulty][:]
-                random.shuffle(shuffled_words)
+                # New word order for this difficulty
+                word_sampler = None
 
                 # 🎯 Select first word
-                if shuffled_words:
-                    selected_word = shuffled_words.pop()
+                if words_by_difficulty[selected_difficulty]:
+                    selected_word = get_word(selected_difficulty)
                 return  # Exit to avoid checking Play button again
 
 # 🔡 Function to draw word with rectangles and display category
@@ -535,7 +536,7 @@ def draw_attempts(attempts):
     spacing = width + 5  # 📏 Adjusted spacing between rectangles
 
     # 🎨 Define X mark font
-    X_FONT = pygame.font.Font(None, 45)  # Slightly larger X
+    X_FONT = get_font(45)  # Slightly larger X
 
     # 🔄 Loop through 4 attempt slots
     for i in range(4):
@@ -590,7 +591,7 @@ def get_rankings():
 
 # 🎮 Main game function
 def play_spellout(uid_input):
-    global game_started, game_over, level_completed, difficulty_selected, selected_difficulty, selected_word, shuffled_words
+    global game_started, game_over, level_completed, difficulty_selected, selected_difficulty, selected_word, word_sampler
     
     start_time = time.time()  # Start time for duration calculation
     level = 0  # Start at level 1
@@ -0,0 +1,54 @@
+"""Cached virtual-keyboard layer for the Spellout game.
+
+The keyboard is drawn once onto its own surface and kept there. A guess
+changes one key, so only that key is repainted on the layer; a new word
+(guesses cleared) or a new tier (new colors) repaints the layer once. Each
+frame the game then blits the layer: one blit instead of 26 rounded keys
+and 26 labels.
+"""
+import pygame  # Import pygame for surfaces and drawing
+
+from letter_masks import LETTER_BITS  # 26-bit letter masks
+
+
+class KeyboardLayer:
+    """The virtual keyboard on a persistent surface.
+    keys maps each letter to its screen rect; labels is a GlyphAtlas for the key letters."""
+
+    def __init__(self, keys, labels, label_color, origin, size):
+        self.keys = keys
+        self.labels = labels
+        self.label_color = label_color
+        self.origin = origin
+        self.surface = pygame.Surface(size)
+        self.surface.set_colorkey((0, 0, 0))  # Black is transparent (around the rounded keys)
+        self._key_rects = {letter: rect.move(-origin[0], -origin[1]) for letter, rect in keys.items()}  # Rects on the layer
+        self.colors = None  # Tier colors the layer was drawn with
+        self.guessed_letters = 0  # Guessed letters the layer shows
+
+    def _draw_key(self, letter, guessed_letters):
+        rect = self._key_rects[letter]
+        color = self.colors["keyboard_guessed"] if guessed_letters & LETTER_BITS[letter] else self.colors["keyboard"]
+        pygame.draw.rect(self.surface, color, rect, border_radius=5)
+        self.labels.blit_centered(self.surface, letter, self.label_color, rect.center)
+        return self.keys[letter]
+
+    def update(self, colors, guessed_letters):
+        """Bring the layer up to date and return the screen rects that changed."""
+        if colors is not self.colors or guessed_letters & self.guessed_letters != self.guessed_letters:
+            # New tier or new word: repaint the whole layer once
+            self.colors = colors
+            self.guessed_letters = guessed_letters
+            self.surface.fill((0, 0, 0))
+            for letter in self._key_rects:
+                self._draw_key(letter, guessed_letters)
+            return [pygame.Rect(self.origin, self.surface.get_size())]
+
+        changed = guessed_letters ^ self.guessed_letters
+        self.guessed_letters = guessed_letters
+        if not changed:
+            return []
+        return [self._draw_key(letter, guessed_letters) for letter in self._key_rects if changed & LETTER_BITS[letter]]
+
+    def draw(self, target):
+        return target.blit(self.surface, self.origin)
@@ -0,0 +1,36 @@
+"""26-bit letter masks shared by the hangman/spellout variants.
+
+Bit 0 is A and bit 25 is Z. A set of guessed letters or the letters of a
+word is a plain int, so "already guessed?", "is the word solved?" and
+copying the guess state are single integer operations.
+"""
+from functools import lru_cache  # Cache word masks
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+ALL_LETTERS = (1 << 26) - 1  # Mask with every letter set
+
+# Bit for each letter, upper and lower case
+LETTER_BITS = {}
+for _index, _letter in enumerate(ALPHABET):
+    LETTER_BITS[_letter] = LETTER_BITS[_letter.lower()] = 1 << _index
+
+
+# Function to get the mask of every letter in a word (spaces and symbols are ignored)
+@lru_cache(maxsize=4096)
+def letter_mask(word):
+    mask = 0
+    for letter in word:
+        mask |= LETTER_BITS.get(letter, 0)
+    return mask
+
+# Function to check whether a letter is in a mask
+def has_letter(mask, letter):
+    return bool(mask & LETTER_BITS.get(letter, 0))
+
+# Function to check whether every letter of word_mask is in guessed_mask
+def is_covered(word_mask, guessed_mask):
+    return not word_mask & ~guessed_mask
+
+# Function to list the letters in a mask (uppercase, alphabetical)
+def mask_letters(mask):
+    return "".join(letter for index, letter in enumerate(ALPHABET) if mask >> index & 1)
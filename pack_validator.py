@@ -0,0 +1,263 @@
+"""Word-pack validator.
+
+Streams entries in the words_by_tier schema (word, clue, tier) in one pass
+and reports:
+  - duplicate words, within a tier and across tiers or files (hash lookup)
+  - words with characters the A-Z virtual keyboard cannot type
+  - identical clues, plus near-duplicate clues found through an inverted
+    index over clue words (which can also be searched)
+
+With no arguments it checks the game's own lists: words_by_tier and the
+word lists in the hangman*.py variants (read from the source files, so
+pygame is not needed). Otherwise it checks the given pack files (see
+word_packs.py):
+    python pack_validator.py
+    python pack_validator.py data/wordpack.ndjson --near-duplicates --search "bruno mars"
+"""
+import argparse  # Import argparse for the command line
+import ast  # Import ast to read word lists from the game sources
+import hashlib  # Import hashlib for clue digests
+import re  # Import re to split clues into words
+import time  # Import time for timing
+from array import array  # Import array for compact per-entry data
+from collections import Counter  # Import Counter for near-duplicate candidates
+
+from word_packs import iter_pack  # Streaming pack reader
+
+KEYBOARD_TABLE = str.maketrans("", "", "ABCDEFGHIJKLMNOPQRSTUVWXYZ ")  # Deletes what the A-Z keyboard can enter (spaces are shown, not typed)
+VARIANT_FILES = ("hangman.py", "hangmanUI.py", "hangman_difficulty_level.py", "hangman_improved.py", "hangman_updated.py")
+VARIANT_LISTS = ("words_by_difficulty", "words")
+STOP_WORDS = frozenset("a an and the of in on at to by for from with is its it as or that this his her their known".split())
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+NEAR_DUPLICATE_MAX_SHARED = 200  # Clue words used by more entries than this do not pick candidates
+
+
+# Function to split a clue into index words
+def clue_tokens(clue):
+    return [token for token in TOKEN_PATTERN.findall(clue.lower()) if token not in STOP_WORDS]
+
+# Function to read a word list assigned in a game source file without importing it
+def source_word_lists(path, names=VARIANT_LISTS):
+    """{name: value} for the top-level assignments to `names` in a Python file."""
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    found = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id in names:
+                    found[target.id] = ast.literal_eval(node.value)
+    return found
+
+# Function to stream the game's built-in entries
+def builtin_entries():
+    """Yield (source, tier, word, clue) for every word list in the game."""
+    from spellout_words import words_by_tier  # Word lists by tier
+
+    for tier, entries in words_by_tier.items():
+        for entry in entries:
+            yield "spellout_words.py", tier, entry["word"], entry["clue"]
+
+    for path in VARIANT_FILES:
+        lists = source_word_lists(path)
+        for word in lists.get("words", ()):
+            yield path, "-", word, ""
+        for tier, entries in lists.get("words_by_difficulty", {}).items():
+            for entry in entries:
+                if isinstance(entry, dict):
+                    yield path, tier, entry["word"], entry.get("clue", "")
+                else:
+                    yield path, tier, entry, ""
+
+# Function to stream the entries of pack files
+def pack_entries(paths):
+    for path in paths:
+        for word, clue, tier, category in iter_pack(path):
+            yield path, tier, word, clue
+
+
+class PackValidator:
+    """Collects duplicates, untypeable words and the clue index in one pass over the entries.
+    keep_clue_words keeps every entry's clue words as well, which near_duplicate_clues() needs."""
+
+    def __init__(self, keep_clue_words=False):
+        self.words = []  # Entry number -> word
+        self.locations = []  # Location number -> (source, tier)
+        self._location_ids = {}
+        self._last_location = (None, -1)
+        self.entry_locations = array("H")  # Entry number -> location number
+        self.first_entry = {}  # Word -> first entry number
+        self.duplicates = {}  # Word -> entry numbers (first one included)
+        self.untypeable = []  # (entry number, bad characters)
+        self.clue_first = {}  # Digest of the clue -> first entry number with it
+        self.duplicate_clues = {}  # Digest of the clue -> (clue, entry numbers)
+        self.clue_groups = array("I")  # Entry number -> first entry with the same clue
+        self.postings = {}  # Clue word -> entry number, or an array of them once it is in two clues
+        self.keep_clue_words = keep_clue_words
+        self.token_starts = array("I", [0])  # Entry number -> start of its clue words in token_ids
+        self.token_ids = array("I")
+        self._token_numbers = {}
+
+    def add(self, source, tier, word, clue):
+        number = len(self.words)
+        word = word.strip().upper()
+        self.words.append(word)
+
+        location = (source, tier)
+        last_location, location_id = self._last_location
+        if location != last_location:
+            location_id = self._location_ids.get(location)
+            if location_id is None:
+                location_id = self._location_ids[location] = len(self.locations)
+                self.locations.append(location)
+            self._last_location = (location, location_id)
+        self.entry_locations.append(location_id)
+
+        # Duplicate words
+        first = self.first_entry.setdefault(word, number)
+        if first != number:
+            self.duplicates.setdefault(word, [first]).append(number)
+
+        # Characters the keyboard cannot type (whatever is left once the keyboard's characters are removed)
+        bad = word.translate(KEYBOARD_TABLE)
+        if bad:
+            self.untypeable.append((number, "".join(sorted(set(bad)))))
+
+        # Repeated clues, by a 128-bit BLAKE2b digest so the clue text is not kept;
+        # unlike hash(), two different clues do not share one in practice
+        clue = " ".join(clue.lower().split())
+        first = number
+        if clue:
+            key = hashlib.blake2b(clue.encode("utf-8"), digest_size=16).digest()
+            first = self.clue_first.setdefault(key, number)
+            if first != number:
+                group = self.duplicate_clues.get(key)
+                if group is None:
+                    group = self.duplicate_clues[key] = (clue, [first])
+                group[1].append(number)
+        self.clue_groups.append(first)
+
+        # Inverted clue index
+        postings = self.postings
+        tokens = set(TOKEN_PATTERN.findall(clue)) - STOP_WORDS
+        for token in tokens:
+            numbers = postings.get(token)
+            if numbers is None:
+                postings[token] = number  # Most clue words are rare; no array until a second clue uses one
+            elif type(numbers) is int:
+                postings[token] = array("I", (numbers, number))
+            else:
+                numbers.append(number)
+        if self.keep_clue_words:
+            token_numbers = self._token_numbers
+            for token in tokens:
+                self.token_ids.append(token_numbers.setdefault(token, len(token_numbers)))
+            self.token_starts.append(len(self.token_ids))
+
+    def location(self, number):
+        source, tier = self.locations[self.entry_locations[number]]
+        return f"{source}/{tier}"
+
+    def duplicate_kinds(self):
+        """(words repeated inside one tier list, words found in more than one tier list)."""
+        within = across = 0
+        for numbers in self.duplicates.values():
+            locations = [self.entry_locations[number] for number in numbers]
+            if len(set(locations)) < len(locations):
+                within += 1
+            if len(set(locations)) > 1:
+                across += 1
+        return within, across
+
+    def entries_with(self, token):
+        """Entry numbers whose clue has this clue word."""
+        numbers = self.postings.get(token, ())
+        return (numbers,) if type(numbers) is int else numbers
+
+    def search(self, query):
+        """Entry numbers whose clue has every word of the query."""
+        tokens = clue_tokens(query)
+        if not tokens:
+            return []
+        lists = sorted((self.entries_with(token) for token in tokens), key=len)
+        matches = set(lists[0])
+        for numbers in lists[1:]:
+            matches.intersection_update(numbers)
+        return sorted(matches)
+
+    def near_duplicate_clues(self, threshold=0.8):
+        """(similarity, entry a, entry b) for clue pairs whose word sets overlap at least `threshold` (Jaccard).
+        Candidates come from the inverted index; clue words shared by very many entries are skipped there.
+        Identical clues are left out (they are reported as repeated clues)."""
+        if not self.keep_clue_words:
+            raise ValueError("Near-duplicate search needs PackValidator(keep_clue_words=True)")
+        numbers_by_token = {self._token_numbers[token]: numbers for token, numbers in self.postings.items()
+                            if type(numbers) is not int and len(numbers) <= NEAR_DUPLICATE_MAX_SHARED}
+        starts = self.token_starts
+        token_ids = self.token_ids
+        groups = self.clue_groups
+        pairs = []
+        for number in range(len(self.words)):
+            tokens = token_ids[starts[number]:starts[number + 1]]
+            shared = Counter()
+            for token in tokens:
+                for other in numbers_by_token.get(token, ()):
+                    if other > number and groups[other] != groups[number]:
+                        shared[other] += 1
+            if not shared:
+                continue
+            token_set = set(tokens)
+            for other in shared:
+                other_set = set(token_ids[starts[other]:starts[other + 1]])
+                similarity = len(token_set & other_set) / len(token_set | other_set)
+                if similarity >= threshold:
+                    pairs.append((similarity, number, other))
+        return sorted(pairs, reverse=True)
+
+
+# Function to print a validation report
+def print_report(validator, elapsed, show, near_duplicates, threshold, queries):
+    print(f"Checked {len(validator.words):,} entries from {len({s for s, t in validator.locations})} sources in {elapsed:.2f}s")
+
+    within, across = validator.duplicate_kinds()
+    print(f"\nDuplicate words: {len(validator.duplicates):,} ({within:,} repeated inside a tier list, {across:,} across tier lists)")
+    for word, numbers in list(validator.duplicates.items())[:show]:
+        print(f"  {word}: " + ", ".join(validator.location(number) for number in numbers))
+
+    print(f"\nWords the keyboard cannot type: {len(validator.untypeable):,}")
+    for number, characters in validator.untypeable[:show]:
+        print(f"  {validator.words[number]!r} ({validator.location(number)}): {characters!r}")
+
+    print(f"\nRepeated clues: {len(validator.duplicate_clues):,}")
+    for clue, numbers in list(validator.duplicate_clues.values())[:show]:
+        print(f"  {clue[:60]!r}: " + ", ".join(validator.words[number] for number in numbers))
+
+    if near_duplicates:
+        pairs = validator.near_duplicate_clues(threshold)
+        print(f"\nNear-duplicate clues (similarity >= {threshold}): {len(pairs):,}")
+        for similarity, a, b in pairs[:show]:
+            print(f"  {similarity:.2f}  {validator.words[a]} ({validator.location(a)})  ~  {validator.words[b]} ({validator.location(b)})")
+
+    for query in queries:
+        matches = validator.search(query)
+        print(f"\nClues matching {query!r}: {len(matches):,}")
+        for number in matches[:show]:
+            print(f"  {validator.words[number]} ({validator.location(number)})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validate Spellout word packs.")
+    parser.add_argument("packs", nargs="*", help="pack files (default: the game's built-in word lists)")
+    parser.add_argument("--near-duplicates", action="store_true", help="also look for near-duplicate clues")
+    parser.add_argument("--threshold", type=float, default=0.8, help="near-duplicate clue similarity (0-1)")
+    parser.add_argument("--search", action="append", default=[], help="list entries whose clue has these words")
+    parser.add_argument("--show", type=int, default=20, help="examples to print per section")
+    args = parser.parse_args()
+
+    validator = PackValidator(keep_clue_words=args.near_duplicates)
+    start = time.perf_counter()
+    for source, tier, word, clue in (pack_entries(args.packs) if args.packs else builtin_entries()):
+        validator.add(source, tier, word, clue)
+    elapsed = time.perf_counter() - start
+
+    print_report(validator, elapsed, args.show, args.near_duplicates, args.threshold, args.search)
@@ -0,0 +1,178 @@
+"""Binary savegame snapshots.
+
+A snapshot is the whole game session (see game_state.GameState) packed with
+struct into a few dozen bytes: level, attempts, guessed-letter mask, word ID,
+the word samplers' (seed, cursor) state, the timed-mode clock and pause
+accounting, the timed score and the player. A version number and a CRC-32 of
+the payload guard against old or damaged files. Packing and unpacking take
+microseconds and resuming involves no JSON, so the game can afford to save
+often.
+
+The word ID is a position in the level's tier list, so the header also holds
+a digest of that list (spellout_engine.word_list_digest). If the word pack
+changed since the save, or the ID is no longer in the list, the game resumes
+at the saved level with a new word instead of a different word under the
+same ID.
+
+Clocks are stored as elapsed seconds, not wall-clock times, so a resumed
+timed game continues from where it was saved.
+
+An evil-mode game stores the word it is showing; on load its word family is
+rebuilt from that word and the guessed letters (spellout_evil.family_for),
+so the resumed game keeps dodging guesses.
+"""
+import os  # Import os for file handling
+import struct  # Import struct for the snapshot format
+import time  # Import time to restore the clocks
+import zlib  # Import zlib for the checksum
+
+import spellout_engine as engine  # Headless game rules
+from game_state import GameState  # Session state of one game
+from spellout_evil import family_for  # Adversarial word families for evil mode
+from word_record import Word  # Word records with precomputed features
+from word_sampler import WordSampler  # No-repeat word order
+
+SAVEGAME_FILE = "data/savegame.bin"
+SAVE_MAGIC = b"SPSG"
+SAVE_VERSION = 2
+GAME_MODES = ("classic", "timed", "evil")
+NO_WORD_ID = 0xFFFFFFFF  # The word is not in its tier list and is stored as text
+
+# Layout (little endian):
+#   header   magic, version, payload size, CRC-32 of the payload, digest of the tier's word list
+#            (version 1 had no digest; its word IDs are not trusted)
+#   payload  fixed fields, then player uid and tier (u16 length + UTF-8),
+#            sampler count (u8) and per sampler: tier, seed (u64), cursor (u64),
+#            and for NO_WORD_ID the word and clue
+_HEADER_V1 = struct.Struct("<4sHII")
+_HEADER = struct.Struct("<4sHII8s")
+_FIXED = struct.Struct("<HBBIIdddHH")  # level, attempts, mode, guessed mask, word ID, game/word elapsed, pause total, correct words, time bonus
+_TEXT_SIZE = struct.Struct("<H")
+_COUNT = struct.Struct("<B")
+_SAMPLER = struct.Struct("<QQ")
+
+
+# Function to append a length-prefixed string
+def _pack_text(parts, text):
+    data = (text or "").encode("utf-8")
+    parts.append(_TEXT_SIZE.pack(len(data)))
+    parts.append(data)
+
+# Function to read a length-prefixed string at offset
+def _unpack_text(data, offset):
+    (size,) = _TEXT_SIZE.unpack_from(data, offset)
+    offset += _TEXT_SIZE.size
+    return data[offset:offset + size].decode("utf-8"), offset + size
+
+# Function to pack a game session into snapshot bytes
+def pack_snapshot(game):
+    now = game.pause_start_time if game.is_paused else time.time()
+    word_id = engine.word_id(game.level, game.selected_word)
+    mode = GAME_MODES.index(game.game_mode) if game.game_mode in GAME_MODES else 0
+
+    parts = [_FIXED.pack(game.level, game.attempts, mode, game.guessed_letters,
+                         NO_WORD_ID if word_id is None else word_id,
+                         now - game.start_time, game.word_elapsed(), game.total_pause_time,
+                         game.correct_words, game.total_time_bonus)]
+    _pack_text(parts, game.player_uid)
+    _pack_text(parts, engine.get_current_tier(game.level))
+    parts.append(_COUNT.pack(len(game.word_samplers)))
+    for tier, sampler in game.word_samplers.items():
+        _pack_text(parts, tier)
+        parts.append(_SAMPLER.pack(*sampler.state()))
+    if word_id is None:
+        _pack_text(parts, game.selected_word.word)
+        _pack_text(parts, game.selected_word.clue)
+
+    payload = b"".join(parts)
+    words_digest = engine.word_list_digest(game.level)
+    return _HEADER.pack(SAVE_MAGIC, SAVE_VERSION, len(payload), zlib.crc32(payload), words_digest) + payload
+
+# Function to rebuild a game session from snapshot bytes
+def unpack_snapshot(data, max_cells=None, word_lists=engine.words_by_tier):
+    """A started GameState, or ValueError for a file that is not a valid snapshot.
+    max_cells must match the panel limit the samplers were drawing with."""
+    if len(data) < _HEADER_V1.size:
+        raise ValueError("Savegame is too short")
+    magic, version, size, checksum = _HEADER_V1.unpack_from(data)
+    if magic != SAVE_MAGIC or version not in (1, SAVE_VERSION):
+        raise ValueError("Not a Spellout savegame (or an unsupported version)")
+    header = _HEADER if version == SAVE_VERSION else _HEADER_V1
+    if len(data) < header.size:
+        raise ValueError("Savegame is too short")
+    words_digest = _HEADER.unpack_from(data)[4] if version == SAVE_VERSION else None
+    payload = bytes(data[header.size:header.size + size])
+    if len(payload) != size or zlib.crc32(payload) != checksum:
+        raise ValueError("Savegame checksum does not match")
+
+    (level, attempts, mode, guessed_letters, word_id,
+     game_elapsed, word_elapsed, total_pause_time, correct_words, total_time_bonus) = _FIXED.unpack_from(payload)
+    offset = _FIXED.size
+    uid, offset = _unpack_text(payload, offset)
+    tier, offset = _unpack_text(payload, offset)
+    (sampler_count,) = _COUNT.unpack_from(payload, offset)
+    offset += _COUNT.size
+
+    game = GameState(uid)
+    for _ in range(sampler_count):
+        sampler_tier, offset = _unpack_text(payload, offset)
+        seed, cursor = _SAMPLER.unpack_from(payload, offset)
+        offset += _SAMPLER.size
+        game.word_samplers[sampler_tier] = WordSampler(engine.sampler_size(sampler_tier, max_cells, word_lists), seed, cursor)
+
+    if word_id == NO_WORD_ID:
+        word, offset = _unpack_text(payload, offset)
+        clue, offset = _unpack_text(payload, offset)
+        game.selected_word = Word(word, clue, tier)
+    elif words_digest == engine.word_list_digest(level, word_lists):
+        try:
+            game.selected_word = engine.word_for_id(level, word_id, word_lists)
+        except IndexError:
+            pass
+    if game.selected_word is None:  # The word list changed since the save: play a new word
+        game.selected_word = engine.get_word_for_level(level, game.word_samplers, word_lists=word_lists, max_cells=max_cells)
+        guessed_letters = 0
+        attempts = engine.MAX_ATTEMPTS
+        word_elapsed = 0.0
+
+    now = time.time()
+    game.game_started = True
+    game.game_mode = GAME_MODES[mode] if mode < len(GAME_MODES) else "classic"
+    if game.game_mode == "evil":
+        game.evil_family = family_for(game.selected_word, word_lists[engine.get_current_tier(level)], guessed_letters)
+        if len(game.evil_family):
+            game.selected_word = game.evil_family.representative()
+        else:
+            game.evil_family = None  # The word is no longer in its tier: play it as a fixed word
+    game.selected_difficulty = tier
+    game.level = level
+    game.attempts = attempts
+    game.guessed_letters = guessed_letters
+    game.start_time = now - game_elapsed
+    game.total_pause_time = total_pause_time
+    game.word_start_time = now - word_elapsed - total_pause_time  # So word_elapsed() carries on from the save
+    game.correct_words = correct_words
+    game.total_time_bonus = total_time_bonus
+    return game
+
+# Function to write a game session to the savegame file
+def write_snapshot(game, path=SAVEGAME_FILE):
+    """Write the snapshot next to the old one and swap it in, so a crash never leaves half a save."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(pack_snapshot(game))
+    os.replace(temp_path, path)
+
+# Function to read the savegame file
+def read_snapshot(path=SAVEGAME_FILE, max_cells=None, word_lists=engine.words_by_tier):
+    """The saved GameState, or None if there is no usable savegame."""
+    try:
+        with open(path, "rb") as f:
+            return unpack_snapshot(f.read(), max_cells, word_lists)
+    except (OSError, ValueError, IndexError, struct.error, UnicodeDecodeError) as e:
+        if os.path.exists(path):
+            print("Savegame could not be read:", e)
+        return None
@@ -0,0 +1,179 @@
+"""Per-player record of recently seen words, kept in Bloom filters.
+
+Each player gets two small Bloom filters: the current generation and the
+one before it. A word counts as seen if either filter has it. When the
+current filter is full (GENERATION_SIZE words), it becomes the previous one
+and a new, empty filter takes its place, so the oldest words age out and
+the false-positive rate stays low. A player costs RECORD_SIZE bytes.
+
+All players share one file (data/player_seen.bin, next to player.json). It
+is a hash table of fixed-size records, so loading or saving one player is a
+single seek and read or write, whatever the number of players.
+"""
+import hashlib  # Import hashlib for word and player hashes
+import os  # Import os for file handling
+import struct  # Import struct for the file format
+
+SEEN_WORDS_FILE = "data/player_seen.bin"
+FILTER_BYTES = 192  # Bits per generation: 1536
+HASH_COUNT = 4  # Bits set per word
+GENERATION_SIZE = 150  # Words per generation (about 1% false positives per filter)
+
+SEEN_MAGIC = b"SPSW"
+SEEN_VERSION = 1
+INITIAL_SLOTS = 1024
+MAX_LOAD = 0.7  # Grow the table when this share of slots is used
+
+# File layout (little endian): header (magic, version, slot count, used slots),
+# then slot count records of (player hash u64, words in current generation u16, current bits, previous bits).
+# A player hash of 0 marks an empty slot.
+_HEADER = struct.Struct("<4sHII")
+_RECORD_HEAD = struct.Struct("<QH")
+_KEY = struct.Struct("<Q")
+RECORD_SIZE = _RECORD_HEAD.size + 2 * FILTER_BYTES
+
+
+# Function to get the filter bit positions for a word
+def word_bits(word):
+    digest = hashlib.blake2b(word.upper().encode("utf-8"), digest_size=8).digest()
+    first = int.from_bytes(digest[:4], "little")
+    step = int.from_bytes(digest[4:], "little") | 1
+    size = FILTER_BYTES * 8
+    return [(first + i * step) % size for i in range(HASH_COUNT)]
+
+# Function to hash a player uid into a table key (never 0)
+def player_key(uid):
+    key = int.from_bytes(hashlib.blake2b(uid.encode("utf-8"), digest_size=8).digest(), "little")
+    return key or 1
+
+
+class SeenWords:
+    """Recently seen words of one player."""
+
+    __slots__ = ("count", "current", "previous")
+
+    def __init__(self, count=0, current=None, previous=None):
+        self.count = count  # Words added to the current generation
+        self.current = current or bytearray(FILTER_BYTES)
+        self.previous = previous or bytearray(FILTER_BYTES)
+
+    def __contains__(self, word):
+        bits = word_bits(word)
+        return (all(self.current[bit >> 3] & (1 << (bit & 7)) for bit in bits)
+                or all(self.previous[bit >> 3] & (1 << (bit & 7)) for bit in bits))
+
+    def add(self, word):
+        if self.count >= GENERATION_SIZE:
+            self.previous, self.current = self.current, bytearray(FILTER_BYTES)
+            self.count = 0
+        for bit in word_bits(word):
+            self.current[bit >> 3] |= 1 << (bit & 7)
+        self.count += 1
+
+    def to_record(self, key):
+        return _RECORD_HEAD.pack(key, self.count) + self.current + self.previous
+
+    @classmethod
+    def from_record(cls, record):
+        key, count = _RECORD_HEAD.unpack_from(record)
+        start = _RECORD_HEAD.size
+        return cls(count, bytearray(record[start:start + FILTER_BYTES]), bytearray(record[start + FILTER_BYTES:]))
+
+
+class SeenWordsFile:
+    """On-disk hash table of SeenWords records, one per player."""
+
+    def __init__(self, path=SEEN_WORDS_FILE):
+        self.path = path
+        self._file = None
+        self.slots = 0
+        self.used = 0
+
+    def _open(self):
+        if self._file is None:
+            if not os.path.exists(self.path):
+                self._create(self.path, INITIAL_SLOTS)
+            self._file = open(self.path, "r+b")
+            magic, version, self.slots, self.used = _HEADER.unpack(self._file.read(_HEADER.size))
+            if magic != SEEN_MAGIC or version != SEEN_VERSION:
+                raise ValueError("Not a Spellout seen-words file")
+        return self._file
+
+    @staticmethod
+    def _create(path, slots):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(SEEN_MAGIC, SEEN_VERSION, slots, 0))
+            f.truncate(_HEADER.size + slots * RECORD_SIZE)
+
+    def _find(self, key):
+        """(slot, found): the player's slot, or the empty slot where it would go."""
+        f = self._open()
+        slot = key % self.slots
+        while True:
+            f.seek(_HEADER.size + slot * RECORD_SIZE)
+            (slot_key,) = _KEY.unpack(f.read(_KEY.size))
+            if slot_key == key or slot_key == 0:
+                return slot, slot_key == key
+            slot = (slot + 1) % self.slots
+
+    def get(self, uid):
+        """The player's SeenWords (empty for a new player)."""
+        slot, found = self._find(player_key(uid))
+        if not found:
+            return SeenWords()
+        f = self._file
+        f.seek(_HEADER.size + slot * RECORD_SIZE)
+        return SeenWords.from_record(f.read(RECORD_SIZE))
+
+    def put(self, uid, seen):
+        """Write the player's SeenWords back."""
+        key = player_key(uid)
+        slot, found = self._find(key)
+        if not found:
+            if self.used + 1 > self.slots * MAX_LOAD:
+                self._grow()
+                slot, found = self._find(key)
+            self.used += 1
+            self._file.seek(0)
+            self._file.write(_HEADER.pack(SEEN_MAGIC, SEEN_VERSION, self.slots, self.used))
+        self._file.seek(_HEADER.size + slot * RECORD_SIZE)
+        self._file.write(seen.to_record(key))
+        self._file.flush()
+
+    def _grow(self):
+        """Rewrite the table with twice the slots."""
+        old = self._file
+        old.seek(_HEADER.size)
+        records = []
+        for _ in range(self.slots):
+            record = old.read(RECORD_SIZE)
+            if _KEY.unpack_from(record)[0]:
+                records.append(record)
+        old.close()
+
+        temp_path = self.path + ".tmp"
+        self._create(temp_path, self.slots * 2)
+        with open(temp_path, "r+b") as f:
+            slots = self.slots * 2
+            for record in records:
+                slot = _KEY.unpack_from(record)[0] % slots
+                while True:
+                    f.seek(_HEADER.size + slot * RECORD_SIZE)
+                    if not _KEY.unpack(f.read(_KEY.size))[0]:
+                        break
+                    slot = (slot + 1) % slots
+                f.seek(_HEADER.size + slot * RECORD_SIZE)
+                f.write(record)
+            f.seek(0)
+            f.write(_HEADER.pack(SEEN_MAGIC, SEEN_VERSION, slots, len(records)))
+        os.replace(temp_path, self.path)
+        self._file = None
+        self._open()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,117 @@
+"""Vectorized word difficulty scoring and automatic tier assignment.
+
+Scores a whole dictionary in one NumPy pass from four features: length,
+unique letters, letter rarity (how uncommon the word's letters are in the
+dictionary itself) and repeated letters. Words are then bucketed into the
+same "Easy" / "Normal" / "Hard" tiers used by words_by_tier, so new word
+packs do not have to be sorted by hand.
+
+    python spellout_difficulty.py              # re-tier the built-in words
+    python spellout_difficulty.py --benchmark 1000000
+"""
+import argparse  # Import argparse for the command line
+import random  # Import random for benchmark words
+import time  # Import time for timing
+
+import numpy as np  # Import numpy for the vectorized pass
+
+from letter_masks import ALPHABET  # A-Z
+from spellout_engine import TIERS  # Tier names in order
+from spellout_words import words_by_tier  # Word lists by tier
+
+# Weight of each normalized feature in the score (higher score = harder)
+DEFAULT_WEIGHTS = {
+    "length": 1.0,  # Longer words take more correct guesses
+    "unique": 1.5,  # Every distinct letter has to be found
+    "rarity": 2.0,  # Uncommon letters are guessed late
+    "repeats": -1.0,  # A repeated letter fills several boxes at once
+}
+
+
+# Function to turn words into a (words x max length) matrix of letter indices
+def encode_words(words):
+    """Return an int8 matrix with 0-25 for A-Z and -1 for anything else (padding, spaces)."""
+    words = [word.upper() for word in words]  # Before measuring: "ß".upper() is "SS"
+    width = max((len(word) for word in words), default=1)
+    blob = "".join(word.ljust(width) for word in words).encode("ascii", "replace")
+    codes = np.frombuffer(blob, dtype=np.uint8).reshape(len(words), width).astype(np.int16) - ord("A")
+    codes[(codes < 0) | (codes > 25)] = -1
+    return codes.astype(np.int8)
+
+# Function to compute the per-word features
+def word_features(words):
+    """Return a dict of feature arrays (one value per word)."""
+    codes = encode_words(words)
+
+    # Letter counts per word: one column per letter
+    counts = np.empty((len(words), 26), dtype=np.int32)
+    for index in range(26):
+        counts[:, index] = (codes == index).sum(axis=1)
+
+    length = counts.sum(axis=1)
+    unique = (counts > 0).sum(axis=1)
+
+    # Rarity: average information content of the word's letters within this dictionary
+    letter_totals = counts.sum(axis=0).astype(np.float64)
+    frequency = (letter_totals + 1) / (letter_totals.sum() + 26)  # Smoothed so unseen letters stay finite
+    information = -np.log2(frequency)
+    rarity = (counts @ information) / np.maximum(length, 1)
+
+    return {
+        "length": length,
+        "unique": unique,
+        "rarity": rarity,
+        "repeats": length - unique,
+    }
+
+# Function to score every word
+def score_words(words, weights=DEFAULT_WEIGHTS):
+    """Difficulty score per word; each feature is scaled to 0..1 before weighting."""
+    features = word_features(words)
+    score = np.zeros(len(words), dtype=np.float64)
+    for name, weight in weights.items():
+        values = features[name].astype(np.float64)
+        spread = values.max() - values.min() if len(values) else 0
+        if spread:
+            score += weight * (values - values.min()) / spread
+    return score
+
+# Function to bucket scores into tiers
+def tier_indices(scores, tiers=TIERS):
+    """Split words into equally sized tiers by score; returns a tier index per word."""
+    cut_points = np.quantile(scores, [i / len(tiers) for i in range(1, len(tiers))]) if len(scores) else []
+    return np.searchsorted(cut_points, scores, side="right")
+
+# Function to build words_by_tier-style lists from any entries
+def assign_tiers(entries, weights=DEFAULT_WEIGHTS, tiers=TIERS):
+    """entries: word dicts ({"word": ..., "clue": ...}). Returns {tier: [entries, easiest first]}."""
+    entries = list(entries)
+    scores = score_words([entry["word"] for entry in entries], weights)
+    assigned = tier_indices(scores, tiers)
+
+    result = {tier: [] for tier in tiers}
+    for position in np.argsort(scores, kind="stable"):
+        result[tiers[assigned[position]]].append(entries[position])
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score word difficulty and assign tiers.")
+    parser.add_argument("--benchmark", type=int, default=0, help="score this many random words and report the time")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        rng = random.Random(0)
+        words = ["".join(rng.choices(ALPHABET, k=rng.randint(3, 14))) for _ in range(args.benchmark)]
+        start = time.perf_counter()
+        tiers = tier_indices(score_words(words))
+        elapsed = time.perf_counter() - start
+        print(f"Scored and tiered {len(words):,} words in {elapsed:.2f}s")
+        print("Words per tier:", np.bincount(tiers, minlength=len(TIERS)).tolist())
+    else:
+        entries = [entry for tier in TIERS for entry in words_by_tier[tier]]
+        current_tier = {entry["word"]: tier for tier in TIERS for entry in words_by_tier[tier]}
+        for tier, tier_entries in assign_tiers(entries).items():
+            print(f"{tier}:")
+            for entry in tier_entries:
+                print(f"  {entry['word']:<15} (hand-sorted as {current_tier[entry['word']]})")
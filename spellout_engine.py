@@ -0,0 +1,345 @@
+"""Headless rules engine for the Spellout game.
+
+All of the guess, attempt, level and star rules used by play_spellout live
+here as plain Python so they can run without pygame (simulations, bots and
+regression checks on a box with no display).
+
+Headless play on the built-in lists, measured on one core: about 90-110k
+classic games/s (play_game) with the frequency strategy, 58-70k with
+random and 1.6-1.9k with the solver, and 300-420k words/s (play_word,
+frequency). Most frequency and random games end on the first word or two,
+so a new game's samplers are a large share of the cost. spellout_sim.py
+spreads games over every core. The revealed pattern is only built for
+strategies that read it (see needs_pattern) and only after a correct guess.
+"""
+import hashlib  # Import hashlib for word-list digests
+import random  # Import random for word selection
+import weakref  # Import weakref to track live sessions per tier
+
+from letter_masks import ALPHABET, LETTER_BITS, letter_mask, is_covered  # 26-bit letter masks
+from spellout_solver import solver_strategy  # Candidate-filtering bot
+from spellout_tree import tree_strategy  # Precomputed decision-tree bot
+from spellout_words import words_by_tier  # Word lists by tier
+from word_record import length_order, panel_cells  # Panel widths of words
+from word_sampler import WordSampler  # No-repeat word order
+
+# Rules
+MAX_ATTEMPTS = 4  # Wrong guesses allowed per word
+FINAL_LEVEL = 15  # Levels 1-15, five per tier
+TIERS = ("Easy", "Normal", "Hard")  # Tier order as the game progresses
+TIER_TIME_BONUS = {"Easy": 15, "Normal": 30}  # Timed mode bonus when a tier is cleared
+SEEN_SKIP_LIMIT = 32  # Recently seen words skipped per draw before one is shown anyway
+REPEAT_LIMIT = 26  # Repeated guesses play_word allows per word before giving up on the strategy
+
+# Guessed letters are a 26-bit mask (see letter_masks.py); 0 means nothing guessed yet
+
+# Guess outcomes returned by apply_guess
+REPEAT = "repeat"  # Letter was already guessed, nothing changes
+CORRECT = "correct"  # Letter is in the word, word not finished yet
+WRONG = "wrong"  # Letter is not in the word, attempts left
+SOLVED = "solved"  # Letter completed the word
+FAILED = "failed"  # Letter used up the last attempt
+
+
+# Function to get current tier based on level
+def get_current_tier(level):
+    if level <= 5:
+        return "Easy"
+    elif level <= 10:
+        return "Normal"
+    else:
+        return "Hard"
+
+# Function to calculate stars for a finished game
+def calculate_stars(completed):
+    """Stars for a record; `completed` is levels cleared (classic) or words guessed (timed)."""
+    if completed >= 15:
+        return 3
+    elif completed >= 10:
+        return 2
+    elif completed >= 5:
+        return 1
+    return 0
+
+# Function to apply a single guess
+def apply_guess(word_mask, guessed_letters, attempts, letter):
+    """Apply one guess to the current word.
+    word_mask and guessed_letters are letter masks; returns (outcome, guessed_letters, attempts)."""
+    bit = LETTER_BITS[letter]
+    if guessed_letters & bit:
+        return REPEAT, guessed_letters, attempts
+
+    guessed_letters |= bit
+
+    if word_mask & bit:
+        if is_covered(word_mask, guessed_letters):
+            return SOLVED, guessed_letters, attempts
+        return CORRECT, guessed_letters, attempts
+
+    attempts -= 1
+    if attempts <= 0:
+        return FAILED, guessed_letters, 0
+    return WRONG, guessed_letters, attempts
+
+# Function to check which tier, if any, a level completes
+def tier_completion(level):
+    """Return (tier, stars, time_bonus) when clearing `level` finishes a tier, else None.
+    Level 5 finishes Easy, level 10 finishes Normal and level 15 finishes Hard."""
+    if level % 5 != 0 or not 5 <= level <= FINAL_LEVEL:
+        return None
+    tier = get_current_tier(level)
+    stars = level // 5
+    return tier, stars, TIER_TIME_BONUS.get(tier, 0)
+
+# Function to move on to the next level
+def advance_level(level):
+    """Return (next_level, game_complete) after the word for `level` is finished."""
+    next_level = level + 1
+    return next_level, next_level > FINAL_LEVEL
+
+
+class LengthIndex:
+    """Positions of one tier's words ordered by panel width, so the words that
+    fit N cells are always the first fitting(N) entries of `order`."""
+
+    def __init__(self, order, fit_counts):
+        self.order = order
+        self.fit_counts = fit_counts  # fit_counts[n] = words at most n cells wide
+
+    @classmethod
+    def for_words(cls, words):
+        """The index for a tier list. Word stores and pack tiers carry the order from
+        build time (length_order()), so only plain lists are measured word by word."""
+        stored = getattr(words, "length_order", None)
+        stored = stored() if stored is not None else None
+        if stored is None:
+            stored = length_order(panel_cells(entry["word"]) for entry in words)
+        return cls(*stored)
+
+    def fitting(self, max_cells):
+        """Number of words at most max_cells wide."""
+        return self.fit_counts[max(0, min(max_cells, len(self.fit_counts) - 1))]
+
+
+# Length indexes per tier: tier -> (word list, LengthIndex)
+_length_indexes = {}
+
+
+# Function to get the length index of a tier, built once per word list
+def length_index(tier, word_lists=words_by_tier):
+    words = word_lists[tier]
+    cached = _length_indexes.get(tier)
+    if cached is None or cached[0] is not words:
+        cached = _length_indexes[tier] = (words, LengthIndex.for_words(words))
+    return cached[1]
+
+# Function to get how many words a tier's sampler draws from
+def sampler_size(tier, max_cells=None, word_lists=words_by_tier):
+    """All of the tier, or only the words that fit max_cells (the whole tier if none fit)."""
+    if max_cells is None:
+        return len(word_lists[tier])
+    return length_index(tier, word_lists).fitting(max_cells) or len(word_lists[tier])
+
+# Function to get a word based on current level
+def get_word_for_level(level, samplers, rng=random, word_lists=words_by_tier, max_cells=None, seen=None):
+    """Draw a word for the level's tier.
+    samplers maps each tier to its WordSampler; a tier gets a new one (seeded
+    from rng) the first time it is used or when its word pool changed size.
+    With max_cells only words at most that many panel cells wide are drawn;
+    they are a prefix of the tier's length index, so no word is ever rejected.
+    With seen (a player's SeenWords) recently seen words are skipped, up to
+    SEEN_SKIP_LIMIT per draw and never so many that the rest of the tier's
+    levels would run out of fresh words; the drawn word is added to seen."""
+    current_tier = get_current_tier(level)
+    words = word_lists[current_tier]
+    size = sampler_size(current_tier, max_cells, word_lists)
+
+    sampler = samplers.get(current_tier)
+    if sampler is None or sampler.size != size:
+        sampler = samplers[current_tier] = WordSampler(size, rng.getrandbits(64))
+
+    order = length_index(current_tier, word_lists).order if max_cells is not None else None
+    draws = 1
+    if seen is not None:
+        levels_after = 4 - (level - 1) % 5  # Levels left in this tier after this one
+        draws = max(1, min(SEEN_SKIP_LIMIT, sampler.remaining() - levels_after))
+    for _ in range(draws):
+        position = sampler.next()
+        entry = words[position if order is None else order[position]]
+        if seen is None or entry["word"] not in seen:
+            break
+
+    if seen is not None:
+        seen.add(entry["word"])
+    return entry
+
+# Live sessions playing in each tier: tier -> WeakSet, so a session that is gone stops counting
+_tier_sessions = {}
+
+
+# Function to free the word data of tiers the run has already passed
+def release_passed_tiers(level, samplers=None, word_lists=words_by_tier, session=None):
+    """Levels only move forward, so tiers before the level's tier cannot come back this run.
+    Drops the run's samplers for them. The tier indexes and, for word lists that can
+    reload a tier on demand (word_packs.LazyTiers), the words themselves are shared by
+    every session in the process, so they are only dropped when no live session is
+    still playing the tier. Pass the session (e.g. a GameState) to record it in its
+    level's tier; sessions that never pass one do not hold any tier."""
+    current_tier = get_current_tier(level)
+    if session is not None:
+        for sessions in _tier_sessions.values():
+            sessions.discard(session)
+        _tier_sessions.setdefault(current_tier, weakref.WeakSet()).add(session)
+
+    release = getattr(word_lists, "release", None)
+    for tier in TIERS[:TIERS.index(current_tier)]:
+        if samplers is not None:
+            samplers.pop(tier, None)
+        if _tier_sessions.get(tier):
+            continue  # Another session is still playing this tier
+        _length_indexes.pop(tier, None)
+        _word_positions.pop(tier, None)
+        _word_digests.pop(tier, None)
+        if release is not None:
+            release(tier)
+
+# Word positions per tier for word_id(): tier -> (word list, {word: index})
+_word_positions = {}
+
+
+# Function to get a word's ID (its index in the level's tier list)
+def word_id(level, entry, word_lists=words_by_tier):
+    """Index of entry's word in the level's tier list, or None if the word is not there.
+    The word -> index table is built once per tier list, so later lookups are O(1)."""
+    tier = get_current_tier(level)
+    words = word_lists[tier]
+    index = getattr(entry, "index", None)  # Word records know their position in their tier
+    if index is not None and getattr(entry, "tier", None) == tier and index < len(words):
+        return index
+
+    cached = _word_positions.get(tier)
+    if cached is None or cached[0] is not words:
+        cached = _word_positions[tier] = (words, {word["word"]: index for index, word in enumerate(words)})
+    index = cached[1].get(entry["word"])
+    if index is None or index >= len(words) or words[index]["word"] != entry["word"]:
+        return None
+    return index
+
+# Function to get the word for an ID from word_id()
+def word_for_id(level, index, word_lists=words_by_tier):
+    return word_lists[get_current_tier(level)][index]
+
+# Word-list digests per tier for word_list_digest(): tier -> (word list, digest)
+_word_digests = {}
+
+
+# Function to get a digest of the level's tier list, the list word IDs point into
+def word_list_digest(level, word_lists=words_by_tier):
+    """8-byte BLAKE2b digest of the tier's words in order, built once per tier list.
+    A saved word ID only means the same word while the digest is the same."""
+    tier = get_current_tier(level)
+    words = word_lists[tier]
+    cached = _word_digests.get(tier)
+    if cached is None or cached[0] is not words:
+        digest = hashlib.blake2b("\n".join(entry["word"] for entry in words).encode("utf-8"), digest_size=8).digest()
+        cached = _word_digests[tier] = (words, digest)
+    return cached[1]
+
+# Function to show the word with unguessed letters hidden
+def reveal_pattern(word, guessed_letters):
+    return "".join(letter if guessed_letters & LETTER_BITS.get(letter, 0) or letter == " " else "_" for letter in word)
+
+
+# 🤖 Guessing strategies: strategy(pattern, guessed_letters, rng) -> letter
+# A strategy with needs_pattern = False is handed None instead of the pattern
+ENGLISH_FREQUENCY_ORDER = "ETAOINSHRDLCUMWFGYPBVKJXQZ"
+_LETTER_BITS = [(letter, LETTER_BITS[letter]) for letter in ALPHABET]
+_FREQUENCY_BITS = [(letter, LETTER_BITS[letter]) for letter in ENGLISH_FREQUENCY_ORDER]
+
+
+def random_strategy(pattern, guessed_letters, rng):
+    """Guess a random letter that has not been tried yet."""
+    return rng.choice([letter for letter, bit in _LETTER_BITS if not guessed_letters & bit])
+
+
+def frequency_strategy(pattern, guessed_letters, rng):
+    """Guess letters in English frequency order."""
+    for letter, bit in _FREQUENCY_BITS:
+        if not guessed_letters & bit:
+            return letter
+
+
+random_strategy.needs_pattern = False
+frequency_strategy.needs_pattern = False
+
+
+STRATEGIES = {
+    "random": random_strategy,
+    "frequency": frequency_strategy,
+    "solver": solver_strategy,
+    "tree": tree_strategy,
+}
+
+
+# Function to play a single word headlessly
+def play_word(word, strategy, rng=random, max_attempts=MAX_ATTEMPTS):
+    """Play one word until it is solved or the attempts run out.
+    Returns (solved, wrong_guesses). Follows apply_guess, inlined: this is the
+    innermost loop of every simulation. A repeated letter costs nothing, as in
+    the game, so a strategy that keeps repeating itself would never finish the
+    word; after REPEAT_LIMIT repeats a ValueError is raised."""
+    word_mask = letter_mask(word)
+    guessed_letters = 0
+    attempts = max_attempts
+    repeats = 0
+    # The pattern only changes after a correct guess
+    pattern = reveal_pattern(word, 0) if getattr(strategy, "needs_pattern", True) else None
+
+    while True:
+        letter = strategy(pattern, guessed_letters, rng)
+        bit = LETTER_BITS[letter]
+        if guessed_letters & bit:  # REPEAT
+            repeats += 1
+            if repeats > REPEAT_LIMIT:
+                raise ValueError(f"Strategy keeps guessing letters it already tried (last: {letter})")
+            continue
+        guessed_letters |= bit
+
+        if word_mask & bit:
+            if not word_mask & ~guessed_letters:
+                return True, max_attempts - attempts  # SOLVED
+            if pattern is not None:
+                pattern = reveal_pattern(word, guessed_letters)
+        else:
+            attempts -= 1
+            if attempts <= 0:
+                return False, max_attempts  # FAILED
+
+# Function to play a full classic game headlessly
+def play_game(strategy, rng=random, word_lists=words_by_tier, max_attempts=MAX_ATTEMPTS):
+    """Play levels 1-15 the way play_spellout does in classic mode.
+    Returns a dict with the levels completed, the stars earned and one
+    (level, word, solved, wrong_guesses) entry per word played."""
+    samplers = {}
+    level = 1
+    words_played = []
+
+    while True:
+        selected_word = get_word_for_level(level, samplers, rng, word_lists)
+        solved, wrong_guesses = play_word(selected_word["word"], strategy, rng, max_attempts)
+        words_played.append((level, selected_word["word"], solved, wrong_guesses))
+
+        if not solved:
+            completed = level - 1
+            break
+
+        level, game_complete = advance_level(level)
+        if game_complete:
+            completed = FINAL_LEVEL
+            break
+
+    return {
+        "levels_completed": completed,
+        "stars": calculate_stars(completed),
+        "words": words_played,
+    }
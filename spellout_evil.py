@@ -0,0 +1,102 @@
+"""Adversarial ("evil") word choice for the Spellout game.
+
+The word is not fixed up front: the game keeps a family of candidate words
+of the same length, and after every guess it keeps the largest group that
+shares the same reveal pattern for that letter. The family is also kept as
+one newline-joined bytes string, so a guess translates it in one call and
+splits it into per-word keys; Counter and itertools.compress do the rest,
+and the per-word work stays in C.
+
+A guess still touches every word of the family, about 0.2-0.4 us per word
+on one core (python -m benchmarks.evil): a first guess on 30,000 words takes
+7-12 ms and on 50,000 words 11-30 ms, against a 16.7 ms frame at 60 fps.
+Families are therefore truncated to FAMILY_LIMIT words (see family_for);
+only word packs with very large tiers reach the limit.
+"""
+from collections import Counter  # Import Counter to size each group
+from itertools import compress  # Import compress to keep the chosen group
+
+from letter_masks import ALPHABET, LETTER_BITS  # 26-bit letter masks
+from word_record import Word  # Word records with precomputed features
+
+HIDDEN = b"_"
+FAMILY_LIMIT = 30000  # Most words in a family, so one guess fits in a frame
+
+# Translation tables that hide every letter except one
+_only_tables = {}
+
+
+# Function to get a table that keeps only `letter` and hides the rest
+def only_letter_table(letter):
+    table = _only_tables.get(letter)
+    if table is None:
+        others = ALPHABET.replace(letter, "").encode("ascii")
+        table = bytes.maketrans(others, HIDDEN * len(others))
+        _only_tables[letter] = table
+    return table
+
+
+class WordFamily:
+    """Candidate words that are all still consistent with what the player has seen."""
+
+    def __init__(self, entries):
+        """entries: word dicts ({"word": ..., "clue": ...}) that all have the same length."""
+        self.entries = list(entries)
+        self.words = [entry["word"].encode("utf-8") for entry in self.entries]
+        self.joined = b"\n".join(self.words)  # Pack words never hold a newline
+
+    def __len__(self):
+        return len(self.words)
+
+    def keep(self, selected):
+        """Keep the words whose flag in `selected` (one per word, in order) is true."""
+        self.words = list(compress(self.words, selected))
+        self.entries = list(compress(self.entries, selected))
+        self.joined = b"\n".join(self.words)
+
+    def guess(self, letter):
+        """Keep the largest group of words sharing the same positions for `letter`.
+        Ties go to the group that reveals the fewest letters (a miss if possible)."""
+        keys = self.joined.translate(only_letter_table(letter)).split(b"\n")
+        sizes = Counter(keys)
+        letter_byte = ord(letter)
+        best_key = max(sizes, key=lambda key: (sizes[key], -key.count(letter_byte)))
+
+        if sizes[best_key] != len(keys):
+            self.keep(list(map(best_key.__eq__, keys)))
+
+    def representative(self):
+        """A Word to display; the clue stays hidden until only one word is left."""
+        entry = self.entries[0]
+        if len(self.entries) == 1 and isinstance(entry, Word):
+            return entry
+        clue = entry["clue"] if len(self.entries) == 1 else f"{len(self.entries)} words still fit..."
+        return Word(entry["word"], clue, getattr(entry, "tier", None), getattr(entry, "index", None))
+
+
+# Function to get a word's panel shape (letter boxes and spaces)
+def word_shape(word):
+    return "".join(" " if letter == " " else "_" for letter in word)
+
+# Function to start a family from every word shaped like the drawn word
+def family_for(selected_word, entries, guessed_letters=0):
+    """The family for a new word, or with guessed_letters (a letter mask) the family
+    of a game in progress: every word that shows those letters exactly where
+    selected_word does. After any guesses, in any order, WordFamily.guess has kept
+    exactly these words, so a saved game's family can be rebuilt from its word
+    and guessed letters.
+
+    Families are truncated: a shape with more than FAMILY_LIMIT words in the tier
+    starts from every n-th one of them, and the other words are never candidates.
+    The pick depends only on the tier list and the shape, so a rebuilt family
+    comes from the same words."""
+    shape = word_shape(selected_word["word"])
+    matches = [entry for entry in entries if len(entry["word"]) == len(shape) and word_shape(entry["word"]) == shape]
+    step = -(-len(matches) // FAMILY_LIMIT)  # Ceiling division
+    family = WordFamily(matches[::step] if step > 1 else matches)
+    if guessed_letters:
+        hidden = "".join(letter for letter in ALPHABET if not guessed_letters & LETTER_BITS[letter]).encode("ascii")
+        table = bytes.maketrans(hidden, HIDDEN * len(hidden))
+        shown = selected_word["word"].encode("utf-8").translate(table)
+        family.keep(list(map(shown.__eq__, family.joined.translate(table).split(b"\n"))))
+    return family
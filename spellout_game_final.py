@@ -7,12 +7,28 @@ import time  # Import time for delays
 from datetime import datetime  # Import datetime for timestamping
 from PIL import Image, ImageSequence  # Import Image for GIF handling
 import math  # Import math for animations
+from spellout_words import words_by_tier, category_by_tier, time_limits  # Word lists and timers
+from word_record import Word  # Word records with precomputed features
+import spellout_engine as engine  # Headless game rules
+from spellout_engine import get_current_tier, MAX_ATTEMPTS  # Tier lookup and attempt limit
+from letter_masks import LETTER_BITS, letter_mask  # 26-bit letter masks
+from spellout_evil import family_for  # Adversarial word families for evil mode
+from word_sampler import WordSampler  # No-repeat word order
+from seen_words import SeenWordsFile, SEEN_WORDS_FILE  # Per-player recently seen words
+from game_state import GameState  # Session state of one game
+from glyph_atlas import GlyphAtlas  # Pre-rendered letter glyphs
+from keyboard_layer import KeyboardLayer  # Cached virtual-keyboard layer
+from display_regions import DirtyRegions  # Dirty-rectangle display updates
+from text_cache import TextCache  # Cached text surfaces
+from font_registry import get_font, get_sys_font  # Fonts created once per face and size
+from savegame import SAVEGAME_FILE, read_snapshot, write_snapshot  # Binary savegame snapshots
 
 # Initialize Pygame
 pygame.init()
 
 # 🎨 Define screen settings
 WIDTH, HEIGHT = 600, 450  # Adjusted height for better keyboard spacing
+MAX_PANEL_CELLS = WIDTH // 45  # Word panel columns (45 px each) that fit in the window
 WHITE = (255, 255, 255)  # Background color
 BLACK = (0, 0, 0)  # Text color
 BLUE = (65, 120, 189)  # Default key color (#4178bd)
@@ -75,83 +91,29 @@ MEDIUM_COLOR = (251, 179, 22)  # Orange (#fbb316)
 HARD_COLOR = (222, 52, 52)  # Red (#de3434)
 
 # Fonts
-FONT = pygame.font.Font(None, 40)  # Font for word display
-BUTTON_FONT = pygame.font.Font(None, 30)  # Font for virtual keyboard
-LETTER_FONT = pygame.font.Font(None, 50)  # Font for letter display
-CATEGORY_FONT = pygame.font.SysFont(None, 28)  # Smaller size than LETTER_FONT
-CLUE_FONT = pygame.font.SysFont(None, 15)  # Smaller font size for the clue
+FONT = get_font(40)  # Font for word display
+BUTTON_FONT = get_font(30)  # Font for virtual keyboard
+LETTER_FONT = get_font(50)  # Font for letter display
+CATEGORY_FONT = get_sys_font(28)  # Smaller size than LETTER_FONT
+CLUE_FONT = get_sys_font(15)  # Smaller font size for the clue
+
+# Letters rendered once per font and color instead of every frame
+LETTER_GLYPHS = GlyphAtlas(LETTER_FONT, [colors["tier_text"] for colors in TIER_COLORS.values()])  # Word panel letters
+KEY_GLYPHS = GlyphAtlas(BUTTON_FONT, [WHITE])  # Keyboard labels
+
+# Other UI strings rendered once and reused while they stay on screen
+TEXT_CACHE = TextCache()
 
 # Constants
 max_width, max_height = WIDTH, HEIGHT
 PLAYER_DATA_FILE = "data/player.json"  # File to store player data
+LEGACY_SAVEGAME_FILE = "data/savegame.json"  # Savegame format before binary snapshots
+seen_words_file = SeenWordsFile(SEEN_WORDS_FILE)  # Recently seen words of every player
 
 # 🖥️ Create screen
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Spellout Game")
-
-# 📜 Word Lists by Tier with Clues
-words_by_tier = {
-    "Easy": [  # Levels 1-5
-        {"word": "HUMAN", "clue": "A bipedal primate species, known for its intelligence and ability to create complex tools."},
-        {"word": "EAGLE", "clue": "A large bird of prey, known for its keen eyesight and powerful flight."},
-        {"word": "PANTHER", "clue": "A big cat found in the Americas, known for its stealthy hunting skills."},
-        {"word": "CROCODILE", "clue": "A large reptile that lives in rivers and is known for its sharp teeth and strong jaws."},
-        {"word": "TORTOISE", "clue": "A slow-moving land reptile with a hard shell that protects its body."},
-        {"word": "SPIDER", "clue": "An arachnid with eight legs, known for spinning webs."},
-        {"word": "FROG", "clue": "An amphibian known for its jumping ability and croaking sound."},
-        {"word": "CAT", "clue": "A small domesticated carnivorous mammal with retractable claws."},
-        {"word": "BUTTERFLY", "clue": "A colorful insect with delicate wings that goes through metamorphosis."},
-        {"word": "HUSKY", "clue": "A strong, thick-coated dog breed known for pulling sleds in snowy regions."}
-    ],
-    "Normal": [  # Levels 6-10
-        {"word": "BLUE", "clue": "From the album *Blue* by Yung Kai"},
-        {"word": "ENCHANTED", "clue": "From the album *Speak Now* by Taylor Swift"},
-        {"word": "TREASURE", "clue": "From the album *Unorthodox Jukebox* by Bruno Mars"},
-        {"word": "PHOTOGRAPH", "clue": "From the album *x (Multiply)* by Ed Sheeran"},
-        {"word": "JUDAS", "clue": "From the album *Born This Way* by Lady Gaga"},
-        {"word": "ROAR", "clue": "From the album *Prism* by Katy Perry"},
-        {"word": "GRENADE", "clue": "From the album *Doo-Wops & Hooligans* by Bruno Mars"},
-        {"word": "CHANDELIER", "clue": "From the album *1000 Forms of Fear* by Sia"},
-        {"word": "HELLO", "clue": "From the album *25* by Adele"},
-        {"word": "PERFECT", "clue": "From the album *÷ (Divide)* by Ed Sheeran"},
-    ],
-    "Hard": [  # Levels 11-15
-        {"word": "EIFFEL", "clue": "Paris icon"},
-        {"word": "PYRAMID", "clue": "Egypt tomb"},
-        {"word": "COLOSSEUM", "clue": "Rome arena"},
-        {"word": "ACROPOLIS", "clue": "Greek hilltop"},
-        {"word": "SYDNEY", "clue": "Opera house"},
-        {"word": "STONEHENGE", "clue": "Ancient rocks"},
-        {"word": "PETRA", "clue": "Jordan ruins"},
-        {"word": "SPHINX", "clue": "Egypt guardian"},
-        {"word": "ANGKOR", "clue": "Cambodia temple"},
-        {"word": "ALHAMBRA", "clue": "Spanish palace"},
-        {"word": "RENAISSANCE", "clue": "Rebirth"},
-        {"word": "REVOLUTION", "clue": "Uprising"},
-        {"word": "IMPERIALISM", "clue": "Colonial"},
-        {"word": "GENOCIDE", "clue": "Massacre"},
-        {"word": "CRUSADE", "clue": "Holy"},
-        {"word": "FASCISM", "clue": "Dictator"},
-        {"word": "ARMISTICE", "clue": "Truce"},
-        {"word": "TREATY", "clue": "Agreement"},
-        {"word": "FEUDALISM", "clue": "Hierarchy"},
-        {"word": "ENLIGHTENMENT", "clue": "Reason"},
-    ]
-}
-
-# 🏷️ Category Names per Tier
-category_by_tier = {
-    "Easy": "Animal Kingdom",
-    "Normal": "Song Titles",
-    "Hard": "World & History"
-}
-
-# Time limits for each tier (in seconds)
-time_limits = {
-    "Easy": 15,    # 15 seconds per word
-    "Normal": 30,  # 30 seconds per word
-    "Hard": 60     # 60 seconds per word
-}
+display_regions = DirtyRegions(screen.get_rect())  # Changed screen areas; a full flip only when the view changes
 
 # Background colors for each tier (from light to dark)
 tier_colors = {
@@ -178,27 +140,10 @@ tier_colors = {
     ]
 }
 
-# Game variables
-game_started = False # Game state
-game_over = False # Game over state
-level_completed = False # Level completion state
-difficulty_selected = False # Difficulty state
-level = 0 # Current level
-attempts = 4 # Number of attempts
-guessed_letters = set() # Set to store guessed letters
-selected_word = "" # Word to guess
-selected_difficulty = "" # Selected difficulty
-shuffled_words = {}  # List of non-repeating words per game
-game_mode = "classic"  # Game mode (classic or timed)
-word_timer = 0  # Timer for timed mode
-word_start_time = 0  # Start time for current word
-is_paused = False  # Track pause state
-pause_start_time = 0  # Track when pause started
-total_pause_time = 0  # Track total time spent paused
-
-# Separate leaderboards for classic and timed modes
+# Separate leaderboards for classic, timed and evil modes
 CLASSIC_LEADERBOARD_FILE = "data/classic_leaderboard.json"
 TIMED_LEADERBOARD_FILE = "data/timed_leaderboard.json"
+EVIL_LEADERBOARD_FILE = "data/evil_leaderboard.json"
 
 # Load Sounds
 correct_sound = pygame.mixer.Sound("assets/sounds/correct.mp3")
@@ -231,7 +176,12 @@ def save_player_data(data):
 # Update a specific player's record
 def update_player_record(uid, duration, level, game_mode):
     # Only update records for the current game mode
-    leaderboard_file = TIMED_LEADERBOARD_FILE if game_mode == "timed" else CLASSIC_LEADERBOARD_FILE
+    if game_mode == "timed":
+        leaderboard_file = TIMED_LEADERBOARD_FILE
+    elif game_mode == "evil":
+        leaderboard_file = EVIL_LEADERBOARD_FILE
+    else:
+        leaderboard_file = CLASSIC_LEADERBOARD_FILE
     
     try:
         # Load existing data for the current mode only
@@ -240,26 +190,8 @@ def update_player_record(uid, duration, level, game_mode):
             with open(leaderboard_file, 'r') as f:
                 data = json.load(f)
 
-        # Calculate stars based on game mode and new requirements
-        if game_mode == "timed":
-            # For timed mode, count correctly guessed words
-            correct_words = level  # level represents correctly guessed words
-            stars = 0
-            if correct_words >= 15:
-                stars = 3
-            elif correct_words >= 10:
-                stars = 2
-            elif correct_words >= 5:
-                stars = 1
-        else:
-            # Classic mode - stars based on levels completed
-            stars = 0
-            if level >= 15:
-                stars = 3
-            elif level >= 10:
-                stars = 2
-            elif level >= 5:
-                stars = 1
+        # Calculate stars (timed mode passes correctly guessed words as level)
+        stars = engine.calculate_stars(level)
 
         # Create new record
         new_record = {
@@ -333,10 +265,10 @@ def show_game_manual():
     manual_running = True
     clock = pygame.time.Clock()
 
-    title_font = pygame.font.Font(None, 30)
-    text_font = pygame.font.Font(None, 20)
+    title_font = get_font(30)
+    text_font = get_font(20)
 
-    title = title_font.render("Game Manual", True, BLACK)
+    title = TEXT_CACHE.render(title_font, "Game Manual", True, BLACK)
 
     # Load icons
     icon_paths = [
@@ -387,11 +319,12 @@ def show_game_manual():
             y_pos = 60 + i * 30
             icon = pygame.transform.scale(icon, (24, 24))
             manual_surface.blit(icon, (25, y_pos))
-            text = text_font.render(line, True, (0, 0, 0))
+            text = TEXT_CACHE.render(text_font, line, True, (0, 0, 0))
             manual_surface.blit(text, (60, y_pos))
 
         screen.blit(manual_surface, (50, 50))
-        pygame.display.flip()
+        display_regions.enter("manual")  # Nothing changes after the first frame
+        display_regions.flush()
         clock.tick(30)
 
 # Define the welcome screen function
@@ -416,7 +349,10 @@ def welcome_screen():
         # Display the welcome GIF frame
         screen.blit(welcome_frames[frame_index], (0, 0))
 
-        pygame.display.flip()
+        display_regions.enter("welcome")
+        if total_frames > 1:
+            display_regions.add(screen.get_rect())  # Every GIF frame covers the screen
+        display_regions.flush()
 
         frame_index = (frame_index + 1) % total_frames
         clock.tick(15)
@@ -433,14 +369,14 @@ def uid_screen():
 
     uid_input = ""
     input_active = False
-    font = pygame.font.Font(None, 40)
+    font = get_font(40)
     input_box = pygame.Rect(WIDTH // 2 - 150, HEIGHT // 2 + 10, 300, 50)
     color_inactive = pygame.Color('lightskyblue3')
     color_active = pygame.Color('dodgerblue2')
     color = color_inactive
 
     # Random name button
-    button_font = pygame.font.Font(None, 32)
+    button_font = get_font(32)
     random_button = pygame.Rect(WIDTH // 2 - 75, HEIGHT // 2 + 85, 150, 40)
     random_button_color = (50, 150, 205)  # Base color for random button
 
@@ -478,18 +414,18 @@ def uid_screen():
         frame_index = (frame_index + 1) % total_frames
 
         # Draw label above input box
-        label_font = pygame.font.Font(None, 25)
-        label_surface = label_font.render("Enter player name", True, BLACK)
+        label_font = get_font(25)
+        label_surface = TEXT_CACHE.render(label_font, "Enter player name", True, BLACK)
         label_rect = label_surface.get_rect(center=(WIDTH // 2, input_box.y - 20))
         screen.blit(label_surface, label_rect)
 
         # Draw input box
         pygame.draw.rect(screen, color, input_box, 2)
-        text_surface = font.render(uid_input, True, BLACK)
+        text_surface = TEXT_CACHE.render(font, uid_input, True, BLACK)
         screen.blit(text_surface, (input_box.x + 10, input_box.y + 10))
 
         # Draw "or" below input box
-        or_surface = label_font.render("or", True, BLACK)
+        or_surface = TEXT_CACHE.render(label_font, "or", True, BLACK)
         or_rect = or_surface.get_rect(center=(WIDTH // 2, input_box.y + 60))
         screen.blit(or_surface, or_rect)
 
@@ -497,7 +433,7 @@ def uid_screen():
         mouse_pos = pygame.mouse.get_pos()
         current_random_color = get_hover_color(random_button_color) if random_button.collidepoint(mouse_pos) else random_button_color
         pygame.draw.rect(screen, current_random_color, random_button, border_radius=8)
-        button_text = button_font.render("Random", True, WHITE)
+        button_text = TEXT_CACHE.render(button_font, "Random", True, WHITE)
         text_rect = button_text.get_rect(center=(
             random_button.x + random_button.width // 2,
             random_button.y + random_button.height // 2
@@ -506,38 +442,74 @@ def uid_screen():
 
         # Draw "?" help/manual button
         pygame.draw.circle(screen, (200, 200, 200), help_button.center, 18)
-        help_font = pygame.font.Font(None, 28)
-        help_text = help_font.render("?", True, BLACK)
+        help_font = get_font(28)
+        help_text = TEXT_CACHE.render(help_font, "?", True, BLACK)
         screen.blit(help_text, help_text.get_rect(center=help_button.center))
 
-        pygame.display.flip()
+        display_regions.enter("uid")
+        if total_frames > 1:
+            display_regions.add(screen.get_rect())  # Every GIF frame covers the screen
+        else:
+            display_regions.extend((input_box, random_button, help_button))  # Typed name and hover colors
+        display_regions.flush()
         clock.tick(15)
 
     # Move to the game after UID is submitted
     play_spellout(uid_input)
 
+# Function to read a savegame from before binary snapshots
+def load_legacy_save():
+    """The GameState saved in data/savegame.json, or None."""
+    if not os.path.exists(LEGACY_SAVEGAME_FILE):
+        return None
+    print("Save file exists.")
+    with open(LEGACY_SAVEGAME_FILE, "r") as f:
+        try:
+            saved_state = json.load(f)
+        except json.JSONDecodeError as e:
+            print("Error decoding save file:", e)
+            return None
+    required_keys = ["selected_difficulty", "level", "guessed_letters", "attempts", "uid"]
+    has_word = "word_id" in saved_state or "selected_word" in saved_state  # Older saves stored the word dict
+    if not has_word or not all(key in saved_state for key in required_keys):
+        print("Save file missing required keys.")
+        return None
+
+    game = GameState(saved_state["uid"])
+    game.game_started = True
+    game.game_mode = "classic"
+    game.selected_difficulty = saved_state["selected_difficulty"]
+    game.level = saved_state["level"]
+    game.guessed_letters = saved_state["guessed_letters"]
+    if isinstance(game.guessed_letters, list):  # Older saves stored a list of letters
+        game.guessed_letters = letter_mask("".join(game.guessed_letters))
+    game.attempts = saved_state["attempts"]
+    # Rebuild the word samplers (older saves stored word lists; those start a fresh order)
+    game.word_samplers = {
+        tier: WordSampler(engine.sampler_size(tier, MAX_PANEL_CELLS), seed, cursor)
+        for tier, (seed, cursor) in saved_state.get("word_samplers", {}).items()
+    }
+    if "word_id" in saved_state:
+        try:
+            word_id = saved_state["word_id"]
+            game.selected_word = engine.word_for_id(game.level, word_id) if word_id >= 0 else None
+        except (IndexError, KeyError, TypeError):
+            game.selected_word = None
+        if game.selected_word is None:  # The word list changed since the save: play a new word
+            print("Saved word is no longer in the word list; starting a new word.")
+            game.guessed_letters = 0
+            game.attempts = MAX_ATTEMPTS
+            game.selected_word = get_word_for_level(game)
+    else:
+        saved_word = saved_state["selected_word"]
+        game.selected_word = Word(saved_word["word"], saved_word["clue"], get_current_tier(game.level))
+    return game
+
 # Function to resume the game
 def resume_prompt_screen():
-    global game_started, difficulty_selected, selected_difficulty, level, guessed_letters, selected_word, attempts, shuffled_words
-
     print("[DEBUG] Checking for saved game state...")
-    # Load saved state if available
-    saved_state = None
-    if os.path.exists("data/savegame.json"):
-        print("Save file exists.")
-        with open("data/savegame.json", "r") as f:
-            try:
-                saved_state = json.load(f)
-                print("Save file loaded:", saved_state)
-                required_keys = ["selected_difficulty", "level", "guessed_letters", "selected_word", "attempts", "shuffled_words", "uid"]
-                if not all(key in saved_state for key in required_keys):
-                    print("Save file missing required keys.")
-                    saved_state = None
-                else:
-                    print("Save file has all required keys.")
-            except json.JSONDecodeError as e:
-                print("Error decoding save file:", e)
-                saved_state = None
+    # Load the saved session if available (binary snapshot, or a save from an older version)
+    saved_game = read_snapshot(SAVEGAME_FILE, MAX_PANEL_CELLS) or load_legacy_save()
 
     # Button dimensions and positioning
     button_width = 160
@@ -559,14 +531,17 @@ def resume_prompt_screen():
         screen.blit(resume_frames[frame_index], (0, 0))
         frame_index = (frame_index + 1) % total_frames
 
-        if saved_state:
+        if saved_game:
             # Draw resume button with consistent styling
             pygame.draw.rect(screen, BLUE, resume_button, border_radius=8)
-            resume_text = BUTTON_FONT.render("Resume Game", True, WHITE)
+            resume_text = TEXT_CACHE.render(BUTTON_FONT, "Resume Game", True, WHITE)
             text_rect = resume_text.get_rect(center=resume_button.center)
             screen.blit(resume_text, text_rect)
 
-        pygame.display.flip()
+        display_regions.enter("resume")
+        if total_frames > 1:
+            display_regions.add(screen.get_rect())  # Every GIF frame covers the screen
+        display_regions.flush()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -576,24 +551,15 @@ def resume_prompt_screen():
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
                     # Clear saved game and proceed to UID screen
-                    if os.path.exists("data/savegame.json"):
-                        os.remove("data/savegame.json")
+                    for path in (SAVEGAME_FILE, LEGACY_SAVEGAME_FILE):
+                        if os.path.exists(path):
+                            os.remove(path)
                     uid_screen()
                     return
 
-            elif event.type == pygame.MOUSEBUTTONDOWN and saved_state:
+            elif event.type == pygame.MOUSEBUTTONDOWN and saved_game:
                 if resume_button.collidepoint(pygame.mouse.get_pos()):
-                    # Restore game variables
-                    game_started = True
-                    difficulty_selected = True
-                    selected_difficulty = saved_state["selected_difficulty"]
-                    level = saved_state["level"]
-                    guessed_letters = set(saved_state["guessed_letters"])
-                    selected_word = saved_state["selected_word"]
-                    attempts = saved_state["attempts"]
-                    shuffled_words = saved_state["shuffled_words"]
-                    uid_input = saved_state["uid"]
-                    play_spellout(uid_input, resumed=True)
+                    play_spellout(saved_game.player_uid, saved_game)
                     return
 
         clock.tick(15)  # Control animation speed
@@ -633,9 +599,9 @@ def display_leaderboard(uid_input):
     x_button = pygame.Rect(WIDTH - 50, 20, 25, 25)
 
     # Title
-    title_font = pygame.font.Font(None, 36)
-    list_font = pygame.font.Font(None, 20)
-    mode_font = pygame.font.Font(None, 28)
+    title_font = get_font(36)
+    list_font = get_font(20)
+    mode_font = get_font(28)
 
     # Mode selection buttons - positioned relative to board_surface
     classic_button = pygame.Rect(board_surface.get_width() // 4 - 50, 20, 100, 30)
@@ -666,7 +632,7 @@ def display_leaderboard(uid_input):
             base_color = BLUE if mode == current_mode else GRAY
             color = get_hover_color(base_color) if button.collidepoint(board_pos) else base_color
             pygame.draw.rect(board_surface, color, button, border_radius=5)
-            text_surface = mode_font.render(text, True, WHITE if mode == current_mode else BLACK)
+            text_surface = TEXT_CACHE.render(mode_font, text, True, WHITE if mode == current_mode else BLACK)
             text_rect = text_surface.get_rect(center=button.center)
             board_surface.blit(text_surface, text_rect)
 
@@ -716,7 +682,7 @@ def display_leaderboard(uid_input):
                 # Draw player info
                 text_color = (0, 100, 200) if uid == uid_input else BLACK
                 player_info = f"{uid} - Level: {level} - {duration:.2f}s"
-                player_surface = list_font.render(player_info, True, text_color)
+                player_surface = TEXT_CACHE.render(list_font, player_info, True, text_color)
                 board_surface.blit(player_surface, (65, y_offset))
                 
                 # Draw stars - moved further right
@@ -739,7 +705,7 @@ def display_leaderboard(uid_input):
                 duration = record["duration"]
                 stars = record["stars"]
                 player_info = f"{player_rank}. {uid_input} - Level: {level} - {duration:.2f}s"
-                player_surface = list_font.render(player_info, True, (0, 100, 200))
+                player_surface = TEXT_CACHE.render(list_font, player_info, True, (0, 100, 200))
                 board_surface.blit(player_surface, (30, y_offset))
                 
                 # Draw stars for current player - moved further right
@@ -749,13 +715,15 @@ def display_leaderboard(uid_input):
                     star_x += 20
 
         else:
-            empty_msg = list_font.render("No data available.", True, (100, 0, 0))
+            empty_msg = TEXT_CACHE.render(list_font, "No data available.", True, (100, 0, 0))
             board_surface.blit(empty_msg, (board_surface.get_width() // 2 - empty_msg.get_width() // 2, y_offset))
 
         # Draw everything
         screen.blit(board_surface, (50, 50))
         screen.blit(x_icon, x_button.topleft)
-        pygame.display.flip()
+        display_regions.enter(("leaderboard", current_mode))
+        display_regions.extend((classic_button.move(50, 50), timed_button.move(50, 50)))  # Hover colors
+        display_regions.flush()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -799,9 +767,9 @@ def show_last_record(uid_input):
     manual_surface.fill((240, 240, 240))
     pygame.draw.rect(manual_surface, BLACK, manual_surface.get_rect(), 3)
 
-    title_font = pygame.font.Font(None, 36)
-    info_font = pygame.font.Font(None, 26)
-    mode_font = pygame.font.Font(None, 28)
+    title_font = get_font(36)
+    info_font = get_font(26)
+    mode_font = get_font(28)
 
     # Mode selection buttons
     classic_button = pygame.Rect(manual_surface.get_width() // 4 - 50, 20, 100, 30)
@@ -832,7 +800,7 @@ def show_last_record(uid_input):
             base_color = BLUE if mode == current_mode else GRAY
             color = get_hover_color(base_color) if button.collidepoint(board_pos) else base_color
             pygame.draw.rect(manual_surface, color, button, border_radius=5)
-            text_surface = mode_font.render(text, True, WHITE if mode == current_mode else BLACK)
+            text_surface = TEXT_CACHE.render(mode_font, text, True, WHITE if mode == current_mode else BLACK)
             text_rect = text_surface.get_rect(center=button.center)
             manual_surface.blit(text_surface, text_rect)
 
@@ -859,19 +827,19 @@ def show_last_record(uid_input):
 
             # Change text based on game mode
             if current_mode == "classic":
-                level_text = info_font.render(f"Levels Completed: {level}", True, BLACK)
+                level_text = TEXT_CACHE.render(info_font, f"Levels Completed: {level}", True, BLACK)
             else:  # timed mode
-                level_text = info_font.render(f"Words Completed: {level}", True, BLACK)
+                level_text = TEXT_CACHE.render(info_font, f"Words Completed: {level}", True, BLACK)
             manual_surface.blit(level_text, (50, y_offset))
 
-            duration_text = info_font.render(f"Duration: {duration:.2f}s", True, BLACK)
+            duration_text = TEXT_CACHE.render(info_font, f"Duration: {duration:.2f}s", True, BLACK)
             manual_surface.blit(duration_text, (50, y_offset + spacing))
 
-            last_played_text = info_font.render(f"Last Played: {last_played}", True, BLACK)
+            last_played_text = TEXT_CACHE.render(info_font, f"Last Played: {last_played}", True, BLACK)
             manual_surface.blit(last_played_text, (50, y_offset + spacing * 2))
 
         else:
-            error_msg = info_font.render("No record found for this player.", True, (200, 0, 0))
+            error_msg = TEXT_CACHE.render(info_font, "No record found for this player.", True, (200, 0, 0))
             manual_surface.blit(error_msg, (manual_surface.get_width() // 2 - error_msg.get_width() // 2, 120))
 
         # Blit manual_surface to main screen
@@ -880,7 +848,9 @@ def show_last_record(uid_input):
         # Draw X (back) icon on the main screen
         screen.blit(x_icon, x_button.topleft)
 
-        pygame.display.flip()
+        display_regions.enter(("last_record", current_mode))
+        display_regions.extend((classic_button.move(50, 50), timed_button.move(50, 50)))  # Hover colors
+        display_regions.flush()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -927,7 +897,7 @@ def draw_game_controls(player_name=None, state='start'):
     
     # Calculate total height of elements based on state
     if state == 'start':
-        total_height = 30 + button_height + spacing + button_height  # Title + 2 buttons + spacing
+        total_height = 30 + button_height + spacing * 2 + button_height  # Title + 3 buttons + spacings
         vertical_offset = pre_game_offset
         text_color = pre_game_text_color
     else:
@@ -941,9 +911,9 @@ def draw_game_controls(player_name=None, state='start'):
     button_x = WIDTH // 2 - button_width // 2
     current_y = start_y + 30  # Adjust this value (30) to change space between title and first button
 
-    font = pygame.font.Font(None, 35)
-    button_font = pygame.font.Font(None, 25)
-    button_rects = {"classic": None, "timed": None, "quit": None, "leaderboard": None, "last_record": None}
+    font = get_font(35)
+    button_font = get_font(25)
+    button_rects = {"classic": None, "timed": None, "evil": None, "quit": None, "leaderboard": None, "last_record": None}
 
     # Get mouse position for hover effects
     mouse_pos = pygame.mouse.get_pos()
@@ -959,14 +929,14 @@ def draw_game_controls(player_name=None, state='start'):
         text = f"Welcome {player_name}!"
         
         # Title Text - Position controlled by start_y
-        text_surface = font.render(text, True, text_color)
+        text_surface = TEXT_CACHE.render(font, text, True, text_color)
         screen.blit(text_surface, text_surface.get_rect(center=(WIDTH // 2, start_y)))
 
         # CLASSIC MODE button - Position controlled by current_y
         classic_rect = pygame.Rect(button_x, current_y, button_width, button_height)
         classic_color = get_hover_color(button_color) if classic_rect.collidepoint(mouse_pos) else button_color
         pygame.draw.rect(screen, classic_color, classic_rect, border_radius=8)
-        classic_surface = button_font.render("CLASSIC MODE", True, text_button_color)
+        classic_surface = TEXT_CACHE.render(button_font, "CLASSIC MODE", True, text_button_color)
         screen.blit(classic_surface, classic_surface.get_rect(center=(WIDTH // 2, current_y + button_height // 2)))
         button_rects["classic"] = classic_rect
 
@@ -975,10 +945,19 @@ def draw_game_controls(player_name=None, state='start'):
         timed_rect = pygame.Rect(button_x, current_y, button_width, button_height)
         timed_color = get_hover_color(leaderboard_button_color) if timed_rect.collidepoint(mouse_pos) else leaderboard_button_color
         pygame.draw.rect(screen, timed_color, timed_rect, border_radius=8)
-        timed_surface = button_font.render("TIMED MODE", True, text_button_color)
+        timed_surface = TEXT_CACHE.render(button_font, "TIMED MODE", True, text_button_color)
         screen.blit(timed_surface, timed_surface.get_rect(center=(WIDTH // 2, current_y + button_height // 2)))
         button_rects["timed"] = timed_rect
 
+        # EVIL MODE button - Position controlled by current_y + spacing
+        current_y += button_height + spacing
+        evil_rect = pygame.Rect(button_x, current_y, button_width, button_height)
+        evil_color = get_hover_color(quit_button_color) if evil_rect.collidepoint(mouse_pos) else quit_button_color
+        pygame.draw.rect(screen, evil_color, evil_rect, border_radius=8)
+        evil_surface = TEXT_CACHE.render(button_font, "EVIL MODE", True, text_button_color)
+        screen.blit(evil_surface, evil_surface.get_rect(center=(WIDTH // 2, current_y + button_height // 2)))
+        button_rects["evil"] = evil_rect
+
     elif state in ('over', 'complete'):
         if state == 'over':
             text = "GAME OVER! Want to try again?"
@@ -987,14 +966,14 @@ def draw_game_controls(player_name=None, state='start'):
         play_text = "PLAY AGAIN"
 
         # Title Text - Position controlled by start_y
-        text_surface = font.render(text, True, text_color)
+        text_surface = TEXT_CACHE.render(font, text, True, text_color)
         screen.blit(text_surface, text_surface.get_rect(center=(WIDTH // 2, start_y)))
 
         # PLAY AGAIN button - Position controlled by current_y
         play_rect = pygame.Rect(button_x, current_y, button_width, button_height)
         play_color = get_hover_color(button_color) if play_rect.collidepoint(mouse_pos) else button_color
         pygame.draw.rect(screen, play_color, play_rect, border_radius=8)
-        play_surface = button_font.render(play_text, True, text_button_color)
+        play_surface = TEXT_CACHE.render(button_font, play_text, True, text_button_color)
         screen.blit(play_surface, play_surface.get_rect(center=(WIDTH // 2, current_y + button_height // 2)))
         button_rects["classic"] = play_rect
 
@@ -1003,7 +982,7 @@ def draw_game_controls(player_name=None, state='start'):
         lb_rect = pygame.Rect(button_x, current_y, button_width, button_height)
         lb_color = get_hover_color(leaderboard_button_color) if lb_rect.collidepoint(mouse_pos) else leaderboard_button_color
         pygame.draw.rect(screen, lb_color, lb_rect, border_radius=8)
-        lb_surface = button_font.render("LEADERBOARD", True, text_button_color)
+        lb_surface = TEXT_CACHE.render(button_font, "LEADERBOARD", True, text_button_color)
         screen.blit(lb_surface, lb_surface.get_rect(center=(WIDTH // 2, current_y + button_height // 2)))
         button_rects["leaderboard"] = lb_rect
 
@@ -1012,7 +991,7 @@ def draw_game_controls(player_name=None, state='start'):
         lr_rect = pygame.Rect(button_x, current_y, button_width, button_height)
         lr_color = get_hover_color(last_record_button_color) if lr_rect.collidepoint(mouse_pos) else last_record_button_color
         pygame.draw.rect(screen, lr_color, lr_rect, border_radius=8)
-        lr_surface = button_font.render("LAST RECORD", True, text_button_color)
+        lr_surface = TEXT_CACHE.render(button_font, "LAST RECORD", True, text_button_color)
         screen.blit(lr_surface, lr_surface.get_rect(center=(WIDTH // 2, current_y + button_height // 2)))
         button_rects["last_record"] = lr_rect
 
@@ -1021,19 +1000,16 @@ def draw_game_controls(player_name=None, state='start'):
         quit_rect = pygame.Rect(button_x, current_y, button_width, button_height)
         quit_color = get_hover_color(quit_button_color) if quit_rect.collidepoint(mouse_pos) else quit_button_color
         pygame.draw.rect(screen, quit_color, quit_rect, border_radius=8)
-        quit_surface = button_font.render("QUIT", True, text_button_color)
+        quit_surface = TEXT_CACHE.render(button_font, "QUIT", True, text_button_color)
         screen.blit(quit_surface, quit_surface.get_rect(center=(WIDTH // 2, current_y + button_height // 2)))
         button_rects["quit"] = quit_rect
 
     return button_rects
 
 # Functions to save the game state
-def pause_menu(uid_input, level, attempts, guessed_letters, selected_word, selected_difficulty, shuffled_words):
-    global is_paused, pause_start_time, total_pause_time
-    
+def pause_menu(game):
     paused = True
-    is_paused = True
-    pause_start_time = time.time()
+    game.pause()
     
     overlay = pygame.Surface((WIDTH, HEIGHT))
     overlay.set_alpha(180)
@@ -1052,8 +1028,33 @@ def pause_menu(uid_input, level, attempts, guessed_letters, selected_word, selec
     save_exit_button = pygame.Rect(WIDTH//2 - button_width//2, start_y + (button_height + button_spacing) * 2, button_width, button_height)
 
     # Title font
-    title_font = pygame.font.Font(None, 48)
-    button_font = pygame.font.Font(None, 30)
+    title_font = get_font(48)
+    button_font = get_font(30)
+
+    # The pause screen does not change, so it is drawn and pushed once
+    screen.blit(overlay, (0, 0))
+
+    # Draw title
+    title_text = TEXT_CACHE.render(title_font, "GAME PAUSED", True, WHITE)
+    title_rect = title_text.get_rect(center=(WIDTH//2, start_y - 50))
+    screen.blit(title_text, title_rect)
+
+    # Draw buttons with consistent styling
+    for button, text, color in [
+        (resume_button, "Resume", BLUE),
+        (save_button, "Save", NORMAL_COLOR),
+        (save_exit_button, "Save and Exit", ORANGE)
+    ]:
+        # Draw button with rounded corners
+        pygame.draw.rect(screen, color, button, border_radius=8)
+        
+        # Draw button text
+        text_surface = TEXT_CACHE.render(button_font, text, True, WHITE)
+        text_rect = text_surface.get_rect(center=button.center)
+        screen.blit(text_surface, text_rect)
+
+    display_regions.enter("pause")
+    display_regions.flush()
 
     while paused:
         for event in pygame.event.get():
@@ -1063,86 +1064,25 @@ def pause_menu(uid_input, level, attempts, guessed_letters, selected_word, selec
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     paused = False  # Resume
-                    is_paused = False
-                    total_pause_time += time.time() - pause_start_time
+                    game.resume()
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 pos = pygame.mouse.get_pos()
                 if resume_button.collidepoint(pos):
                     paused = False
-                    is_paused = False
-                    total_pause_time += time.time() - pause_start_time
+                    game.resume()
                 elif save_button.collidepoint(pos):
-                    save_game_state(
-                        uid_input,
-                        level,
-                        attempts,
-                        guessed_letters,
-                        selected_word,
-                        selected_difficulty,
-                        shuffled_words
-                    )
+                    save_game_state(game)
                 elif save_exit_button.collidepoint(pos):
-                    save_game_state(
-                        uid_input,
-                        level,
-                        attempts,
-                        guessed_letters,
-                        selected_word,
-                        selected_difficulty,
-                        shuffled_words
-                    )
+                    save_game_state(game)
                     pygame.quit()
                     sys.exit()
 
-        screen.blit(overlay, (0, 0))
-
-        # Draw title
-        title_text = title_font.render("GAME PAUSED", True, WHITE)
-        title_rect = title_text.get_rect(center=(WIDTH//2, start_y - 50))
-        screen.blit(title_text, title_rect)
-
-        # Draw buttons with consistent styling
-        for button, text, color in [
-            (resume_button, "Resume", BLUE),
-            (save_button, "Save", NORMAL_COLOR),
-            (save_exit_button, "Save and Exit", ORANGE)
-        ]:
-            # Draw button with rounded corners
-            pygame.draw.rect(screen, color, button, border_radius=8)
-            
-            # Draw button text
-            text_surface = button_font.render(text, True, WHITE)
-            text_rect = text_surface.get_rect(center=button.center)
-            screen.blit(text_surface, text_rect)
-
-        pygame.display.flip()
         pygame.time.delay(100)
 
-def save_game_state(uid_input, level, attempts, guessed_letters, selected_word, selected_difficulty, shuffled_words):
-    save_data = {
-        'uid': uid_input,
-        'level': level,
-        'attempts': attempts,
-        'guessed_letters': list(guessed_letters),
-        'selected_word': selected_word,
-        'selected_difficulty': selected_difficulty,
-        'shuffled_words': shuffled_words
-    }
-
-    with open("data/savegame.json", "w") as f:
-        json.dump(save_data, f)
-    
+def save_game_state(game):
+    write_snapshot(game, SAVEGAME_FILE)
     print("[💾] Game state saved.")
 
-# Function to get current tier based on level
-def get_current_tier(level):
-    if level <= 5:
-        return "Easy"
-    elif level <= 10:
-        return "Normal"
-    else:
-        return "Hard"
-
 # Function to get background color based on level
 def get_background_color(level):
     current_tier = get_current_tier(level)
@@ -1165,8 +1105,8 @@ def show_tier_completion(screen, tier, stars):
     star_icon = pygame.transform.scale(star_icon, (50, 50))
 
     # Display congratulations text
-    font = pygame.font.Font(None, 48)
-    text = font.render(f"{tier} Tier Complete!", True, WHITE)
+    font = get_font(48)
+    text = TEXT_CACHE.render(font, f"{tier} Tier Complete!", True, WHITE)
     text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
     screen.blit(text, text_rect)
 
@@ -1176,12 +1116,13 @@ def show_tier_completion(screen, tier, stars):
         screen.blit(star_icon, (star_x + i * 60, HEIGHT // 2 + 20))
 
     # Display "Press any key to continue"
-    continue_font = pygame.font.Font(None, 24)
-    continue_text = continue_font.render("Press any key to continue", True, WHITE)
+    continue_font = get_font(24)
+    continue_text = TEXT_CACHE.render(continue_font, "Press any key to continue", True, WHITE)
     continue_rect = continue_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 100))
     screen.blit(continue_text, continue_rect)
 
-    pygame.display.flip()
+    display_regions.enter(("tier_complete", tier))
+    display_regions.flush()
 
     # Wait for key press
     waiting = True
@@ -1194,32 +1135,34 @@ def show_tier_completion(screen, tier, stars):
                 waiting = False
 
 # Function to get a word based on current level
-def get_word_for_level(level):
+def get_word_for_level(game):
     """Get a word appropriate for the current level.
-    Maintains separate shuffled lists for each tier."""
-    global shuffled_words
-    
-    # Initialize shuffled_words as a dictionary if it doesn't exist
-    if not isinstance(shuffled_words, dict):
-        shuffled_words = {
-            "Easy": [],
-            "Normal": [],
-            "Hard": []
-        }
-    
-    current_tier = get_current_tier(level)
-    
-    # If the current tier's list is empty, refill it
-    if not shuffled_words[current_tier]:
-        shuffled_words[current_tier] = words_by_tier[current_tier][:]
-        random.shuffle(shuffled_words[current_tier])
-    
-    return shuffled_words[current_tier].pop()
+    Each tier has its own no-repeat word sampler, drawing only words that fit
+    the word panel (MAX_PANEL_CELLS) and skipping words the player saw in
+    recent games. In evil mode the drawn
+    word only picks the length; every tier word of that length stays possible."""
+    engine.release_passed_tiers(game.level, game.word_samplers, session=game)  # Tier words load on first use; passed tiers are freed
+    selected_word = engine.get_word_for_level(game.level, game.word_samplers, max_cells=MAX_PANEL_CELLS, seen=game.seen_words)
+    if game.seen_words is not None:
+        seen_words_file.put(game.player_uid, game.seen_words)
+    if game.game_mode != "evil":
+        game.evil_family = None
+        return selected_word
+
+    game.evil_family = family_for(selected_word, words_by_tier[get_current_tier(game.level)])
+    return game.evil_family.representative()
+
+# Function to let evil mode dodge a guess
+def evil_guess(game, letter):
+    """Keep the largest word family for this guess and return the word to show."""
+    game.evil_family.guess(letter)
+    return game.evil_family.representative()
 
 # 🔵 Function to draw level indicators (updated for 15 levels)
-def draw_levels(level):
-    if not game_started or game_over:
+def draw_levels(game):
+    if not game.game_started or game.game_over:
         return  # Draw levels only if the game is active
+    level = game.level
     
     x_start = 20  
     y_start = 20  
@@ -1258,13 +1201,35 @@ def draw_levels(level):
         pygame.draw.circle(screen, color, (x_pos, y_pos), radius)
         pygame.draw.circle(screen, BLACK, (x_pos, y_pos), radius, 2)
 
+    step = radius * 2 + spacing
+    return pygame.Rect(x_start - radius, y_start - radius, 2 * step + radius * 2, 4 * step + radius * 2)  # Area drawn
+
+# Function to draw the boxes one letter fills (used right after a correct guess)
+def draw_revealed_cells(game, letter):
+    """Draw only the word boxes revealed by `letter` and return their rects."""
+    colors = TIER_COLORS[get_current_tier(game.level)]
+    word = game.selected_word
+    x_start = WIDTH // 2 - (word.display_length * 45) // 2
+    y_start = 150
+    cell_size = 40
+
+    dirty_rects = []
+    for cell in word.positions.get(letter, ()):
+        cell_rect = pygame.Rect(x_start + word.columns[cell] * (cell_size + 5), y_start, cell_size, cell_size)
+        pygame.draw.rect(screen, colors["word_box"], cell_rect, border_radius=5)
+        LETTER_GLYPHS.blit_centered(screen, letter, colors["tier_text"], cell_rect.center)
+        dirty_rects.append(cell_rect)
+    return dirty_rects
+
 # 🔡 Function to draw word with rectangles and display category
-def draw_word(selected_word, guessed_letters):
-    if not game_started or game_over:
+def draw_word(game):
+    if not game.game_started or game.game_over:
         return  # Only draw if game is active
+    selected_word = game.selected_word
+    guessed_letters = game.guessed_letters
 
     # Get current tier colors
-    current_tier = get_current_tier(level)
+    current_tier = get_current_tier(game.level)
     colors = TIER_COLORS[current_tier]
 
     # 🏷️ Display Tier and Category Name
@@ -1273,41 +1238,41 @@ def draw_word(selected_word, guessed_letters):
     category_text = f"Category: {category_name}"
     
     # Render tier text
-    tier_surface = CATEGORY_FONT.render(tier_text, True, colors["tier_text"])
+    tier_surface = TEXT_CACHE.render(CATEGORY_FONT, tier_text, True, colors["tier_text"])
     tier_rect = tier_surface.get_rect(center=(WIDTH // 2, 110))
     screen.blit(tier_surface, tier_rect)
     
     # Render category text
-    category_surface = CATEGORY_FONT.render(category_text, True, colors["tier_text"])
+    category_surface = TEXT_CACHE.render(CATEGORY_FONT, category_text, True, colors["tier_text"])
     category_rect = category_surface.get_rect(center=(WIDTH // 2, 130))
     screen.blit(category_surface, category_rect)
 
-    # 🧩 Draw Word Panel
-    word = selected_word['word']  # Extract the word from selected_word
-    clue = selected_word['clue']  # Extract the clue from selected_word
-    x_start = WIDTH // 2 - (len(word.replace(" ", "")) * 45) // 2  # Adjust for spaces
+    # 🧩 Draw Word Panel (layout precomputed in the Word record)
+    columns = selected_word.columns
+    x_start = WIDTH // 2 - (selected_word.display_length * 45) // 2  # Spaces have no box
     y_start = 150
     cell_size = 40
 
-    # Draw the word's letters
-    for i, letter in enumerate(word):
-        # Adjust position for spaces (no rectangle drawn for spaces)
-        if letter == " ":
-            x_start += cell_size + 5  # Skip space area
-            continue
-
-        rect_x = x_start + i * (cell_size + 5)  # Normal letter positions
+    # Draw a box per letter
+    for column in columns:
+        rect_x = x_start + column * (cell_size + 5)
         pygame.draw.rect(screen, colors["word_box"], (rect_x, y_start, cell_size, cell_size), border_radius=5)
 
-        if letter in guessed_letters:
-            text_surface = LETTER_FONT.render(letter, True, colors["tier_text"])
-            text_rect = text_surface.get_rect(center=(rect_x + cell_size // 2, y_start + cell_size // 2))
-            screen.blit(text_surface, text_rect)
+    # Draw guessed letters straight from the letter -> cells map
+    for letter, cells in selected_word.positions.items():
+        if guessed_letters & LETTER_BITS.get(letter, 0):
+            for cell in cells:
+                rect_x = x_start + columns[cell] * (cell_size + 5)
+                LETTER_GLYPHS.blit_centered(screen, letter, colors["tier_text"], (rect_x + cell_size // 2, y_start + cell_size // 2))
 
-    clue_surface = CLUE_FONT.render(f"Clue: {clue}", True, colors["clue_text"])
+    clue_surface = TEXT_CACHE.render(CLUE_FONT, f"Clue: {selected_word.clue}", True, colors["clue_text"])
     clue_rect = clue_surface.get_rect(center=(WIDTH // 2, y_start + cell_size + 40))
     screen.blit(clue_surface, clue_rect)
 
+    # Area drawn: tier and category labels, panel and clue
+    panel_rect = pygame.Rect(x_start + columns[0] * (cell_size + 5), y_start, (columns[-1] - columns[0]) * (cell_size + 5) + cell_size, cell_size)
+    return tier_rect.unionall([category_rect, panel_rect, clue_rect])
+
 # ⌨️ Function to create a **QWERTY-based virtual keyboard**
 def create_virtual_keyboard():
     keys = {}
@@ -1332,47 +1297,28 @@ def create_virtual_keyboard():
 
     return keys
 
+# ⌨️ Function to make the cached keyboard layer for a game loop
+def create_keyboard_layer():
+    return KeyboardLayer(create_virtual_keyboard(), KEY_GLYPHS, WHITE, (0, 300), (WIDTH, 150))
+
 # ⌨️ Function to draw the virtual keyboard
-def draw_virtual_keyboard(keys, guessed_letters):
-    """Draw the virtual keyboard with proper letter highlighting"""
-    if not game_started or game_over:
-        return # Draw the keyboard only if the game is active
-    
+def draw_virtual_keyboard(game, keyboard):
+    """Draw the virtual keyboard with proper letter highlighting.
+    Only keys whose state changed are repainted on the layer (the whole layer on a new
+    word or tier); the layer is then one blit. Returns the screen rects that changed."""
+    if not game.game_started or game.game_over:
+        return [] # Draw the keyboard only if the game is active
+
     # Get current tier colors
-    current_tier = get_current_tier(level)
-    colors = TIER_COLORS[current_tier]
-    
-    # Create a surface for the keyboard
-    keyboard_surface = pygame.Surface((WIDTH, 150))
-    keyboard_surface.set_colorkey((0, 0, 0))  # Make black transparent
-    
-    # Draw each key on the keyboard surface
-    for letter, rect in keys.items():
-        # Create a new rect relative to the keyboard surface
-        key_rect = pygame.Rect(rect.x, rect.y - 300, rect.width, rect.height)
-        
-        # Determine key color based on whether it's been guessed
-        if letter in guessed_letters:
-            color = colors["keyboard_guessed"]
-        else:
-            color = colors["keyboard"]
-            
-        # Draw the key
-        pygame.draw.rect(keyboard_surface, color, key_rect, border_radius=5)
-        
-        # Draw the letter
-        text_surface = BUTTON_FONT.render(letter, True, WHITE)
-        text_rect = text_surface.get_rect(center=key_rect.center)
-        keyboard_surface.blit(text_surface, text_rect)
-    
-    # Blit the keyboard surface onto the main screen
-    screen.blit(keyboard_surface, (0, 300))
+    colors = TIER_COLORS[get_current_tier(game.level)]
 
-# Function to draw attempt indicators
-def draw_attempts(attempts):
-    global warning_sound # Load warning sound
+    changed_rects = keyboard.update(colors, game.guessed_letters)
+    keyboard.draw(screen)
+    return changed_rects
 
-    if not game_started or game_over:
+# Function to draw attempt indicators
+def draw_attempts(game):
+    if not game.game_started or game.game_over:
         return # Draw attempts only if the game is active
     
     # 📏 Define rectangle positions and sizes
@@ -1382,49 +1328,44 @@ def draw_attempts(attempts):
     spacing = width + 5  # 📏 Adjusted spacing between rectangles
 
     # 🎨 Define X mark font
-    X_FONT = pygame.font.Font(None, 45)  # Slightly larger X
+    X_FONT = get_font(45)  # Slightly larger X
 
-    # 🔄 Loop through 4 attempt slots
-    for i in range(4):
+    # 🔄 Loop through attempt slots
+    for i in range(MAX_ATTEMPTS):
         pygame.draw.rect(screen, RED, 
                          (x_start + (i * spacing), y_start, width, height), 
                          border_radius=5)  # 🟥 Keep all rectangles red
 
     # ❌ Display X marks over the rectangles for every wrong attempt
-    wrong_attempts = 4 - attempts  # 🔢 How many mistakes were made?
+    wrong_attempts = MAX_ATTEMPTS - game.attempts  # 🔢 How many mistakes were made?
 
     for i in range(wrong_attempts):  
         x_pos = x_start + (i * spacing) + 7  # 📌 Adjust X position for centering
         y_pos = y_start + 10  # 📌 Center X within the rectangle
-        text_surface = X_FONT.render("X", True, ORANGE)  # 🎨 X in #fbb316
+        text_surface = TEXT_CACHE.render(X_FONT, "X", True, ORANGE)  # 🎨 X in #fbb316
         screen.blit(text_surface, (x_pos, y_pos))  # 🖥️ Display X mark
 
+    return pygame.Rect(x_start, y_start, (MAX_ATTEMPTS - 1) * spacing + width, height)  # Area drawn
+
 # 🔤 Function to show the word flash
 def show_word_flash(screen, word, color, font):
     screen.fill((255, 255, 255))  # White background
-    text_surface = font.render(word.upper(), True, color)  # Render word in uppercase
+    text_surface = TEXT_CACHE.render(font, word.upper(), True, color)  # Render word in uppercase
     text_rect = text_surface.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))  # Centered position
     screen.blit(text_surface, text_rect)  # Draw text on the screen
-    pygame.display.update()
+    display_regions.enter("word_flash")
+    display_regions.flush()
     pygame.time.delay(1500)  # Pause for 1.5 seconds
 
 # Function to draw timer
-def draw_timer():
-    global total_pause_time
-    
-    current_tier = get_current_tier(level)
-    if game_mode != "timed":
+def draw_timer(game):
+    if game.game_mode != "timed":
         return False
         
-    time_limit = time_limits[current_tier]
-    
-    # Calculate elapsed time accounting for pauses
-    if is_paused:
-        elapsed_time = pause_start_time - word_start_time - total_pause_time
-    else:
-        elapsed_time = time.time() - word_start_time - total_pause_time
+    time_limit = time_limits[get_current_tier(game.level)]
     
-    remaining_time = max(0, time_limit - elapsed_time)
+    # Elapsed time not counting pauses
+    remaining_time = max(0, time_limit - game.word_elapsed())
     
     # Draw timer bar - centered below clue and above keyboard
     bar_width = 200  # Wider bar for better visibility
@@ -1447,10 +1388,11 @@ def draw_timer():
         color = RED  # Red
         
     pygame.draw.rect(screen, color, (bar_x, bar_y, remaining_width, bar_height))
+    display_regions.add((bar_x, bar_y, bar_width, bar_height))  # Changes every frame
     
     # Check if time is up
-    if remaining_time <= 0 and not game_over and not is_paused:
-        show_word_flash(screen, selected_word['word'], RED, FONT)
+    if remaining_time <= 0 and not game.game_over and not game.is_paused:
+        show_word_flash(screen, game.selected_word.word, RED, FONT)
         return True
     return False
 
@@ -1462,28 +1404,27 @@ def handle_word_completion(screen, current_level, game_mode, total_time_bonus):
     - Level 10 completion = moving to level 11 (Normal tier complete)
     - Level 15 = game complete (Hard tier complete)
     """
-    if current_level == 5:  # Completing level 5, moving to level 6
-        show_tier_completion(screen, "Easy", 1)
-        if game_mode == "timed":
-            return 15  # Add 15 seconds bonus
-    elif current_level == 10:  # Completing level 10, moving to level 11
-        show_tier_completion(screen, "Normal", 2)
+    completion = engine.tier_completion(current_level)
+    if completion:
+        tier, stars, time_bonus = completion
+        show_tier_completion(screen, tier, stars)
         if game_mode == "timed":
-            return 30  # Add 30 seconds bonus
-    elif current_level == 15:  # Completing level 15, game complete
-        show_tier_completion(screen, "Hard", 3)
+            return time_bonus  # 15s after Easy, 30s after Normal
     return 0  # No time bonus
 
 # Add these new functions after the get_hover_color function
 
-def animate_word_panel(screen, word, guessed_letters, animation_type, progress):
+def animate_word_panel(screen, game, animation_type, progress):
     """Animate the word panel based on the animation type and progress (0.0 to 1.0)"""
+    word = game.selected_word
+    guessed_letters = game.guessed_letters
+
     # Get current tier colors
-    current_tier = get_current_tier(level)
+    current_tier = get_current_tier(game.level)
     colors = TIER_COLORS[current_tier]
 
     # Base positions and sizes
-    x_start = WIDTH // 2 - (len(word.replace(" ", "")) * 45) // 2
+    x_start = WIDTH // 2 - (word.display_length * 45) // 2
     y_start = 150
     cell_size = 40
 
@@ -1496,24 +1437,23 @@ def animate_word_panel(screen, word, guessed_letters, animation_type, progress):
         # Pop animation for correct guesses
         scale = 1 + 0.15 * math.sin(progress * math.pi)  # Subtler pop effect
         cell_size = int(40 * scale)
-        x_start = WIDTH // 2 - (len(word.replace(" ", "")) * (cell_size + 5)) // 2
+        x_start = WIDTH // 2 - (word.display_length * (cell_size + 5)) // 2
         y_start = 150 - (cell_size - 40) // 2  # Adjust y position to keep center
 
     # Draw the word's letters
-    for i, letter in enumerate(word):
-        if letter == " ":
-            x_start += cell_size + 5
-            continue
-
-        rect_x = x_start + i * (cell_size + 5)
+    for column, letter in zip(word.columns, word.letters):
+        rect_x = x_start + column * (cell_size + 5)
         pygame.draw.rect(screen, colors["word_box"], (rect_x, y_start, cell_size, cell_size), border_radius=5)
 
-        if letter in guessed_letters:
-            text_surface = LETTER_FONT.render(letter, True, colors["tier_text"])
-            text_rect = text_surface.get_rect(center=(rect_x + cell_size // 2, y_start + cell_size // 2))
-            screen.blit(text_surface, text_rect)
+        if guessed_letters & LETTER_BITS.get(letter, 0):
+            LETTER_GLYPHS.blit_centered(screen, letter, colors["tier_text"], (rect_x + cell_size // 2, y_start + cell_size // 2))
+
+    # Area drawn (one pixel wider for the fractional shake offset)
+    left = int(x_start + word.columns[0] * (cell_size + 5))
+    width = (word.columns[-1] - word.columns[0]) * (cell_size + 5) + cell_size
+    return pygame.Rect(left - 1, y_start, width + 2, cell_size)
 
-def animate_word_panel_sequence(screen, word, guessed_letters, animation_type):
+def animate_word_panel_sequence(screen, game, animation_type):
     """Run the animation sequence for the word panel"""
     clock = pygame.time.Clock()
     start_time = time.time()
@@ -1521,6 +1461,7 @@ def animate_word_panel_sequence(screen, word, guessed_letters, animation_type):
 
     # Store the current state of the screen
     screen_copy = screen.copy()
+    panel_rect = None
 
     while True:
         current_time = time.time()
@@ -1529,55 +1470,66 @@ def animate_word_panel_sequence(screen, word, guessed_letters, animation_type):
         if progress >= 1.0:
             break
 
-        # Restore the screen state
-        screen.blit(screen_copy, (0, 0))
+        # Restore the area the last frame drew over
+        if panel_rect:
+            screen.blit(screen_copy, panel_rect, panel_rect)
+            display_regions.add(panel_rect)
 
         # Draw the animated word panel
-        animate_word_panel(screen, word, guessed_letters, animation_type, progress)
-        
-        pygame.display.flip()
+        panel_rect = animate_word_panel(screen, game, animation_type, progress)
+        display_regions.add(panel_rect)
+        display_regions.flush()
         clock.tick(60)
 
-def reveal_word_animation(screen, word, guessed_letters, progress):
-    """Animate the reveal of the correct word"""
+    # Leave the panel as it was before the animation
+    if panel_rect:
+        screen.blit(screen_copy, panel_rect, panel_rect)
+        display_regions.add(panel_rect)
+        display_regions.flush()
+
+def reveal_word_animation(screen, game, first_cell, last_cell):
+    """Reveal the letters in boxes first_cell..last_cell-1 and return the rects drawn.
+    Boxes whose letter was already guessed are showing and are skipped."""
+    word = game.selected_word
+    guessed_letters = game.guessed_letters
+
     # Get current tier colors
-    current_tier = get_current_tier(level)
+    current_tier = get_current_tier(game.level)
     colors = TIER_COLORS[current_tier]
 
     # Base positions and sizes
-    x_start = WIDTH // 2 - (len(word.replace(" ", "")) * 45) // 2
+    columns, letters = word.columns, word.letters
+    x_start = WIDTH // 2 - (word.display_length * 45) // 2
     y_start = 150
     cell_size = 40
 
-    # Calculate how many letters to reveal based on progress
-    total_letters = len(word.replace(" ", ""))
-    # Adjust progress to ensure last letter is revealed
-    adjusted_progress = min(1.0, progress * 1.1)  # Multiply by 1.1 to ensure full reveal
-    letters_to_reveal = int(total_letters * adjusted_progress)
-    
-    # Draw the word's letters
-    for i, letter in enumerate(word):
-        if letter == " ":
-            x_start += cell_size + 5
+    dirty_rects = []
+    for cell in range(first_cell, last_cell):
+        letter = letters[cell]
+        if guessed_letters & LETTER_BITS.get(letter, 0):
             continue
 
-        rect_x = x_start + i * (cell_size + 5)
-        pygame.draw.rect(screen, colors["word_box"], (rect_x, y_start, cell_size, cell_size), border_radius=5)
-
-        # Reveal letters based on progress
-        if i < letters_to_reveal or letter in guessed_letters:
-            text_surface = LETTER_FONT.render(letter, True, colors["tier_text"])
-            text_rect = text_surface.get_rect(center=(rect_x + cell_size // 2, y_start + cell_size // 2))
-            screen.blit(text_surface, text_rect)
+        cell_rect = pygame.Rect(x_start + columns[cell] * (cell_size + 5), y_start, cell_size, cell_size)
+        pygame.draw.rect(screen, colors["word_box"], cell_rect, border_radius=5)
+        LETTER_GLYPHS.blit_centered(screen, letter, colors["tier_text"], cell_rect.center)
+        dirty_rects.append(cell_rect)
+    return dirty_rects
 
-def reveal_word_sequence(screen, word, guessed_letters):
-    """Run the word reveal animation sequence"""
+def reveal_word_sequence(screen, game, panel_on_screen=True):
+    """Run the word reveal animation sequence.
+    With panel_on_screen=False (after the timed-mode word flash) the panel with
+    the guessed letters is drawn first."""
     clock = pygame.time.Clock()
     start_time = time.time()
     duration = 1.0  # 1 second reveal animation
 
-    # Store the current state of the screen
-    screen_copy = screen.copy()
+    if not panel_on_screen:
+        display_regions.add(animate_word_panel(screen, game, None, 1.0))  # No animation type: the still panel
+        display_regions.flush()
+
+    # The panel is on screen, so each frame only draws the newly revealed boxes
+    total_letters = game.selected_word.display_length
+    revealed = 0
 
     while True:
         current_time = time.time()
@@ -1586,97 +1538,133 @@ def reveal_word_sequence(screen, word, guessed_letters):
         if progress >= 1.0:
             break
 
-        # Restore the screen state
-        screen.blit(screen_copy, (0, 0))
+        # Adjust progress to ensure last letter is revealed
+        adjusted_progress = min(1.0, progress * 1.1)  # Multiply by 1.1 to ensure full reveal
+        letters_to_reveal = int(total_letters * adjusted_progress)
+
+        if letters_to_reveal > revealed:
+            dirty_rects = reveal_word_animation(screen, game, revealed, letters_to_reveal)
+            revealed = letters_to_reveal
+            display_regions.extend(dirty_rects)
+            display_regions.flush()
 
-        # Draw the word reveal animation
-        reveal_word_animation(screen, word, guessed_letters, progress)
-        
-        pygame.display.flip()
         clock.tick(60)
 
-# Modify the play_spellout function to use the new animation behavior
-def play_spellout(uid_input, resumed=False):
-    global game_started, game_over, level_completed, difficulty_selected
-    global selected_word, shuffled_words, guessed_letters, attempts, level, game_mode, word_start_time
+# Function to draw the in-game screen (background, word, keyboard, attempts and levels)
+def draw_game_screen(game, keyboard):
+    """Redraw the whole game screen and return the areas whose content can have changed."""
+    screen.blit(get_background_color(game.level), (0, 0))
+    rects = [draw_word(game), draw_attempts(game), draw_levels(game)]
+    rects.extend(draw_virtual_keyboard(game, keyboard))
+    return rects
+
+# Function to move past the current word (solved or timed out) to the next level
+def next_level(game, solved):
+    # Check for tier completion before incrementing level
+    game.total_time_bonus += handle_word_completion(screen, game.level, game.game_mode, game.total_time_bonus)
+
+    game.level, game_complete = engine.advance_level(game.level)
+    if solved and game.game_mode == "timed":
+        game.correct_words += 1
+    game.guessed_letters = 0
+    game.attempts = MAX_ATTEMPTS
+
+    # Handle level 15 completion
+    if game_complete:
+        duration = time.time() - game.start_time
+        game.level_completed = True
+        update_player_record(game.player_uid, duration, game.correct_words if game.game_mode == "timed" else game.level - 1, game.game_mode)
+        show_last_record(game.player_uid)
+    else:  # Levels 1-15
+        game.selected_word = get_word_for_level(game)
+        game.word_start_time = time.time()
+
+# Function to handle a guessed letter (virtual keyboard click or key press)
+def handle_guess(game, keyboard, letter):
+    if game.evil_family is not None:
+        game.selected_word = evil_guess(game, letter)
+    outcome, game.guessed_letters, game.attempts = engine.apply_guess(game.selected_word.mask, game.guessed_letters, game.attempts, letter)
+
+    # Update the display immediately to show the key change
+    if outcome in (engine.CORRECT, engine.SOLVED):
+        # Only the boxes this letter fills and the keyboard changed
+        dirty_rects = draw_revealed_cells(game, letter)
+        dirty_rects.extend(draw_virtual_keyboard(game, keyboard))
+        display_regions.extend(dirty_rects)
+        display_regions.flush()
+    elif game.game_started and not (game.game_over or game.level_completed):
+        display_regions.extend(draw_game_screen(game, keyboard))
+        display_regions.flush()
+
+    # Process the guess
+    if outcome in (engine.CORRECT, engine.SOLVED):
+        correct_sound.play()
+        if outcome == engine.SOLVED:
+            # Update display one more time before animation
+            display_regions.extend(draw_game_screen(game, keyboard))
+            display_regions.flush()
+
+            animate_word_panel_sequence(screen, game, "pop")
+            pygame.time.delay(500)
+            next_level(game, solved=True)
+    else:
+        wrong_sound.play()
 
-    start_time = time.time()
-    total_time_bonus = 0  # Track accumulated time bonuses
-
-    if not resumed:
-        level = 1  # Start at level 1
-        guessed_letters = set()
-        attempts = 4
-        selected_word = None
-        game_started = False  # Changed to False to show mode selection first
-        difficulty_selected = True  # No manual difficulty selection needed
-        game_mode = None  # No default mode, player must choose
-        # Initialize shuffled_words as a dictionary
-        shuffled_words = {
-            "Easy": [],
-            "Normal": [],
-            "Hard": []
-        }
+        # Update display one more time before animation
+        display_regions.extend(draw_game_screen(game, keyboard))
+        display_regions.flush()
 
-    # Track correctly guessed words for timed mode
-    correct_words = 0
+        animate_word_panel_sequence(screen, game, "shake")
 
-    keys = create_virtual_keyboard()
+# Modify the play_spellout function to use the new animation behavior
+def play_spellout(uid_input, game=None):
+    """Run the game loop for a player; `game` is a resumed GameState (None starts a new game)."""
+    if game is None:
+        game = GameState(uid_input)  # Not started yet: shows mode selection first
+    game.player_uid = uid_input
+    game.seen_words = seen_words_file.get(uid_input)  # Skip words this player saw in recent games
+
+    keyboard = create_keyboard_layer()
     running = True
     player_name = uid_input
 
     while running:
         # Only use level-based background during active gameplay
-        if game_started and not (game_over or level_completed):
-            current_bg = get_background_color(level)
-            screen.blit(current_bg, (0, 0))
+        if game.game_started and not (game.game_over or game.level_completed):
+            screen.blit(get_background_color(game.level), (0, 0))
         else:
             screen.fill(WHITE)
 
-        if not game_started:
+        if not game.game_started:
             # Draw game mode selection screen
             button_rects = draw_game_controls(player_name, state='start')
-        elif game_over:
+        elif game.game_over:
             button_rects = draw_game_controls(player_name, state='over')
-        elif level_completed:
+        elif game.level_completed:
             button_rects = draw_game_controls(player_name, state='complete')
         else:
             button_rects = draw_game_controls(player_name, state='in_game')
-            draw_word(selected_word, guessed_letters)
-            draw_virtual_keyboard(keys, guessed_letters)
-            draw_attempts(attempts)
-            draw_levels(level)
-            
-            if game_mode == "timed":
-                if draw_timer():  # If time is up
-                    # Play game over sound
-                    game_over_sound.play()
-                    
-                    # Reveal the correct word with animation
-                    reveal_word_sequence(screen, selected_word['word'], guessed_letters)
-                    
-                    pygame.time.delay(1000)
-                    
-                    # Check for tier completion before incrementing level
-                    time_bonus = handle_word_completion(screen, level, game_mode, total_time_bonus)
-                    total_time_bonus += time_bonus
-                    
-                    level += 1
-                    guessed_letters.clear()
-                    attempts = 4
-                    
-                    # Handle level 15 completion
-                    if level > 15:  # After completing level 15
-                        end_time = time.time()
-                        duration = end_time - start_time
-                        level_completed = True
-                        update_player_record(uid_input, duration, correct_words, game_mode)
-                        show_last_record(uid_input)
-                    else:  # Levels 1-15
-                        selected_word = get_word_for_level(level)
-                        word_start_time = time.time()
-
-        pygame.display.flip()
+            draw_word(game)
+            draw_virtual_keyboard(game, keyboard)
+            draw_attempts(game)
+            draw_levels(game)
+
+            if game.game_mode == "timed" and draw_timer(game):  # If time is up
+                # Play game over sound
+                game_over_sound.play()
+
+                # Reveal the correct word with animation (the word flash cleared the screen)
+                reveal_word_sequence(screen, game, panel_on_screen=False)
+
+                pygame.time.delay(1000)
+                next_level(game, solved=False)
+
+        # Push the whole screen when the view changes (screen, level or word), else only what changed
+        word = game.selected_word
+        display_regions.enter(("game", game.game_started, game.game_over, game.level_completed, game.level,
+                               word.word if word else None, word.clue if word else None))
+        display_regions.extend(rect for rect in button_rects.values() if rect)  # Hover colors
+        display_regions.flush()
         pygame.time.delay(100)
 
         for event in pygame.event.get():
@@ -1686,32 +1674,22 @@ def play_spellout(uid_input, resumed=False):
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()
 
-                if not game_started:
-                    if button_rects["classic"].collidepoint(mouse_pos):
-                        game_started = True
-                        game_mode = "classic"
-                        selected_word = get_word_for_level(level)
-                        word_start_time = time.time()
-                        start_time = time.time()
-                    elif button_rects["timed"].collidepoint(mouse_pos):
-                        game_started = True
-                        game_mode = "timed"
-                        selected_word = get_word_for_level(level)
-                        word_start_time = time.time()
-                        start_time = time.time()
-
-                elif game_over or level_completed:
+                if not game.game_started:
+                    for mode in ("classic", "timed", "evil"):
+                        if button_rects[mode].collidepoint(mouse_pos):
+                            game.game_started = True
+                            game.game_mode = mode
+                            game.selected_word = get_word_for_level(game)
+                            game.word_start_time = time.time()
+                            game.start_time = time.time()
+                            break
+
+                elif game.game_over or game.level_completed:
                     if button_rects["classic"].collidepoint(mouse_pos):
-                        game_over = False
-                        level_completed = False
-                        level = 1
-                        guessed_letters.clear()
-                        attempts = 4
-                        correct_words = 0
-                        total_time_bonus = 0
-                        selected_word = get_word_for_level(level)
-                        word_start_time = time.time()
-                        start_time = time.time()
+                        game.game_over = False
+                        game.level_completed = False
+                        game.new_game()
+                        game.selected_word = get_word_for_level(game)
                     elif button_rects["quit"].collidepoint(mouse_pos):
                         pygame.quit()
                         sys.exit()
@@ -1720,185 +1698,36 @@ def play_spellout(uid_input, resumed=False):
                     elif button_rects["last_record"].collidepoint(mouse_pos):
                         show_last_record(uid_input)
 
-                elif not game_over:
-                    for letter, rect in keys.items():
-                        if rect.collidepoint(mouse_pos) and letter not in guessed_letters:
-                            guessed_letters.add(letter)
-                            
-                            # Update the display immediately to show the key change
-                            if game_started and not (game_over or level_completed):
-                                current_bg = get_background_color(level)
-                                screen.blit(current_bg, (0, 0))
-                                draw_word(selected_word, guessed_letters)
-                                draw_virtual_keyboard(keys, guessed_letters)
-                                draw_attempts(attempts)
-                                draw_levels(level)
-                                pygame.display.flip()
-                            
-                            # Process the guess
-                            if letter in selected_word['word']:
-                                correct_sound.play()
-                                if all(l in guessed_letters for l in selected_word['word']):
-                                    # Store current state for animation
-                                    current_guessed_letters = guessed_letters.copy()
-                                    
-                                    # Update display one more time before animation
-                                    current_bg = get_background_color(level)
-                                    screen.blit(current_bg, (0, 0))
-                                    draw_word(selected_word, current_guessed_letters)
-                                    draw_virtual_keyboard(keys, current_guessed_letters)
-                                    draw_attempts(attempts)
-                                    draw_levels(level)
-                                    pygame.display.flip()
-                                    
-                                    # Play animation with current state
-                                    animate_word_panel_sequence(screen, selected_word['word'], current_guessed_letters, "pop")
-                                    pygame.time.delay(500)
-                                    
-                                    # Now update game state
-                                    time_bonus = handle_word_completion(screen, level, game_mode, total_time_bonus)
-                                    total_time_bonus += time_bonus
-                                    
-                                    level += 1
-                                    if game_mode == "timed":
-                                        correct_words += 1
-                                    guessed_letters.clear()
-                                    attempts = 4
-                                    
-                                    # Handle level completion
-                                    if level > 15:  # After completing level 15
-                                        end_time = time.time()
-                                        duration = end_time - start_time
-                                        level_completed = True
-                                        update_player_record(uid_input, duration, correct_words if game_mode == "timed" else level - 1, game_mode)
-                                        show_last_record(uid_input)
-                                    else:  # Levels 1-15
-                                        selected_word = get_word_for_level(level)
-                                        word_start_time = time.time()
-                            else:
-                                attempts -= 1
-                                wrong_sound.play()
-                                
-                                # Store current state for animation
-                                current_guessed_letters = guessed_letters.copy()
-                                
-                                # Update display one more time before animation
-                                current_bg = get_background_color(level)
-                                screen.blit(current_bg, (0, 0))
-                                draw_word(selected_word, current_guessed_letters)
-                                draw_virtual_keyboard(keys, current_guessed_letters)
-                                draw_attempts(attempts)
-                                draw_levels(level)
-                                pygame.display.flip()
-                                
-                                # Play animation with current state
-                                animate_word_panel_sequence(screen, selected_word['word'], current_guessed_letters, "shake")
+                else:
+                    for letter, rect in keyboard.keys.items():
+                        if rect.collidepoint(mouse_pos) and not game.guessed_letters & LETTER_BITS[letter]:
+                            handle_guess(game, keyboard, letter)
 
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    pause_menu(uid_input, level, attempts, guessed_letters, selected_word, get_current_tier(level), shuffled_words)
+                    pause_menu(game)
                 else:
                     guess = event.unicode.upper()
-                    if guess in keys and guess not in guessed_letters:
-                        guessed_letters.add(guess)
-                        
-                        # Update the display immediately to show the key change
-                        if game_started and not (game_over or level_completed):
-                            current_bg = get_background_color(level)
-                            screen.blit(current_bg, (0, 0))
-                            draw_word(selected_word, guessed_letters)
-                            draw_virtual_keyboard(keys, guessed_letters)
-                            draw_attempts(attempts)
-                            draw_levels(level)
-                            pygame.display.flip()
-                        
-                        # Process the guess
-                        if guess in selected_word['word']:
-                            correct_sound.play()
-                            if all(l in guessed_letters for l in selected_word['word']):
-                                # Store current state for animation
-                                current_guessed_letters = guessed_letters.copy()
-                                
-                                # Update display one more time before animation
-                                current_bg = get_background_color(level)
-                                screen.blit(current_bg, (0, 0))
-                                draw_word(selected_word, current_guessed_letters)
-                                draw_virtual_keyboard(keys, current_guessed_letters)
-                                draw_attempts(attempts)
-                                draw_levels(level)
-                                pygame.display.flip()
-                                
-                                # Play animation with current state
-                                animate_word_panel_sequence(screen, selected_word['word'], current_guessed_letters, "pop")
-                                pygame.time.delay(500)
-                                
-                                # Now update game state
-                                time_bonus = handle_word_completion(screen, level, game_mode, total_time_bonus)
-                                total_time_bonus += time_bonus
-                                
-                                level += 1
-                                if game_mode == "timed":
-                                    correct_words += 1
-                                guessed_letters.clear()
-                                attempts = 4
-                                
-                                # Handle level completion
-                                if level > 15:  # After completing level 15
-                                    end_time = time.time()
-                                    duration = end_time - start_time
-                                    level_completed = True
-                                    update_player_record(uid_input, duration, correct_words if game_mode == "timed" else level - 1, game_mode)
-                                    show_last_record(uid_input)
-                                else:  # Levels 1-15
-                                    selected_word = get_word_for_level(level)
-                                    word_start_time = time.time()
-                        else:
-                            attempts -= 1
-                            wrong_sound.play()
-                            
-                            # Store current state for animation
-                            current_guessed_letters = guessed_letters.copy()
-                            
-                            # Update display one more time before animation
-                            current_bg = get_background_color(level)
-                            screen.blit(current_bg, (0, 0))
-                            draw_word(selected_word, current_guessed_letters)
-                            draw_virtual_keyboard(keys, current_guessed_letters)
-                            draw_attempts(attempts)
-                            draw_levels(level)
-                            pygame.display.flip()
-                            
-                            # Play animation with current state
-                            animate_word_panel_sequence(screen, selected_word['word'], current_guessed_letters, "shake")
+                    if guess in keyboard.keys and not game.guessed_letters & LETTER_BITS[guess]:
+                        handle_guess(game, keyboard, guess)
 
         # ❌ LOSS CHECK (outside event loop)
-        if not game_over and attempts == 0:
-            # Store current state for animation
-            current_guessed_letters = guessed_letters.copy()
-            
+        if not game.game_over and game.attempts == 0:
             # Update display one last time before game over
-            current_bg = get_background_color(level)
-            screen.blit(current_bg, (0, 0))
-            draw_word(selected_word, current_guessed_letters)
-            draw_virtual_keyboard(keys, current_guessed_letters)
-            draw_attempts(attempts)
-            draw_levels(level)
-            pygame.display.flip()
-            
+            display_regions.extend(draw_game_screen(game, keyboard))
+            display_regions.flush()
+
             # Play game over sound
             game_over_sound.play()
-            
-            # Shake animation with current state
-            animate_word_panel_sequence(screen, selected_word['word'], current_guessed_letters, "shake")
-            
-            # Reveal the correct word with animation
-            reveal_word_sequence(screen, selected_word['word'], current_guessed_letters)
-            
+
+            # Shake animation, then reveal the correct word
+            animate_word_panel_sequence(screen, game, "shake")
+            reveal_word_sequence(screen, game)
+
             pygame.time.delay(500)
-            game_over = True
-            end_time = time.time()
-            duration = end_time - start_time
-            update_player_record(uid_input, duration, correct_words if game_mode == "timed" else level, game_mode)
+            game.game_over = True
+            duration = time.time() - game.start_time
+            update_player_record(uid_input, duration, game.correct_words if game.game_mode == "timed" else game.level, game.game_mode)
             show_last_record(uid_input)
 
     pygame.quit()
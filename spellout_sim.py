@@ -0,0 +1,129 @@
+"""Monte Carlo simulator for the Spellout game.
+
+Plays many classic games with a guessing strategy from spellout_engine and
+reports per-tier and per-word win rates, average wrong guesses and how far
+games get. Work is split into chunks and spread over a process pool.
+
+Usage (from the repository root):
+    python spellout_sim.py --games 1000000 --strategy frequency
+"""
+import argparse  # Import argparse for the command line
+import os  # Import os for the CPU count
+import random  # Import random for seeded games
+import time  # Import time for timing the run
+from collections import Counter  # Import Counter for tallies
+from multiprocessing import Pool  # Import Pool to use every core
+
+import spellout_engine as engine  # Headless game rules
+from spellout_words import words_by_tier  # Word lists by tier
+
+CHUNK_SIZE = 5000  # Games per task handed to a worker
+
+
+# Function to play a chunk of games in a worker process
+def simulate_chunk(task):
+    """Play `games` games and return tallies that can be merged with other chunks."""
+    seed, games, strategy_name, max_attempts = task
+    rng = random.Random(seed)
+    strategy = engine.STRATEGIES[strategy_name]
+
+    word_plays = Counter()
+    word_wins = Counter()
+    word_wrong = Counter()
+    levels_completed = Counter()
+
+    for _ in range(games):
+        result = engine.play_game(strategy, rng, words_by_tier, max_attempts)
+        levels_completed[result["levels_completed"]] += 1
+        for level, word, solved, wrong_guesses in result["words"]:
+            word_plays[word] += 1
+            word_wrong[word] += wrong_guesses
+            if solved:
+                word_wins[word] += 1
+
+    return word_plays, word_wins, word_wrong, levels_completed
+
+# Function to run the whole simulation
+def run_simulation(games, strategy_name="frequency", workers=None, seed=0, max_attempts=engine.MAX_ATTEMPTS):
+    """Play `games` games over a process pool and return the merged tallies."""
+    if strategy_name not in engine.STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy_name}")
+    if games < 1:
+        raise ValueError(f"Need at least one game, got {games}")
+
+    tasks = []
+    remaining = games
+    chunk_index = 0
+    while remaining > 0:
+        chunk = min(CHUNK_SIZE, remaining)
+        tasks.append((seed * 1_000_003 + chunk_index, chunk, strategy_name, max_attempts))
+        remaining -= chunk
+        chunk_index += 1
+
+    totals = (Counter(), Counter(), Counter(), Counter())
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        results = map(simulate_chunk, tasks)
+        for result in results:
+            for total, part in zip(totals, result):
+                total.update(part)
+    else:
+        with Pool(workers) as pool:
+            for result in pool.imap_unordered(simulate_chunk, tasks):
+                for total, part in zip(totals, result):
+                    total.update(part)
+
+    return totals
+
+# Function to read a command-line count that must be at least 1
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+# Function to print the report
+def print_report(totals, games, elapsed):
+    word_plays, word_wins, word_wrong, levels_completed = totals
+
+    print(f"Played {games:,} games in {elapsed:.2f}s ({games / elapsed:,.0f} games/s)")
+
+    # Per tier
+    print("\nTier      Words played   Win rate   Avg wrong guesses")
+    for tier in engine.TIERS:
+        tier_words = [entry["word"] for entry in words_by_tier[tier]]
+        plays = sum(word_plays[word] for word in tier_words)
+        wins = sum(word_wins[word] for word in tier_words)
+        wrong = sum(word_wrong[word] for word in tier_words)
+        if plays:
+            print(f"{tier:<8} {plays:>13,}   {wins / plays:8.1%}   {wrong / plays:17.2f}")
+        else:
+            print(f"{tier:<8} {0:>13}        -                   -")
+
+    # Per word, hardest first
+    print("\nWord               Played   Win rate   Avg wrong guesses")
+    played_words = [word for word in word_plays if word_plays[word]]
+    for word in sorted(played_words, key=lambda w: word_wins[w] / word_plays[w]):
+        plays = word_plays[word]
+        print(f"{word:<15} {plays:>9,}   {word_wins[word] / plays:8.1%}   {word_wrong[word] / plays:17.2f}")
+
+    # Levels completed
+    print("\nLevels completed   Games      Share")
+    for completed in range(engine.FINAL_LEVEL + 1):
+        count = levels_completed[completed]
+        print(f"{completed:>16}   {count:>9,}   {count / games:6.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate Spellout games with a guessing strategy.")
+    parser.add_argument("--games", type=positive_int, default=100000, help="number of games to play")
+    parser.add_argument("--strategy", default="frequency", choices=sorted(engine.STRATEGIES), help="guessing strategy")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed")
+    parser.add_argument("--attempts", type=int, default=engine.MAX_ATTEMPTS, help="wrong guesses allowed per word")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    totals = run_simulation(args.games, args.strategy, args.workers, args.seed, args.attempts)
+    print_report(totals, args.games, time.perf_counter() - start)
@@ -0,0 +1,310 @@
+"""Precomputed best-guess decision trees for the Spellout word tiers.
+
+For every tier in words_by_tier the builder picks, at each step, the letter
+whose reveal pattern splits the remaining words with the highest entropy,
+and records the whole tree in a compact binary file under data/trees/.
+Bots then walk the tree instead of scoring letters live: the "tree"
+strategy in spellout_engine (TreeStrategy) plays with the trees of every
+tier and falls back to the solver when a word is in none of them.
+
+A tree file records a hash of its tier's word list and is rebuilt when the
+list changes. Build all tiers (using every core) with:
+    python spellout_tree.py
+"""
+import argparse  # Import argparse for the command line
+import hashlib  # Import hashlib for word-list hashes
+import math  # Import math for entropy
+import os  # Import os for file handling
+import struct  # Import struct for the binary format
+import time  # Import time for timing the build
+from multiprocessing import Pool  # Import Pool to use every core
+
+from letter_masks import ALPHABET, LETTER_BITS  # 26-bit letter masks
+from spellout_solver import SUGGESTION_ORDER, solver_strategy  # Tie-break order and fallback bot
+from spellout_words import words_by_tier  # Word lists by tier
+
+TREE_DIR = "data/trees"  # Where tree files are stored
+TREE_MAGIC = b"SPDT"
+TREE_VERSION = 2
+
+# File layout (little endian):
+#   header   magic, version, sha1 of the word list, word count, word blob size
+#   words    the tier's words joined with "\n" (word id = line number)
+#   roots    root count, then (word length, subtree offset, subtree size) per length
+#   subtrees one per word length; node offsets are relative to the subtree start
+# Nodes:
+#   leaf      0xFF, word id (u32)
+#   internal  letter index (u8), child count (u32), then (positions mask, child offset u32) per child,
+#             sorted by mask; a mask takes (word length + 7) // 8 bytes, so any word length fits
+_HEADER = struct.Struct("<4sH20sII")
+_ROOT_COUNT = struct.Struct("<H")
+_ROOT = struct.Struct("<HII")
+_LEAF = struct.Struct("<BI")
+_NODE = struct.Struct("<BI")
+_OFFSET = struct.Struct("<I")
+LEAF_MARK = 0xFF
+
+
+# Function to hash a word list for cache invalidation
+def words_hash(words):
+    return hashlib.sha1("\n".join(words).encode("utf-8")).digest()
+
+# Function to get where a letter sits in a word, as a bitmask of positions
+def letter_positions_mask(word, letter):
+    mask = 0
+    for i, char in enumerate(word):
+        if char == letter:
+            mask |= 1 << i
+    return mask
+
+# Function to pick the highest-entropy letter for a group of candidate word ids
+def best_split(words, word_ids, guessed):
+    best = None
+    best_entropy = 0.0
+    total = len(word_ids)
+    for letter in SUGGESTION_ORDER:
+        if guessed & LETTER_BITS[letter]:
+            continue
+        groups = {}
+        for word_id in word_ids:
+            groups.setdefault(letter_positions_mask(words[word_id], letter), []).append(word_id)
+        if len(groups) < 2:
+            continue  # Tells us nothing about which word it is
+        entropy = -sum(len(g) / total * math.log2(len(g) / total) for g in groups.values())
+        if entropy > best_entropy:
+            best, best_entropy = (letter, groups), entropy
+    return best
+
+# Function to get the bytes a positions mask takes for a word length
+def mask_size(length):
+    return (length + 7) // 8
+
+# Function to encode the tree for a group of word ids into `out`
+def encode_subtree(words, word_ids, guessed, out, mask_bytes):
+    """Append the node for word_ids to out and return its offset."""
+    offset = len(out)
+    split = best_split(words, word_ids, guessed) if len(word_ids) > 1 else None
+    if split is None:
+        out += _LEAF.pack(LEAF_MARK, word_ids[0])  # Only one word left (or duplicates)
+        return offset
+
+    letter, groups = split
+    out += _NODE.pack(ord(letter) - 65, len(groups))
+    child_size = mask_bytes + _OFFSET.size
+    children_at = len(out)
+    out += bytes(child_size * len(groups))  # Filled in once the children are written
+
+    for index, (positions, group) in enumerate(sorted(groups.items())):
+        child_offset = encode_subtree(words, group, guessed | LETTER_BITS[letter], out, mask_bytes)
+        at = children_at + index * child_size
+        out[at:at + mask_bytes] = positions.to_bytes(mask_bytes, "little")
+        _OFFSET.pack_into(out, at + mask_bytes, child_offset)
+    return offset
+
+# Function to build the subtree for one word length (runs in a worker)
+def build_length(task):
+    words, length = task
+    out = bytearray()
+    encode_subtree(words, [i for i, word in enumerate(words) if len(word) == length], 0, out, mask_size(length))
+    return length, bytes(out)
+
+# Function to count the nodes in a subtree
+def count_nodes(data, length, offset=0):
+    if data[offset] == LEAF_MARK:
+        return 1
+    letter, child_count = _NODE.unpack_from(data, offset)
+    mask_bytes = mask_size(length)
+    child_size = mask_bytes + _OFFSET.size
+    total = 1
+    for index in range(child_count):
+        (child,) = _OFFSET.unpack_from(data, offset + _NODE.size + index * child_size + mask_bytes)
+        total += count_nodes(data, length, child)
+    return total
+
+
+class DecisionTree:
+    """A loaded tree file; lookups read straight from the file bytes."""
+
+    def __init__(self, data):
+        self.data = data
+        magic, version, self.words_hash, word_count, blob_size = _HEADER.unpack_from(data, 0)
+        if magic != TREE_MAGIC or version != TREE_VERSION:
+            raise ValueError("Not a Spellout decision tree file")
+
+        offset = _HEADER.size
+        self.words = data[offset:offset + blob_size].decode("utf-8").split("\n")
+        offset += blob_size
+
+        (root_count,) = _ROOT_COUNT.unpack_from(data, offset)
+        offset += _ROOT_COUNT.size
+        self.roots = {}  # Word length -> subtree start
+        for _ in range(root_count):
+            length, start, size = _ROOT.unpack_from(data, offset)
+            self.roots[length] = start
+            offset += _ROOT.size
+
+    @classmethod
+    def load(cls, path, words=None):
+        """Load a tree file; returns None if it is missing, from another format version
+        or was built from other words."""
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version = struct.unpack_from("<4sH", data, 0) if len(data) >= _HEADER.size else (None, None)
+        if magic != TREE_MAGIC or version != TREE_VERSION:
+            return None
+        tree = cls(data)
+        if words is not None and tree.words_hash != words_hash(words):
+            return None
+        return tree
+
+    def suggest(self, pattern, guessed_letters):
+        """Walk the tree along the letters already guessed and return the next letter.
+        Returns None when the guesses left the tree (e.g. the word is not in this tier)."""
+        base = self.roots.get(len(pattern))
+        if base is None:
+            return None
+
+        data = self.data
+        mask_bytes = mask_size(len(pattern))
+        child_size = mask_bytes + _OFFSET.size
+        node = base
+        while data[node] != LEAF_MARK:
+            letter_index, child_count = _NODE.unpack_from(data, node)
+            letter = ALPHABET[letter_index]
+            if not guessed_letters & LETTER_BITS[letter]:
+                return letter
+
+            # Children are sorted by positions mask: binary search for the revealed one
+            positions = letter_positions_mask(pattern, letter)
+            children = node + _NODE.size
+            low, high = 0, child_count
+            while low < high:
+                middle = (low + high) // 2
+                at = children + middle * child_size
+                child_positions = int.from_bytes(data[at:at + mask_bytes], "little")
+                if child_positions < positions:
+                    low = middle + 1
+                elif child_positions > positions:
+                    high = middle
+                else:
+                    (child,) = _OFFSET.unpack_from(data, at + mask_bytes)
+                    node = base + child
+                    break
+            else:
+                return None
+
+        # Word identified: guess its remaining letters, unless it is not the word on screen
+        (_, word_id) = _LEAF.unpack_from(data, node)
+        word = self.words[word_id]
+        suggestion = None
+        for letter, shown in zip(word, pattern):
+            if shown != letter and (shown != "_" or guessed_letters & LETTER_BITS.get(letter, 0)):
+                return None
+            if suggestion is None and letter in LETTER_BITS and not guessed_letters & LETTER_BITS[letter]:
+                suggestion = letter
+        return suggestion
+
+
+# Function to get the tree file path for a tier
+def tree_path(tier):
+    return os.path.join(TREE_DIR, f"{tier.lower()}.tree")
+
+# Function to put a tier's words and subtrees together into a tree file
+def tree_bytes(words, subtrees):
+    """subtrees: (word length, subtree bytes) pairs from build_length."""
+    blob = "\n".join(words).encode("utf-8")
+    out = bytearray(_HEADER.pack(TREE_MAGIC, TREE_VERSION, words_hash(words), len(words), len(blob)))
+    out += blob
+    out += _ROOT_COUNT.pack(len(subtrees))
+    offset = len(out) + _ROOT.size * len(subtrees)
+    for length, subtree in subtrees:
+        out += _ROOT.pack(length, offset, len(subtree))
+        offset += len(subtree)
+    for length, subtree in subtrees:
+        out += subtree
+    return bytes(out)
+
+# Function to build one tier's tree in this process, without writing a file
+def build_tree(words):
+    return DecisionTree(tree_bytes(words, [build_length((words, length)) for length in sorted({len(word) for word in words})]))
+
+# Function to build tree files for every tier
+def build_trees(word_lists=words_by_tier, workers=None, force=False):
+    """Build (or reuse) a tree file per tier.
+    Returns (report, seconds): size details per tier and the time spent building."""
+    report = {}
+    elapsed = 0.0
+    pending = []
+    for tier, entries in word_lists.items():
+        words = [entry["word"] for entry in entries]
+        if not force and DecisionTree.load(tree_path(tier), words) is not None:
+            report[tier] = {"cached": True, "bytes": os.path.getsize(tree_path(tier))}
+            continue
+        pending.append((tier, words))
+
+    if pending:
+        tasks = [(words, length) for tier, words in pending for length in sorted({len(word) for word in words})]
+        start = time.perf_counter()
+        with Pool(workers or os.cpu_count() or 1) as pool:
+            subtrees = pool.map(build_length, tasks)
+        elapsed = time.perf_counter() - start
+
+        os.makedirs(TREE_DIR, exist_ok=True)
+        for tier, words in pending:
+            tier_subtrees = [subtree for (task_words, length), subtree in zip(tasks, subtrees) if task_words is words]
+            out = tree_bytes(words, tier_subtrees)
+            with open(tree_path(tier), "wb") as f:
+                f.write(out)
+
+            report[tier] = {
+                "cached": False,
+                "bytes": len(out),
+                "nodes": sum(count_nodes(subtree, length) for length, subtree in tier_subtrees),
+            }
+    return report, elapsed
+
+
+class TreeStrategy:
+    """The "tree" strategy for spellout_engine: walk the decision trees of every tier.
+    A strategy is not told the word's tier, so the tiers are tried in order; a tree
+    gives no letter once the revealed letters leave it, and the solver takes over
+    when the word is in no tree. Trees come from the tree files when they match the
+    word lists and are otherwise built in memory on first use."""
+
+    def __init__(self, word_lists=words_by_tier):
+        self.word_lists = word_lists
+        self.trees = None
+
+    def load(self):
+        self.trees = []
+        for tier, entries in self.word_lists.items():
+            words = [entry["word"] for entry in entries]
+            self.trees.append(DecisionTree.load(tree_path(tier), words) or build_tree(words))
+        return self.trees
+
+    def __call__(self, pattern, guessed_letters, rng):
+        for tree in self.trees or self.load():
+            letter = tree.suggest(pattern, guessed_letters)
+            if letter is not None:
+                return letter
+        return solver_strategy(pattern, guessed_letters, rng)
+
+
+tree_strategy = TreeStrategy()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute best-guess decision trees for each tier.")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the word lists did not change")
+    args = parser.parse_args()
+
+    report, elapsed = build_trees(workers=args.workers, force=args.force)
+    for tier, info in report.items():
+        if info["cached"]:
+            print(f"{tier}: up to date ({info['bytes']:,} bytes)")
+        else:
+            print(f"{tier}: {info['nodes']:,} nodes, {info['bytes']:,} bytes")
+    print(f"Build time: {elapsed:.2f}s")
@@ -0,0 +1,106 @@
+"""Word data for the Spellout game.
+
+Kept free of pygame so the rules engine, simulators and tools can load the
+word lists without opening a window.
+
+If a compiled word store exists at WORD_STORE_FILE it replaces the built-in
+lists and entries are read from it through mmap (see word_store.py).
+Otherwise a word pack at one of WORD_PACK_FILES is used; its tiers are
+streamed from disk on first use (see word_packs.py).
+"""
+import os  # Import os for file handling
+
+from word_packs import open_pack  # Streaming word-pack loader
+from word_store import WordStore  # Memory-mapped word store
+from word_record import make_words  # Word records with precomputed features
+
+WORD_STORE_FILE = "data/wordpack.store"  # Compiled pack, preferred when present
+# Word pack files checked at startup, first match wins
+WORD_PACK_FILES = ("data/wordpack.ndjson", "data/wordpack.csv", "data/wordpack.txt")
+
+# 📜 Word Lists by Tier with Clues
+words_by_tier = {
+    "Easy": [  # Levels 1-5
+        {"word": "HUMAN", "clue": "A bipedal primate species, known for its intelligence and ability to create complex tools."},
+        {"word": "EAGLE", "clue": "A large bird of prey, known for its keen eyesight and powerful flight."},
+        {"word": "PANTHER", "clue": "A big cat found in the Americas, known for its stealthy hunting skills."},
+        {"word": "CROCODILE", "clue": "A large reptile that lives in rivers and is known for its sharp teeth and strong jaws."},
+        {"word": "TORTOISE", "clue": "A slow-moving land reptile with a hard shell that protects its body."},
+        {"word": "SPIDER", "clue": "An arachnid with eight legs, known for spinning webs."},
+        {"word": "FROG", "clue": "An amphibian known for its jumping ability and croaking sound."},
+        {"word": "CAT", "clue": "A small domesticated carnivorous mammal with retractable claws."},
+        {"word": "BUTTERFLY", "clue": "A colorful insect with delicate wings that goes through metamorphosis."},
+        {"word": "HUSKY", "clue": "A strong, thick-coated dog breed known for pulling sleds in snowy regions."}
+    ],
+    "Normal": [  # Levels 6-10
+        {"word": "BLUE", "clue": "From the album *Blue* by Yung Kai"},
+        {"word": "ENCHANTED", "clue": "From the album *Speak Now* by Taylor Swift"},
+        {"word": "TREASURE", "clue": "From the album *Unorthodox Jukebox* by Bruno Mars"},
+        {"word": "PHOTOGRAPH", "clue": "From the album *x (Multiply)* by Ed Sheeran"},
+        {"word": "JUDAS", "clue": "From the album *Born This Way* by Lady Gaga"},
+        {"word": "ROAR", "clue": "From the album *Prism* by Katy Perry"},
+        {"word": "GRENADE", "clue": "From the album *Doo-Wops & Hooligans* by Bruno Mars"},
+        {"word": "CHANDELIER", "clue": "From the album *1000 Forms of Fear* by Sia"},
+        {"word": "HELLO", "clue": "From the album *25* by Adele"},
+        {"word": "PERFECT", "clue": "From the album *÷ (Divide)* by Ed Sheeran"},
+    ],
+    "Hard": [  # Levels 11-15
+        {"word": "EIFFEL", "clue": "Paris icon"},
+        {"word": "PYRAMID", "clue": "Egypt tomb"},
+        {"word": "COLOSSEUM", "clue": "Rome arena"},
+        {"word": "ACROPOLIS", "clue": "Greek hilltop"},
+        {"word": "SYDNEY", "clue": "Opera house"},
+        {"word": "STONEHENGE", "clue": "Ancient rocks"},
+        {"word": "PETRA", "clue": "Jordan ruins"},
+        {"word": "SPHINX", "clue": "Egypt guardian"},
+        {"word": "ANGKOR", "clue": "Cambodia temple"},
+        {"word": "ALHAMBRA", "clue": "Spanish palace"},
+        {"word": "RENAISSANCE", "clue": "Rebirth"},
+        {"word": "REVOLUTION", "clue": "Uprising"},
+        {"word": "IMPERIALISM", "clue": "Colonial"},
+        {"word": "GENOCIDE", "clue": "Massacre"},
+        {"word": "CRUSADE", "clue": "Holy"},
+        {"word": "FASCISM", "clue": "Dictator"},
+        {"word": "ARMISTICE", "clue": "Truce"},
+        {"word": "TREATY", "clue": "Agreement"},
+        {"word": "FEUDALISM", "clue": "Hierarchy"},
+        {"word": "ENLIGHTENMENT", "clue": "Reason"},
+    ]
+}
+
+# Word records, built once at load
+words_by_tier = {tier: make_words(entries, tier) for tier, entries in words_by_tier.items()}
+
+# 🏷️ Category Names per Tier
+category_by_tier = {
+    "Easy": "Animal Kingdom",
+    "Normal": "Song Titles",
+    "Hard": "World & History"
+}
+
+# Time limits for each tier (in seconds)
+time_limits = {
+    "Easy": 15,    # 15 seconds per word
+    "Normal": 30,  # 30 seconds per word
+    "Hard": 60     # 60 seconds per word
+}
+
+# 📦 Use an external word store or pack when one is installed
+# (a game tier the store or pack does not have keeps the built-in words)
+_builtin_tiers = set(words_by_tier)
+if os.path.exists(WORD_STORE_FILE):
+    word_store = WordStore(WORD_STORE_FILE)
+    _external_tiers = set(word_store.tiers)
+    words_by_tier = {**words_by_tier, **word_store.words_by_tier()}
+    category_by_tier = {**category_by_tier, **word_store.categories}
+else:
+    word_store = None
+    _external_tiers = _builtin_tiers
+    for _pack_path in WORD_PACK_FILES:
+        if os.path.exists(_pack_path):
+            words_by_tier, _pack_categories = open_pack(_pack_path, fallback=words_by_tier)
+            _external_tiers = set(words_by_tier.index["tiers"])
+            category_by_tier = {**category_by_tier, **_pack_categories}
+            break
+for _tier in sorted(_builtin_tiers - _external_tiers):
+    print(f"Word pack has no {_tier} tier; using the built-in {_tier} words.")
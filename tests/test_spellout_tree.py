@@ -0,0 +1,56 @@
+"""Decision trees for large tiers of long words (spellout_tree)."""
+import random  # Import random for the synthetic tier
+
+import spellout_tree
+from letter_masks import LETTER_BITS  # 26-bit letter masks
+from spellout_engine import reveal_pattern  # Game rules
+
+LETTERS = "EEEEEEEEEEEETTTTTTTTTAAAAAAAAOOOOOOOIIIIIIINNNNNNSSSSSSHHHHHRRRRRRDDDDLLLLCCCUUUMMWWFFGGYYPPBVK"
+
+
+# Function to make a tier of distinct random words of one length
+def make_words(count, length, seed=1):
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(LETTERS) for _ in range(length)))
+    return sorted(words)
+
+# Function to play a word by following a tree's suggestions
+def solve_with_tree(tree, word):
+    guessed_letters = 0
+    for _ in range(26):
+        pattern = reveal_pattern(word, guessed_letters)
+        if "_" not in pattern:
+            return True
+        letter = tree.suggest(pattern, guessed_letters)
+        assert letter is not None and not guessed_letters & LETTER_BITS[letter]
+        guessed_letters |= LETTER_BITS[letter]
+    return False
+
+
+def test_tree_for_thousands_of_long_words(tmp_path, monkeypatch):
+    monkeypatch.setattr(spellout_tree, "TREE_DIR", str(tmp_path))
+    words = make_words(3000, 12)
+    report, elapsed = spellout_tree.build_trees({"Hard": [{"word": word} for word in words]}, workers=1)
+    assert report["Hard"]["nodes"] > len(words)
+
+    tree = spellout_tree.DecisionTree.load(spellout_tree.tree_path("Hard"), words)
+    _, child_count = spellout_tree._NODE.unpack_from(tree.data, tree.roots[12])
+    assert child_count > 255  # More reply patterns than a one-byte count holds
+    assert all(solve_with_tree(tree, word) for word in words[::10])
+
+
+def test_tree_for_words_longer_than_64_letters():
+    words = make_words(40, 80)
+    tree = spellout_tree.build_tree(words)
+    assert all(solve_with_tree(tree, word) for word in words)
+
+
+def test_tree_strategy_leaves_a_tree_for_words_it_does_not_hold():
+    easy, hard = make_words(50, 6, seed=2), make_words(50, 6, seed=3)
+    strategy = spellout_tree.TreeStrategy({"Easy": [{"word": word} for word in easy], "Hard": [{"word": word} for word in hard]})
+    for word in hard[:10]:
+        guessed_letters = 0
+        while "_" in reveal_pattern(word, guessed_letters):
+            guessed_letters |= LETTER_BITS[strategy(reveal_pattern(word, guessed_letters), guessed_letters, random)]
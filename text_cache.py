@@ -0,0 +1,48 @@
+"""Cached text surfaces for the Spellout game.
+
+The menus, the leaderboard, the manual and the pause screen draw the same
+strings every frame ("CLASSIC MODE", "GAME PAUSED", tier labels, leaderboard
+rows). TextCache keeps each rendered string, keyed by (font, text, color,
+antialias), so it is rendered once and blitted from then on. The cache holds
+at most max_entries surfaces and drops the least recently used one first, so
+strings that change (a typed name, a clock) cannot make it grow without
+bound.
+
+Cached surfaces are shared: blit them, do not draw on them or change their
+alpha.
+"""
+from collections import OrderedDict  # Import OrderedDict for least-recently-used order
+
+
+class TextCache:
+    """Rendered strings, least recently used dropped first."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()  # (font, text, color, antialias) -> surface, oldest first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        """Like font.render(text, antialias, color), but each distinct string is rendered once."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, color)
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        """Surfaces currently cached."""
+        return len(self._surfaces)
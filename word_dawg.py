@@ -0,0 +1,269 @@
+"""Compressed word graph (DAWG) for dictionary queries.
+
+Words are stored as a minimal directed acyclic word graph: shared prefixes
+and shared suffixes are stored once. The graph is flattened into two arrays
+(a byte label and a 32-bit target per edge), so it saves and loads as raw
+bytes and needs no per-word Python objects.
+
+Queries walk the graph instead of scanning a list:
+    "CAT" in dawg                  membership
+    dawg.words(prefix="CRO")       prefix
+    dawg.words(length=5)           length
+    dawg.match("_A__E", excluded)  hangman pattern ("_" = a hidden letter)
+
+Compile a graph per tier into data/dawg/ with:
+    python word_dawg.py
+"""
+import os  # Import os for file handling
+import struct  # Import struct for the file header
+import sys  # Import sys for the byte order
+from array import array  # Import array for the flat edge arrays
+
+from letter_masks import LETTER_BITS  # 26-bit letter masks
+
+DAWG_DIR = "data/dawg"  # Where compiled graphs are stored
+DAWG_MAGIC = b"SPDG"
+DAWG_VERSION = 1
+HIDDEN = "_"
+
+# Edge target layout: bits 0-29 start of the child's edges, bit 30 child ends a word, bit 31 last edge of the node
+NO_EDGES = 0x3FFFFFFF  # Child has no outgoing edges
+FINAL_BIT = 1 << 30
+LAST_BIT = 1 << 31
+START_MASK = NO_EDGES
+
+# File layout (little endian): magic, version, edge count, root start, then labels (u8 each), then targets (u32 each)
+_HEADER = struct.Struct("<4sHII")
+
+
+class _BuildNode:
+    __slots__ = ("children", "final")
+
+    def __init__(self):
+        self.children = {}
+        self.final = False
+
+
+# Function to merge finished nodes with identical ones already seen
+def _minimize(unchecked, register, down_to):
+    while len(unchecked) > down_to:
+        parent, letter, child = unchecked.pop()
+        key = (child.final, tuple((label, id(node)) for label, node in child.children.items()))
+        existing = register.get(key)
+        if existing is not None:
+            parent.children[letter] = existing
+        else:
+            register[key] = child
+
+
+class WordDawg:
+    """A minimal word graph stored in flat arrays."""
+
+    def __init__(self, labels, targets, root):
+        self.labels = labels  # bytes: edge letter codes
+        self.targets = targets  # array("I"): child start and flags per edge
+        self.root = root  # Start of the root's edges
+
+    # Function to build a graph from any words
+    @classmethod
+    def build(cls, words):
+        """Build from words (uppercased; words with non-Latin-1 characters are skipped)."""
+        root = _BuildNode()
+        register = {}
+        unchecked = []  # (parent, letter, child) along the last word, not minimized yet
+        previous = ""
+
+        for word in sorted({word.upper() for word in words}):
+            try:
+                word.encode("latin-1")
+            except UnicodeEncodeError:
+                continue
+            common = 0
+            for a, b in zip(word, previous):
+                if a != b:
+                    break
+                common += 1
+            _minimize(unchecked, register, common)
+
+            node = unchecked[-1][2] if unchecked else root
+            for letter in word[common:]:
+                child = _BuildNode()
+                node.children[letter] = child
+                unchecked.append((node, letter, child))
+                node = child
+            node.final = True
+            previous = word
+        _minimize(unchecked, register, 0)
+
+        # Flatten: every distinct node with children gets a contiguous run of edges
+        labels = bytearray()
+        targets = array("I")
+        starts = {}
+        pending = [root]
+        order = []
+        while pending:
+            node = pending.pop()
+            if id(node) in starts or not node.children:
+                continue
+            starts[id(node)] = len(labels)
+            order.append(node)
+            for letter, child in node.children.items():
+                labels.append(ord(letter))
+                targets.append(0)
+                pending.append(child)
+        if len(labels) >= NO_EDGES:
+            raise ValueError("Too many edges for the DAWG format")
+
+        for node in order:
+            position = starts[id(node)]
+            last = position + len(node.children) - 1
+            for child in node.children.values():
+                target = starts.get(id(child), NO_EDGES)
+                if child.final:
+                    target |= FINAL_BIT
+                if position == last:
+                    target |= LAST_BIT
+                targets[position] = target
+                position += 1
+
+        return cls(bytes(labels), targets, starts.get(id(root), NO_EDGES))
+
+    # Function to load a graph saved with save()
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, edge_count, root = _HEADER.unpack_from(data, 0)
+        if magic != DAWG_MAGIC or version != DAWG_VERSION:
+            raise ValueError("Not a Spellout DAWG file")
+        labels_at = _HEADER.size
+        targets_at = labels_at + edge_count
+        targets = array("I")
+        targets.frombytes(data[targets_at:targets_at + edge_count * 4])
+        if sys.byteorder == "big":
+            targets.byteswap()
+        return cls(data[labels_at:targets_at], targets, root)
+
+    def save(self, path):
+        targets = array("I", self.targets)
+        if sys.byteorder == "big":
+            targets.byteswap()
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(DAWG_MAGIC, DAWG_VERSION, len(self.labels), self.root))
+            f.write(self.labels)
+            f.write(targets.tobytes())
+
+    @property
+    def nbytes(self):
+        """Size of the graph arrays in bytes."""
+        return len(self.labels) + self.targets.itemsize * len(self.targets)
+
+    def _edges(self, start):
+        """Yield (letter code, target) for the edges starting at `start`."""
+        labels = self.labels
+        targets = self.targets
+        while True:
+            target = targets[start]
+            yield labels[start], target
+            if target & LAST_BIT:
+                return
+            start += 1
+
+    def _follow(self, prefix):
+        """(start of edges after prefix, prefix is a word), or None if no word starts with prefix."""
+        labels = self.labels
+        targets = self.targets
+        start = self.root
+        final = False
+        for letter in prefix:
+            if start == NO_EDGES:
+                return None
+            code = ord(letter)
+            while True:
+                target = targets[start]
+                if labels[start] == code:
+                    break
+                if target & LAST_BIT:
+                    return None
+                start += 1
+            start = target & START_MASK
+            final = bool(target & FINAL_BIT)
+        return start, final
+
+    def __contains__(self, word):
+        found = self._follow(word.upper())
+        return found is not None and found[1]
+
+    def _walk(self, start, prefix, length):
+        """Yield every word below `start`; length limits the total word length."""
+        stack = [(start, prefix)]
+        while stack:
+            start, prefix = stack.pop()
+            if start == NO_EDGES or (length is not None and len(prefix) >= length):
+                continue
+            for label, target in self._edges(start):
+                word = prefix + chr(label)
+                if target & FINAL_BIT and (length is None or len(word) == length):
+                    yield word
+                stack.append((target & START_MASK, word))
+
+    def words(self, prefix="", length=None):
+        """Words starting with prefix, optionally only those of a given length."""
+        prefix = prefix.upper()
+        found = self._follow(prefix)
+        if found is None:
+            return
+        start, final = found
+        if final and prefix and (length is None or len(prefix) == length):
+            yield prefix
+        yield from self._walk(start, prefix, length)
+
+    def match(self, pattern, excluded=0):
+        """Words matching a pattern such as "_A__E".
+        A "_" matches any letter A-Z outside the `excluded` letter mask; other characters match themselves.
+        For hangman, pass the guessed letters as `excluded` so hidden cells cannot hold a revealed letter."""
+        pattern = pattern.upper()
+        length = len(pattern)
+        if not length:
+            return
+        allowed = [None if char != HIDDEN else
+                   bytes(code for code in range(65, 91) if not excluded & LETTER_BITS[chr(code)])
+                   for char in pattern]
+        stack = [(self.root, 0, "")]
+        while stack:
+            start, depth, prefix = stack.pop()
+            if start == NO_EDGES:
+                continue
+            letters = allowed[depth] or pattern[depth].encode("latin-1", "replace")
+            last_cell = depth == length - 1
+            for label, target in self._edges(start):
+                if label not in letters:
+                    continue
+                if last_cell:
+                    if target & FINAL_BIT:
+                        yield prefix + chr(label)
+                else:
+                    stack.append((target & START_MASK, depth + 1, prefix + chr(label)))
+
+
+# Function to get the graph file path for a tier
+def dawg_path(tier):
+    return os.path.join(DAWG_DIR, f"{tier.lower()}.dawg")
+
+# Function to compile a graph for every tier
+def build_tier_dawgs(word_lists):
+    """Build and save a graph per tier; returns {tier: (word count, bytes)}."""
+    os.makedirs(DAWG_DIR, exist_ok=True)
+    report = {}
+    for tier, entries in word_lists.items():
+        dawg = WordDawg.build(entry["word"] for entry in entries)
+        dawg.save(dawg_path(tier))
+        report[tier] = (len(entries), dawg.nbytes)
+    return report
+
+
+if __name__ == "__main__":
+    from spellout_words import words_by_tier  # Word lists by tier
+
+    for tier, (count, size) in build_tier_dawgs(words_by_tier).items():
+        print(f"{tier}: {count:,} words, {size:,} bytes -> {dawg_path(tier)}")
@@ -0,0 +1,241 @@
+"""Streaming loader for external Spellout word packs.
+
+A word pack is a file of entries with word, clue, tier and category fields,
+in one of three line-oriented formats:
+
+    .txt             WORD<TAB>clue<TAB>tier<TAB>category   (# starts a comment)
+    .csv             header row naming the columns, then one entry per line
+    .ndjson / .jsonl one JSON object per line
+
+Packs are parsed one line at a time and never held as one big list. The
+first scan writes a small index next to the pack (<pack>.index.json) with
+the entry count, category, byte range and panel-width counts of every tier,
+so later starts read only that index, and a tier's words are read the first
+time the tier is used and can be released again (see LazyTiers). The width
+counts let a tier be ordered by panel width while it is read, without a
+second pass (see spellout_engine.LengthIndex).
+"""
+import csv  # Import csv for CSV packs
+import json  # Import json for NDJSON packs and the index
+import os  # Import os for file handling
+from array import array  # Import array for the width order
+from collections.abc import MutableMapping  # Import MutableMapping for LazyTiers
+
+from word_record import Word, panel_cells  # Word records with precomputed features
+
+FIELDS = ("word", "clue", "tier", "category")
+GAME_TIERS = ("Easy", "Normal", "Hard")  # Tiers the game plays (spellout_engine.TIERS)
+DEFAULT_TIER = "Normal"  # Tier for entries that do not name one
+INDEX_SUFFIX = ".index.json"
+INDEX_VERSION = 3
+
+_tier_names = {tier.lower(): tier for tier in GAME_TIERS}
+
+
+# Function to spell a pack's tier name the way the game does
+def normalize_tier(name):
+    """"easy", " EASY " and "Easy" are all the game's Easy tier; other names are only stripped."""
+    name = name.strip()
+    return _tier_names.get(name.lower(), name)
+
+
+# Function to get a pack's format from its file name
+def pack_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".ndjson", ".jsonl"):
+        return "ndjson"
+    if extension == ".csv":
+        return "csv"
+    return "txt"
+
+# Function to turn one line into a (word, clue, tier, category) record
+def parse_line(line, fmt, columns=None):
+    """Return the record for a line, or None for blank and comment lines."""
+    if fmt == "ndjson":
+        if not line.strip():
+            return None
+        item = json.loads(line)
+        values = [item.get(field) or "" for field in FIELDS]
+    elif fmt == "csv":
+        if not line.strip():
+            return None
+        row = next(csv.reader([line]))
+        values = [row[index] if index is not None and index < len(row) else "" for index in columns]
+    else:
+        line = line.rstrip("\r\n")
+        if not line.strip() or line.lstrip().startswith("#"):
+            return None
+        values = line.split("\t")
+        values += [""] * (len(FIELDS) - len(values))
+
+    word = values[0].strip().upper()
+    if not word:
+        return None
+    return word, values[1].strip(), normalize_tier(values[2]) or DEFAULT_TIER, values[3].strip()
+
+# Function to read a CSV header into column positions for FIELDS
+def csv_columns(header_line):
+    header = [name.strip().lower() for name in next(csv.reader([header_line]))]
+    if "word" not in header:
+        raise ValueError("CSV word pack needs a header row with a 'word' column")
+    return [header.index(field) if field in header else None for field in FIELDS]
+
+# Function to stream the records of a pack with their byte offsets
+def scan_pack(path, start=None, end=None):
+    """Yield (offset, record) for every entry; start/end limit the byte range read."""
+    fmt = pack_format(path)
+    with open(path, "rb") as f:
+        columns = None
+        offset = 0
+        if fmt == "csv":
+            header = f.readline()
+            columns = csv_columns(header.decode("utf-8-sig"))
+            offset = len(header)
+        if start is not None and start > offset:
+            f.seek(start)
+            offset = start
+
+        for raw_line in f:
+            if end is not None and offset >= end:
+                break
+            line_offset = offset
+            offset += len(raw_line)
+            record = parse_line(raw_line.decode("utf-8-sig" if line_offset == 0 else "utf-8"), fmt, columns)
+            if record is not None:
+                yield line_offset, record
+
+# Function to stream the (word, clue, tier, category) records of a pack
+def iter_pack(path):
+    for offset, record in scan_pack(path):
+        yield record
+
+# Function to get the pack index, scanning the pack only if it changed
+def pack_index(path):
+    """Return {"tiers": {tier: {"count", "category", "start", "end", "widths"}}} for a pack,
+    where widths[n] is the number of the tier's words n panel cells wide.
+    The index is cached in <pack>.index.json and rebuilt when the pack's size or mtime changes."""
+    stat = os.stat(path)
+    index_path = path + INDEX_SUFFIX
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, "r") as f:
+                index = json.load(f)
+            if (index.get("version"), index.get("size"), index.get("mtime_ns")) == (INDEX_VERSION, stat.st_size, stat.st_mtime_ns):
+                return index
+        except (json.JSONDecodeError, OSError):
+            pass  # Rebuild a broken index
+
+    tiers = {}
+    for offset, (word, clue, tier, category) in scan_pack(path):
+        info = tiers.get(tier)
+        if info is None:
+            info = tiers[tier] = {"count": 0, "category": category, "start": offset, "end": offset, "widths": [0]}
+        info["count"] += 1
+        widths = info["widths"]
+        cells = panel_cells(word)
+        if cells >= len(widths):
+            widths.extend([0] * (cells + 1 - len(widths)))
+        widths[cells] += 1
+        info["end"] = offset + 1  # Read up to and including this entry's line
+        if not info["category"]:
+            info["category"] = category
+
+    index = {"version": INDEX_VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "tiers": tiers}
+    try:
+        with open(index_path, "w") as f:
+            json.dump(index, f)
+    except OSError:
+        pass  # Read-only pack location: the index is rebuilt next time
+    return index
+
+class TierWords(list):
+    """A tier's Word records as read from a pack, with their panel-width order."""
+
+    def __init__(self, words=(), order=None, fit_counts=None):
+        super().__init__(words)
+        self.order = order
+        self.fit_counts = fit_counts
+
+    def length_order(self):
+        """(order, fit_counts) filled in while the tier was read (see word_record.length_order)."""
+        if self.order is None:
+            return None
+        return self.order, self.fit_counts
+
+
+# Function to read one tier's words from a pack
+def read_tier(path, tier, index=None):
+    """Word records of one tier, reading only the tier's byte range.
+    The words are also placed in panel-width order as they are read, using the
+    width counts in the index (a counting sort, no second pass)."""
+    info = (index or pack_index(path))["tiers"].get(tier)
+    if info is None:
+        return TierWords()
+
+    # fit_counts[n] = words at most n cells wide; next_slot[n] = where the next n-wide word goes
+    fit_counts = [0]
+    for count in info["widths"][1:]:
+        fit_counts.append(fit_counts[-1] + count)
+    next_slot = [0] + fit_counts[:-1]
+    order = array("I", bytes(4 * info["count"]))
+
+    words = TierWords()
+    for offset, (word, clue, entry_tier, category) in scan_pack(path, info["start"], info["end"]):
+        if entry_tier == tier:
+            cells = panel_cells(word)
+            if order is not None and cells < len(next_slot) and next_slot[cells] < fit_counts[cells]:
+                order[next_slot[cells]] = len(words)
+                next_slot[cells] += 1
+            else:
+                order = None  # The pack changed since its index was written: let the engine measure
+            words.append(Word(word, clue, tier, len(words)))
+    if order is not None and len(words) == info["count"]:
+        words.order, words.fit_counts = order, fit_counts
+    return words
+
+
+class LazyTiers(MutableMapping):
+    """Tier name -> word list for a pack; a tier is read from disk the first time it is used.
+    Tiers the pack does not have come from `fallback` (a words_by_tier dict), if given."""
+
+    def __init__(self, path, index=None, fallback=None):
+        self.path = path
+        self.index = index or pack_index(path)
+        self._tiers = {tier: None for tier in self.index["tiers"]}  # None = not read yet
+        self.fallback = {tier: words for tier, words in (fallback or {}).items() if tier not in self._tiers}
+        self._tiers.update(self.fallback)
+
+    def __getitem__(self, tier):
+        words = self._tiers[tier]
+        if words is None:
+            words = self._tiers[tier] = read_tier(self.path, tier, self.index)
+        return words
+
+    def __setitem__(self, tier, words):
+        self._tiers[tier] = words
+
+    def __delitem__(self, tier):
+        del self._tiers[tier]
+
+    def __iter__(self):
+        return iter(self._tiers)
+
+    def __len__(self):
+        return len(self._tiers)
+
+    def is_loaded(self, tier):
+        return self._tiers.get(tier) is not None
+
+    def release(self, tier):
+        """Forget a tier's words; they are read again if the tier is used later."""
+        if tier in self._tiers and tier not in self.fallback:
+            self._tiers[tier] = None
+
+
+# Function to open a pack as (words_by_tier, category_by_tier)
+def open_pack(path, fallback=None):
+    """Read only the pack index now; tier words are loaded on first use.
+    Game tiers missing from the pack are taken from fallback (the built-in lists)."""
+    index = pack_index(path)
+    categories = {tier: info["category"] for tier, info in index["tiers"].items() if info["category"]}
+    return LazyTiers(path, index, fallback), categories
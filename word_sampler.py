@@ -0,0 +1,77 @@
+"""No-repeat word sampler with constant memory.
+
+Instead of copying and shuffling a word list every time it runs out, the
+sampler walks a keyed pseudo-random permutation of the list indices: a
+small Feistel network over the next power-of-four range, with cycle
+walking to stay inside the list. Every pass over the list visits each index
+exactly once; the next pass uses a new key derived from the seed, so the
+order changes like a reshuffle would. The whole state is (seed, cursor).
+"""
+ROUNDS = 4  # Feistel rounds per index
+MASK_64 = (1 << 64) - 1
+
+
+# Function to mix a 64-bit value (splitmix64 finalizer)
+def mix64(value):
+    value = (value + 0x9E3779B97F4A7C15) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+class WordSampler:
+    """Hands out indices 0..size-1 in a seeded random order without repeats.
+    After `size` draws a new pass starts in a different order."""
+
+    def __init__(self, size, seed, cursor=0):
+        self.size = size
+        self.seed = seed & MASK_64
+        self.cursor = cursor  # Total draws so far (pass = cursor // size)
+
+        # Split the index bits into two equal halves for the Feistel rounds
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._half_mask = (1 << self._half_bits) - 1
+        self._keys_pass = None
+        self._keys = ()
+
+    def __len__(self):
+        return self.size
+
+    def _round_keys(self, pass_number):
+        if pass_number != self._keys_pass:
+            key = mix64(self.seed ^ mix64(pass_number))
+            keys = []
+            for _ in range(ROUNDS):
+                key = mix64(key)
+                keys.append(key)
+            self._keys_pass, self._keys = pass_number, tuple(keys)
+        return self._keys
+
+    def _permute(self, index, keys):
+        half_bits = self._half_bits
+        half_mask = self._half_mask
+        value = index
+        while True:
+            left, right = value >> half_bits, value & half_mask
+            for key in keys:
+                mixed = ((right ^ key) * 0x9E3779B1) & 0xFFFFFFFFFFFF
+                left, right = right, left ^ ((mixed ^ (mixed >> 21)) & half_mask)
+            value = (left << half_bits) | right
+            if value < self.size:  # Cycle walking: re-encrypt until back inside the list
+                return value
+
+    def next(self):
+        """Index of the next word."""
+        if self.size <= 0:
+            raise IndexError("Cannot sample from an empty word list")
+        pass_number, position = divmod(self.cursor, self.size)
+        self.cursor += 1
+        return self._permute(position, self._round_keys(pass_number))
+
+    def remaining(self):
+        """Words left before the current pass starts over."""
+        return self.size - self.cursor % self.size if self.size else 0
+
+    def state(self):
+        """(seed, cursor): everything needed to rebuild the sampler for the same list."""
+        return self.seed, self.cursor
@@ -0,0 +1,232 @@
+"""Memory-mapped packed word store.
+
+A word pack (see word_packs.py) compiled into one binary file: a small tier
+table, a fixed-width offset array and a blob of UTF-8 "WORD<TAB>clue"
+records, grouped by tier, followed by each tier's words ordered by panel
+width (see word_record.length_order), worked out when the store is built.
+The file is opened with mmap and an entry is decoded only when it is used,
+so a million-word pack costs a few pages of resident memory instead of a
+million dicts, and filtering words by width never decodes the tier.
+
+Build a store from a pack with:
+    python word_store.py data/wordpack.ndjson data/wordpack.store
+"""
+import argparse  # Import argparse for the command line
+import mmap  # Import mmap for random access without loading the file
+import os  # Import os for file handling
+import struct  # Import struct for the binary format
+import sys  # Import sys for the byte order
+from array import array  # Import array for the offset table while building
+from collections.abc import Sequence  # Import Sequence for TierView
+
+from word_packs import normalize_tier, pack_index, scan_pack  # Streaming pack reader
+from word_record import Word, length_order, panel_cells  # Word records with precomputed features
+
+STORE_MAGIC = b"SPWS"
+STORE_VERSION = 2
+READABLE_VERSIONS = (1, 2)  # Version 1 stores have no width section
+
+# File layout (little endian):
+#   header   magic, version, tier count
+#   tiers    per tier: name length (u8), name, category length (u16), category, first id (u32), count (u32),
+#            and from version 2: widths offset (u64, from the start of the file), widest panel (u16)
+#   offsets  entry count (u32), then entry count + 1 record offsets (u64, from the start of the file)
+#   records  "WORD\tclue" in UTF-8, one after another
+#   widths   per tier, 4-byte aligned: fit counts (u32, widest panel + 1 of them), then the tier's
+#            positions ordered by panel width (u32, count of them)
+_HEADER = struct.Struct("<4sHH")
+_NAME_SIZE = struct.Struct("<B")
+_CATEGORY_SIZE = struct.Struct("<H")
+_TIER_RANGE = struct.Struct("<II")
+_TIER_WIDTHS = struct.Struct("<QH")
+_COUNT = struct.Struct("<I")
+_OFFSET = struct.Struct("<Q")
+_RECORD_RANGE = struct.Struct("<QQ")
+
+
+class TierView(Sequence):
+    """The entries of one tier, as a read-only list of Word records decoded on access."""
+
+    def __init__(self, store, name, first, count):
+        self.store = store
+        self.name = name
+        self.first = first
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("word index out of range")
+        word, clue = self.store.record(self.first + index)
+        return Word(word, clue, self.name, index)
+
+    def length_order(self):
+        """(order, fit_counts) stored with the tier, or None for a version 1 store."""
+        return self.store.length_order(self.name)
+
+
+class WordStore:
+    """A compiled word pack opened with mmap."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, tier_count = _HEADER.unpack_from(self.data, 0)
+        if magic != STORE_MAGIC or version not in READABLE_VERSIONS:
+            raise ValueError("Not a Spellout word store file")
+
+        offset = _HEADER.size
+        self.tiers = {}  # Tier -> (first id, count)
+        self.widths = {}  # Tier -> (widths offset, widest panel)
+        self.categories = {}
+        for _ in range(tier_count):
+            (name_size,) = _NAME_SIZE.unpack_from(self.data, offset)
+            offset += _NAME_SIZE.size
+            name = normalize_tier(self.data[offset:offset + name_size].decode("utf-8"))  # Stores built before names were normalized
+            offset += name_size
+            (category_size,) = _CATEGORY_SIZE.unpack_from(self.data, offset)
+            offset += _CATEGORY_SIZE.size
+            category = self.data[offset:offset + category_size].decode("utf-8")
+            offset += category_size
+            self.tiers[name] = _TIER_RANGE.unpack_from(self.data, offset)
+            offset += _TIER_RANGE.size
+            if version >= 2:
+                self.widths[name] = _TIER_WIDTHS.unpack_from(self.data, offset)
+                offset += _TIER_WIDTHS.size
+            if category:
+                self.categories[name] = category
+
+        (self.count,) = _COUNT.unpack_from(self.data, offset)
+        self._offsets_at = offset + _COUNT.size
+
+    def __len__(self):
+        return self.count
+
+    def record(self, word_id):
+        """(word, clue) for a word ID."""
+        start, end = _RECORD_RANGE.unpack_from(self.data, self._offsets_at + word_id * _OFFSET.size)
+        word, _, clue = self.data[start:end].decode("utf-8").partition("\t")
+        return word, clue
+
+    def length_order(self, tier):
+        """(order, fit_counts) for a tier, read from the widths section without decoding any record."""
+        if tier not in self.widths:
+            return None
+        offset, widest = self.widths[tier]
+        fit_counts = _read_u32(self.data, offset, widest + 1).tolist()
+        order = _read_u32(self.data, offset + 4 * (widest + 1), self.tiers[tier][1])
+        return order, fit_counts
+
+    def tier(self, tier):
+        first, count = self.tiers[tier]
+        return TierView(self, tier, first, count)
+
+    def words_by_tier(self):
+        """{tier: TierView} in the shape of spellout_words.words_by_tier."""
+        return {tier: self.tier(tier) for tier in self.tiers}
+
+    def close(self):
+        self.data.close()
+        self._file.close()
+
+
+# Function to read little-endian u32 values into an array
+def _read_u32(data, offset, count):
+    values = array("I")
+    values.frombytes(data[offset:offset + 4 * count])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+# Function to build the tier table, given each tier's widths section
+def _tier_table(tiers, widths):
+    table = bytearray()
+    first = 0
+    for tier, info in tiers.items():
+        name = tier.encode("utf-8")
+        category = (info["category"] or "").encode("utf-8")
+        table += _NAME_SIZE.pack(len(name)) + name
+        table += _CATEGORY_SIZE.pack(len(category)) + category
+        table += _TIER_RANGE.pack(first, info["count"])
+        table += _TIER_WIDTHS.pack(*widths.get(tier, (0, 0)))
+        first += info["count"]
+    return table
+
+# Function to compile a word pack into a store file
+def build_store(pack_path, store_path):
+    """Stream the pack tier by tier into store_path; returns the number of entries written."""
+    index = pack_index(pack_path)
+    tiers = index["tiers"]
+
+    first = sum(info["count"] for info in tiers.values())
+    header_size = _HEADER.size + len(_tier_table(tiers, {})) + _COUNT.size  # The table has a fixed size
+
+    # Records go to a temporary file first; only the offsets (8 bytes each) and
+    # the current tier's panel widths stay in memory
+    records_path = store_path + ".records"
+    offsets = array("Q")
+    tier_orders = {}  # Tier -> (order, fit_counts)
+    position = header_size + _OFFSET.size * (first + 1)  # Records start after the offset table
+    with open(records_path, "wb") as records:
+        for tier, info in tiers.items():
+            widths = array("H")
+            for offset, (word, clue, entry_tier, category) in scan_pack(pack_path, info["start"], info["end"]):
+                if entry_tier != tier:
+                    continue
+                record = f"{word}\t{clue}".encode("utf-8")
+                offsets.append(position)
+                records.write(record)
+                position += len(record)
+                widths.append(panel_cells(word))
+            tier_orders[tier] = length_order(widths)
+    offsets.append(position)
+    if len(offsets) != first + 1:
+        raise ValueError("Word pack changed while the store was being built")
+
+    # Widths section after the records, 4-byte aligned
+    padding = -position % 4
+    widths_at = {}
+    widths_section = array("I")
+    offset = position + padding
+    for tier, (order, fit_counts) in tier_orders.items():
+        widths_at[tier] = (offset, len(fit_counts) - 1)
+        widths_section.extend(fit_counts)
+        widths_section.extend(order)
+        offset += 4 * (len(fit_counts) + len(order))
+
+    if sys.byteorder == "big":
+        offsets.byteswap()  # The file is little endian
+        widths_section.byteswap()
+
+    with open(store_path, "wb") as out, open(records_path, "rb") as records:
+        out.write(_HEADER.pack(STORE_MAGIC, STORE_VERSION, len(tiers)))
+        out.write(_tier_table(tiers, widths_at))
+        out.write(_COUNT.pack(first))
+        offsets.tofile(out)
+        while True:
+            chunk = records.read(1 << 20)
+            if not chunk:
+                break
+            out.write(chunk)
+        out.write(bytes(padding))
+        widths_section.tofile(out)
+    os.remove(records_path)
+    return first
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile a word pack into a memory-mapped word store.")
+    parser.add_argument("pack", help="word pack (.txt, .csv, .ndjson)")
+    parser.add_argument("store", help="output store file")
+    args = parser.parse_args()
+
+    count = build_store(args.pack, args.store)
+    print(f"Wrote {count:,} entries to {args.store} ({os.path.getsize(args.store):,} bytes)")